@@ -0,0 +1,197 @@
+"""
+Benchmark the hot paths of playful.
+
+Every benchmark runs against synthetic fixtures at several input sizes, and records the
+best wall-clock time over a number of repeats plus the peak memory allocated during a
+separate, traced run. Results are written to a JSON file, which can be saved as a
+baseline and compared against later runs to flag regressions.
+
+Usage
+-----
+python -m benchmarks.run                         # run everything, write results.json
+python -m benchmarks.run --quick                 # the smallest size of each benchmark
+python -m benchmarks.run --filter lingo          # only benchmarks whose name matches
+python -m benchmarks.run --baseline base.json    # compare against a saved baseline
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+from time import perf_counter
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Set
+
+from playful.core import Point
+from playful.lingo import (
+    PatternMatrix,
+    best_splitting_word,
+    partitions,
+    potential_solutions,
+)
+from playful.minesweeper import ArrayBoard, Board
+
+
+class Benchmark(NamedTuple):
+    """A Benchmark prepares a fixture for an input size, then times a function of it."""
+
+    name: str
+    sizes: Sequence[int]
+    setup: Callable[[int], Any]
+    run: Callable[[Any], Any]
+
+
+def synthetic_words(size: int, length: int = 5, seed: int = 0) -> List[str]:
+    """Return a sorted list of a number of distinct random words."""
+    rng = random.Random(seed)
+    # weight letters roughly like English, so words share letters as real ones do.
+    letters = "eeeeaaaarrriiioootttnnnssslllcccuuddppmmhhggbbffyywkvxzjq"
+    words: Set[str] = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(letters) for _ in range(length)))
+    return sorted(words)
+
+
+def synthetic_board(side: int, seed: int = 0) -> Board:
+    """Return a square Board with about 15% of its Cells holding bombs."""
+    return Board.create(side, side, n_bombs=side * side * 15 // 100, random_state=seed)
+
+
+BENCHMARKS = [
+    Benchmark(
+        name="lingo.potential_solutions",
+        sizes=(1_000, 10_000, 100_000),
+        setup=synthetic_words,
+        run=lambda words: potential_solutions(words[0], words[-1], words),
+    ),
+    Benchmark(
+        name="lingo.partitions",
+        sizes=(1_000, 10_000, 100_000),
+        setup=synthetic_words,
+        run=lambda words: partitions(words[len(words) // 2], words),
+    ),
+    Benchmark(
+        name="lingo.best_splitting_word",
+        sizes=(1_000, 10_000),
+        setup=synthetic_words,
+        run=lambda words: best_splitting_word(words[:: len(words) // 5], words),
+    ),
+    Benchmark(
+        name="lingo.PatternMatrix",
+        sizes=(1_000, 10_000, 100_000),
+        setup=synthetic_words,
+        run=lambda words: PatternMatrix(
+            words[:: len(words) // 20], words
+        ).best_splitting_word(),
+    ),
+    Benchmark(
+        name="minesweeper.Board.create",
+        sizes=(10, 100, 500),
+        setup=lambda side: side,
+        run=synthetic_board,
+    ),
+    Benchmark(
+        name="minesweeper.ArrayBoard.create",
+        sizes=(10, 100, 1000, 2000),
+        setup=lambda side: side,
+        run=lambda side: ArrayBoard.create(side, side, side * side * 15 // 100, 0),
+    ),
+    Benchmark(
+        name="minesweeper.Board.visualize",
+        sizes=(10, 50, 100),
+        setup=synthetic_board,
+        run=lambda board: board.visualize(),
+    ),
+    Benchmark(
+        name="minesweeper.Cell.neighbors",
+        sizes=(10, 50, 100),
+        setup=synthetic_board,
+        run=lambda board: [c.neighbors(board.cells) for c in list(board.cells)[:10]],
+    ),
+    Benchmark(
+        name="core.Point.borders",
+        sizes=(1_000, 100_000),
+        setup=lambda n: [Point(i % 1000, i // 1000) for i in range(n)],
+        run=lambda points: [p.borders() for p in points],
+    ),
+]
+
+
+def measure(benchmark: Benchmark, size: int, repeat: int) -> Dict[str, Any]:
+    """Return the best time and the peak memory of a benchmark at one input size."""
+    fixture = benchmark.setup(size)
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        benchmark.run(fixture)
+        times.append(perf_counter() - start)
+
+    tracemalloc.start()
+    benchmark.run(fixture)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dict(name=benchmark.name, size=size, seconds=min(times), peak_bytes=peak)
+
+
+def compare(
+    results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], threshold: float
+) -> List[str]:
+    """Return a description of every result that regressed from the baseline."""
+    previous = {(r["name"], r["size"]): r for r in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get((result["name"], result["size"]))
+        if before is None:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            if result[metric] > before[metric] * (1 + threshold):
+                change = result[metric] / max(before[metric], 1e-12) - 1
+                regressions.append(
+                    f"{result['name']}[{result['size']}] {metric}: "
+                    f"{before[metric]:.6g} -> {result[metric]:.6g} ({change:+.0%})"
+                )
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the benchmarks from the command line, returning an exit code."""
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n", maxsplit=1)[0].strip()
+    )
+    parser.add_argument("--output", default="benchmarks/results.json")
+    parser.add_argument("--baseline", help="a results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--filter", default="", help="run matching benchmarks only")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--quick", action="store_true", help="smallest sizes only")
+    args = parser.parse_args(argv)
+
+    results = []
+    for benchmark in BENCHMARKS:
+        if args.filter not in benchmark.name:
+            continue
+        for size in benchmark.sizes[:1] if args.quick else benchmark.sizes:
+            result = measure(benchmark, size, args.repeat)
+            results.append(result)
+            print(
+                f"{result['name']:<32}{size:>10,}{result['seconds']:>12.6f}s"
+                f"{result['peak_bytes'] / 2 ** 20:>10.2f} MiB",
+                flush=True,
+            )
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        header = dict(python=sys.version.split()[0], platform=platform.platform())
+        json.dump(dict(header, results=results), file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,6 @@
 """Top-level imports."""
+from playful.core.grid import Grid
 from playful.core.point import Point
+from playful.core.point_array import PointArray
 
-__all__ = ("Point",)
+__all__ = ("Grid", "Point", "PointArray")
@@ -0,0 +1,121 @@
+"""
+A bounded grid of interned Points.
+
+Many Points with the same coordinates are created over and over when a game looks up
+the neighbors of its locations. A Grid creates each Point inside its bounds exactly
+once, and returns the neighbors of a Point as a cached tuple of those same Points,
+limited to the bounds of the Grid, so repeated lookups allocate nothing.
+"""
+from typing import Iterator, List, Optional, Tuple
+
+from playful.core.point import BORDERS, CORNERS, SIDES, Point
+from playful.core.profiling import count
+
+Neighbors = Tuple[Point, ...]
+
+
+def within(point: object, width: int, height: int) -> bool:
+    """
+    Return a boolean indicating if a point, given as any pair of coordinates, lies in
+    the rectangle from (0, 0) up to but excluding (width, height).
+    """
+    if not isinstance(point, tuple) or len(point) != 2:
+        return False
+    x, y = point
+    return bool(0 <= x < width and 0 <= y < height)
+
+
+class Grid:
+    """
+    A Grid is a rectangle of Points, from (0, 0) up to but excluding (width, height).
+
+    Point (x, y) has index `y * width + x`. Neighbor tuples are built the first time
+    they're requested for a Point, then cached for every later request.
+
+    Parameters
+    ----------
+    width : int, the width (x) dimension of the Grid
+    height : int, the height (y) dimension of the Grid
+
+    Examples
+    --------
+    >>> grid = Grid(width=3, height=2)
+    >>> grid.point(2, 1)
+    Point(x=2, y=1)
+    >>> grid.sides(Point(0, 0))
+    (Point(x=1, y=0), Point(x=0, y=1))
+    >>> grid.point(2, 1) is grid.sides(Point(2, 0))[1]
+    True
+    """
+
+    __slots__ = ("width", "height", "points", "_borders", "_corners", "_sides")
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.points = tuple(Point(x, y) for y in range(height) for x in range(width))
+        size = width * height
+        count("core.points", size)
+        self._borders: List[Optional[Neighbors]] = [None] * size
+        self._corners: List[Optional[Neighbors]] = [None] * size
+        self._sides: List[Optional[Neighbors]] = [None] * size
+
+    def __repr__(self) -> str:
+        """Return a string representation of this Grid."""
+        name = self.__class__.__qualname__
+        return f"{name}(width={self.width}, height={self.height})"
+
+    def __contains__(self, point: object) -> bool:
+        """Return a boolean indicating if a Point lies within this Grid."""
+        return within(point, self.width, self.height)
+
+    def __iter__(self) -> Iterator[Point]:
+        """Iterate over the Points of this Grid, row by row."""
+        return iter(self.points)
+
+    def __len__(self) -> int:
+        """Return the number of Points in this Grid."""
+        return len(self.points)
+
+    def index(self, point: Point) -> int:
+        """Return the index of a Point."""
+        if point not in self:
+            raise IndexError(f"{point} is outside of the grid")
+        return point.y * self.width + point.x
+
+    def point(self, x: int, y: int) -> Point:
+        """Return the interned Point at x and y coordinates."""
+        return self.points[self.index(Point(x, y))]
+
+    def borders(self, point: Point) -> Neighbors:
+        """Return a tuple of the Points in this Grid surrounding a Point."""
+        index = self.index(point)
+        neighbors = self._borders[index]
+        if neighbors is None:
+            neighbors = self._borders[index] = self._offset(point, BORDERS)
+        return neighbors
+
+    def corners(self, point: Point) -> Neighbors:
+        """Return a tuple of the Points in this Grid at the corners of a Point."""
+        index = self.index(point)
+        neighbors = self._corners[index]
+        if neighbors is None:
+            neighbors = self._corners[index] = self._offset(point, CORNERS)
+        return neighbors
+
+    def sides(self, point: Point) -> Neighbors:
+        """Return a tuple of the Points in this Grid at the sides of a Point."""
+        index = self.index(point)
+        neighbors = self._sides[index]
+        if neighbors is None:
+            neighbors = self._sides[index] = self._offset(point, SIDES)
+        return neighbors
+
+    def _offset(self, point: Point, offsets: Tuple[Tuple[int, int], ...]) -> Neighbors:
+        """Return the interned Points at offsets from a Point that lie in this Grid."""
+        width, height = self.width, self.height
+        return tuple(
+            self.points[(point.y + dy) * width + point.x + dx]
+            for dx, dy in offsets
+            if 0 <= point.x + dx < width and 0 <= point.y + dy < height
+        )
@@ -5,7 +5,29 @@ At the most basic level, a Point is an (x, y) pair of coordinates that defines a
 location. Usually this corresponds to a location on a game board, but the concept is
 abstract enough that it could generalize beyond a literal location if necessary.
 """
-from typing import NamedTuple, Optional, Set
+from typing import NamedTuple, Optional, Set, Tuple
+
+# (dx, dy) offsets from a Point to its neighbors in each direction.
+CORNERS: Tuple[Tuple[int, int], ...] = ((1, 1), (-1, 1), (-1, -1), (1, -1))
+SIDES: Tuple[Tuple[int, int], ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+BORDERS: Tuple[Tuple[int, int], ...] = CORNERS + SIDES
+
+# (a, b, c, d) coefficients that rotate an offset (dx, dy) to (a*dx + b*dy, c*dx + d*dy)
+ROTATIONS = {
+    0: (1, 0, 0, 1),
+    90: (0, 1, -1, 0),
+    180: (-1, 0, 0, -1),
+    270: (0, -1, 1, 0),
+}
+
+
+def rotation(degrees: int) -> Tuple[int, int, int, int]:
+    """Return the coefficients of a rotation, which must be a multiple of 90 degrees."""
+    # constrain degrees to 0, 90, 180, 270; otherwise raise an error
+    try:
+        return ROTATIONS[degrees % 360]
+    except KeyError:
+        raise ValueError("degrees must be a multiple of 90") from None
 
 
 class Point(NamedTuple):
@@ -21,37 +43,30 @@ class Point(NamedTuple):
 
     def borders(self) -> Set["Point"]:
         """Return a set of Points surrounding this Point in all directions."""
-        return self.corners().union(self.sides())
+        x, y = self.x, self.y
+        return {Point(x=x + dx, y=y + dy) for dx, dy in BORDERS}
 
     def corners(self) -> Set["Point"]:
         """Return a set of the corners surrounding this Point."""
-        return {
-            Point(x=self.x + 1, y=self.y + 1),
-            Point(x=self.x - 1, y=self.y + 1),
-            Point(x=self.x - 1, y=self.y - 1),
-            Point(x=self.x + 1, y=self.y - 1),
-        }
+        x, y = self.x, self.y
+        return {Point(x=x + dx, y=y + dy) for dx, dy in CORNERS}
 
     def sides(self) -> Set["Point"]:
         """Return a set of the sides surrounding this Point."""
-        return {
-            Point(x=self.x + 1, y=self.y),
-            Point(x=self.x - 1, y=self.y),
-            Point(x=self.x, y=self.y + 1),
-            Point(x=self.x, y=self.y - 1),
-        }
+        x, y = self.x, self.y
+        return {Point(x=x + dx, y=y + dy) for dx, dy in SIDES}
 
     def is_border(self, other: "Point") -> bool:
         """Return a boolean indicating if this Point is bordered by another Point."""
-        return other in self.borders()
+        return max(abs(other.x - self.x), abs(other.y - self.y)) == 1
 
     def is_corner(self, other: "Point") -> bool:
         """Return a boolean indicating if this Point is the corner of another Point."""
-        return other in self.corners()
+        return abs(other.x - self.x) == 1 and abs(other.y - self.y) == 1
 
     def is_side(self, other: "Point") -> bool:
         """Return a boolean indicating if this Point is the side of another Point."""
-        return other in self.sides()
+        return abs(other.x - self.x) + abs(other.y - self.y) == 1
 
     def reflect(self, x: Optional[int] = None, y: Optional[int] = None) -> "Point":
         """
@@ -75,9 +90,11 @@ class Point(NamedTuple):
         Point(x=8, y=-2)
         >>> Point(4, 4).reflect()
         Point(x=4, y=4)
+        >>> Point(4, 4).reflect(x=0)
+        Point(x=-4, y=4)
         """
-        x = x or self.x
-        y = y or self.y
+        x = self.x if x is None else x
+        y = self.y if y is None else y
         dx = x - self.x
         dy = y - self.y
         return Point(x=x + dx, y=y + dy)
@@ -110,15 +127,6 @@ class Point(NamedTuple):
         ...
         ValueError: degrees must be a multiple of 90
         """
-        # constrain degrees to 0, 90, 180, 270; otherwise raise an error
-        degrees = degrees % 360
-        if degrees not in [0, 90, 180, 270]:
-            raise ValueError("degrees must be a multiple of 90")
-
-        if degrees == 0:
-            return Point(x=self.x, y=self.y)
-
-        # recursively rotate 90 degrees at a time until we reach our goal
+        a, b, c, d = rotation(degrees)  # pylint: disable=invalid-name
         dx, dy = self.x - around.x, self.y - around.y
-        x, y = around.x + dy, around.y - dx
-        return Point(x=x, y=y).rotate(around=around, degrees=degrees - 90)
+        return Point(x=around.x + a * dx + b * dy, y=around.y + c * dx + d * dy)
@@ -0,0 +1,118 @@
+"""
+Arrays of Points that are transformed all at once.
+
+Rotating or reflecting a shape one Point at a time creates a new Point object for every
+Point, every time. A PointArray stores the x and y coordinates of many Points in two
+compact integer arrays instead, and each transformation is a single pass over those
+arrays that produces a new PointArray, without creating any Point objects at all.
+"""
+from array import array
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+from playful.core.point import BORDERS, Point, rotation
+
+
+class PointArray:
+    """
+    A PointArray is a sequence of Points, stored as arrays of x and y coordinates.
+
+    Transformations match the methods of Point, applied to every Point in the array.
+
+    Parameters
+    ----------
+    xs : Iterable[int], the x coordinates of the Points
+    ys : Iterable[int], the y coordinates of the Points
+
+    Examples
+    --------
+    >>> shape = PointArray.from_points([Point(0, 0), Point(1, 0), Point(1, 1)])
+    >>> shape.rotate(around=Point(0, 0), degrees=90).to_points()
+    [Point(x=0, y=0), Point(x=0, y=-1), Point(x=1, y=-1)]
+    >>> shape.translate(dx=2, dy=3).to_points()
+    [Point(x=2, y=3), Point(x=3, y=3), Point(x=3, y=4)]
+    """
+
+    __slots__ = ("xs", "ys")
+
+    def __init__(self, xs: Iterable[int] = (), ys: Iterable[int] = ()) -> None:
+        self.xs = array("q", xs)  # pylint: disable=invalid-name
+        self.ys = array("q", ys)  # pylint: disable=invalid-name
+        if len(self.xs) != len(self.ys):
+            raise ValueError("xs and ys must have the same length")
+
+    @classmethod
+    def from_points(cls, points: Iterable[Point]) -> "PointArray":
+        """Create a PointArray from a collection of Points."""
+        points = list(points)
+        return cls((p[0] for p in points), (p[1] for p in points))
+
+    def to_points(self) -> List[Point]:
+        """Return a list of the Points in this PointArray."""
+        return list(map(Point, self.xs, self.ys))
+
+    def __repr__(self) -> str:
+        """Return a string representation of this PointArray."""
+        return f"{self.__class__.__qualname__}({self.to_points()})"
+
+    def __len__(self) -> int:
+        """Return the number of Points in this PointArray."""
+        return len(self.xs)
+
+    def __getitem__(self, index: int) -> Point:
+        """Return the Point at an index."""
+        return Point(self.xs[index], self.ys[index])
+
+    def __iter__(self) -> Iterator[Point]:
+        """Iterate over the Points in this PointArray."""
+        return map(Point, self.xs, self.ys)
+
+    def __eq__(self, other: object) -> bool:
+        """Return a boolean indicating if two PointArrays hold the same Points."""
+        if not isinstance(other, PointArray):
+            return NotImplemented
+        return self.xs == other.xs and self.ys == other.ys
+
+    def translate(self, dx: int = 0, dy: int = 0) -> "PointArray":
+        """Return a new PointArray by moving every Point by dx and dy."""
+        return self.__class__([x + dx for x in self.xs], [y + dy for y in self.ys])
+
+    def reflect(self, x: Optional[int] = None, y: Optional[int] = None) -> "PointArray":
+        """
+        Return a new PointArray by reflecting every Point over x and/or y lines.
+
+        If x or y is None, then the Points won't be reflected over those axes.
+        """
+        new_xs = self.xs if x is None else [2 * x - px for px in self.xs]
+        new_ys = self.ys if y is None else [2 * y - py for py in self.ys]
+        return self.__class__(new_xs, new_ys)
+
+    def rotate(self, around: Point, degrees: int) -> "PointArray":
+        """
+        Return a new PointArray by rotating every Point around another Point.
+
+        Parameters
+        ----------
+        around : Point, the point around which to rotate
+        degrees : int, the number of degrees to rotate. Must be a multiple of 90.
+        """
+        a, b, c, d = rotation(degrees)  # pylint: disable=invalid-name
+        center_x, center_y = around
+        offsets = list(
+            zip([x - center_x for x in self.xs], [y - center_y for y in self.ys])
+        )
+        return self.__class__(
+            [center_x + a * dx + b * dy for dx, dy in offsets],
+            [center_y + c * dx + d * dy for dx, dy in offsets],
+        )
+
+    def borders(self) -> "PointArray":
+        """
+        Return a new PointArray of every Point that borders a Point in this array.
+
+        This is the union of `Point.borders` for every Point, in sorted order.
+        """
+        neighbors: Set[Tuple[int, int]] = {
+            (x + dx, y + dy) for x, y in zip(self.xs, self.ys) for dx, dy in BORDERS
+        }
+        ordered = sorted(neighbors)
+        return self.__class__([x for x, _ in ordered], [y for _, y in ordered])
@@ -0,0 +1,142 @@
+"""
+Opt-in profiling of playful's hot paths.
+
+Functions decorated with `profiled` record how many times they're called and their
+cumulative time, and `count` adds to named counters, such as the number of Points
+created or candidate words kept. Everything is recorded into one module-level registry,
+which can be read with `stats` and `counters`, and cleared with `reset`.
+
+Profiling is off by default. Set the environment variable `PLAYFUL_PROFILE=1` to turn
+it on for a whole process, or use the `profiling` context manager for a block of code.
+While it's off, a profiled function only checks one flag before calling through, and
+`count` returns immediately. Per-point primitives, such as `Point.borders`, aren't
+profiled because they're called millions of times; the boards and solvers that call
+them are profiled instead.
+
+Examples
+--------
+>>> from playful.minesweeper import Board
+>>> with profiling():
+...     _ = Board.create(width=3, height=2, n_bombs=1, random_state=0)
+>>> stats()["minesweeper.Board.create"].calls
+1
+>>> counters()["core.points"]
+6
+>>> reset()
+"""
+from contextlib import contextmanager
+from functools import wraps
+import os
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, NamedTuple, TypeVar, cast
+
+Function = TypeVar("Function", bound=Callable[..., Any])
+
+
+class Stats(NamedTuple):
+    """Stats hold the number of calls to a profiled function and its total seconds."""
+
+    calls: int
+    seconds: float
+
+
+_enabled = os.environ.get("PLAYFUL_PROFILE", "") not in ("", "0")
+_lock = Lock()
+_stats: Dict[str, Stats] = {}
+_counters: Dict[str, int] = {}
+
+
+def enabled() -> bool:
+    """Return a boolean indicating if profiling is turned on."""
+    return _enabled
+
+
+def enable() -> None:
+    """Turn profiling on."""
+    global _enabled  # pylint: disable=global-statement,invalid-name
+    _enabled = True
+
+
+def disable() -> None:
+    """Turn profiling off. What has been recorded so far is kept."""
+    global _enabled  # pylint: disable=global-statement,invalid-name
+    _enabled = False
+
+
+@contextmanager
+def profiling() -> Iterator[None]:
+    """
+    Turn profiling on for a block of code, then restore its previous setting.
+
+    The setting is one flag shared by the whole process, not just the calling thread,
+    so other threads are profiled while the block runs, and overlapping blocks in
+    different threads can turn profiling off while one of them is still running.
+    """
+    global _enabled  # pylint: disable=global-statement,invalid-name
+    previous, _enabled = _enabled, True
+    try:
+        yield
+    finally:
+        _enabled = previous
+
+
+def profiled(name: str) -> Callable[[Function], Function]:
+    """Return a decorator that records the calls and time of a function under a name."""
+
+    def decorator(func: Function) -> Function:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                seconds = perf_counter() - start
+                with _lock:
+                    calls, total = _stats.get(name, (0, 0.0))
+                    _stats[name] = Stats(calls + 1, total + seconds)
+
+        return cast(Function, wrapper)
+
+    return decorator
+
+
+def count(name: str, amount: int = 1) -> None:
+    """Add an amount to a named counter, if profiling is turned on."""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def stats() -> Dict[str, Stats]:
+    """Return a copy of the calls and cumulative time of each profiled function."""
+    with _lock:
+        return dict(_stats)
+
+
+def counters() -> Dict[str, int]:
+    """Return a copy of the value of each counter."""
+    with _lock:
+        return dict(_counters)
+
+
+def reset() -> None:
+    """Clear everything that has been recorded."""
+    with _lock:
+        _stats.clear()
+        _counters.clear()
+
+
+def report() -> str:
+    """Return a table of the profiled functions, slowest first, and the counters."""
+    lines = [f"{'function':<40}{'calls':>10}{'seconds':>12}"]
+    ordered = sorted(stats().items(), key=lambda item: item[1].seconds, reverse=True)
+    for name, (calls, seconds) in ordered:
+        lines.append(f"{name:<40}{calls:>10,}{seconds:>12.6f}")
+    lines.append(f"{'counter':<40}{'value':>10}")
+    for name, value in sorted(counters().items()):
+        lines.append(f"{name:<40}{value:>10,}")
+    return "\n".join(lines)
@@ -0,0 +1,63 @@
+"""
+Functions to play the word guessing game from the Lingo game show
+https://en.wikipedia.org/wiki/Lingo_(American_game_show)
+"""
+from playful.lingo.batch import Feedback, batch_feedback, decode_feedback, encode_words
+from playful.lingo.cache import PartitionCache
+from playful.lingo.constraint import Constraint, letter_counts
+from playful.lingo.game import (
+    best_splitting_word,
+    compile_constraint,
+    correct_letters,
+    excluded_letters,
+    has_correct_letters,
+    has_excluded_letters,
+    has_misplaced_letters,
+    is_potential_solution,
+    misplaced_letters,
+    packed_partitions,
+    partitions,
+    potential_solutions,
+)
+from playful.lingo.packed import PackedWords, pack_words, write_packed
+from playful.lingo.parallel import ParallelSplitter
+from playful.lingo.pattern import (
+    PatternMatrix,
+    feedback_pattern,
+    pattern_digits,
+    pattern_feedback,
+)
+from playful.lingo.session import LingoSession
+from playful.lingo.tree import DecisionTree
+
+__all__ = (
+    "Constraint",
+    "DecisionTree",
+    "Feedback",
+    "LingoSession",
+    "PackedWords",
+    "ParallelSplitter",
+    "PartitionCache",
+    "PatternMatrix",
+    "batch_feedback",
+    "best_splitting_word",
+    "compile_constraint",
+    "correct_letters",
+    "decode_feedback",
+    "encode_words",
+    "excluded_letters",
+    "feedback_pattern",
+    "has_correct_letters",
+    "has_excluded_letters",
+    "has_misplaced_letters",
+    "is_potential_solution",
+    "letter_counts",
+    "misplaced_letters",
+    "pack_words",
+    "packed_partitions",
+    "partitions",
+    "pattern_digits",
+    "pattern_feedback",
+    "potential_solutions",
+    "write_packed",
+)
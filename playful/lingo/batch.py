@@ -0,0 +1,197 @@
+"""
+Score guesses for many Lingo games at once.
+
+Secrets and guesses are encoded as flat buffers of one byte per letter, with every
+word the same length, so the pair at index k occupies bytes k * length up to
+(k + 1) * length of each buffer. Feedback for every pair is returned as three buffers
+of the same shape:
+
+* correct : the letter code where the guess letter equals the secret letter, else 0.
+* misplaced : the letter code where a guess letter is in the secret word but
+  misplaced, else 0.
+* excluded : at the first position of each excluded guess letter, one more than the
+  number of times the letter occurs in the secret word, else 0. This is the length of
+  the `letter * (occurrences + 1)` string that `excluded_letters` returns.
+
+Nothing is computed one word at a time. Each buffer is read as a single large integer
+with one byte per lane, and every step is a handful of integer operations that act on
+all lanes at once: the XOR of secrets and guesses is zero exactly where letters match,
+and the duplicate letter rules are applied one distinct guess letter at a time, using
+per-word sums and running counts of that letter computed with shifts and additions.
+"""
+from typing import Any, Iterable, NamedTuple, Tuple
+
+
+class Feedback(NamedTuple):
+    """The correct, misplaced and excluded feedback of a batch, one byte per letter."""
+
+    correct: bytearray
+    misplaced: bytearray
+    excluded: bytearray
+
+
+def encode_words(words: Iterable[str]) -> bytes:
+    """
+    Return words encoded as a flat buffer with one byte per letter.
+
+    Each letter is encoded as its code point, which must be between 1 and 255.
+    """
+    data = "".join(words).encode("latin-1")
+    if 0 in data:
+        raise ValueError("words may not contain the letter code 0")
+    return data
+
+
+class Lanes:  # pylint: disable=too-many-instance-attributes
+    """
+    Byte-wise arithmetic on buffers of fixed-length words, read as large integers.
+
+    Every byte of a buffer is a separate lane, and every operation applies to all lanes
+    at once. Lanes hold values below 128, so sums and comparisons never carry or
+    borrow into the next lane.
+
+    Parameters
+    ----------
+    size : int, the number of bytes in each buffer
+    length : int, the number of bytes in each word
+    """
+
+    def __init__(self, size: int, length: int) -> None:
+        self.size = size
+        self.length = length
+        self.ones = self.repeat(0x01)
+        self.low = self.repeat(0x7F)
+        self.high = self.repeat(0x80)
+        words = size // length
+        # 1 (or 0xFF) in the first lane of each word, 1 in every lane of a single word,
+        # and 0xFF in the lanes that are at least d lanes into a word.
+        self.starts = int.from_bytes((b"\x01" + bytes(length - 1)) * words, "little")
+        self.first = self.starts * 0xFF
+        self.word = int.from_bytes(b"\x01" * length, "little")
+        self.after = [
+            int.from_bytes((bytes(d) + b"\xff" * (length - d)) * words, "little")
+            for d in range(length)
+        ]
+
+    def repeat(self, byte: int) -> int:
+        """Return a buffer with the same byte in every lane."""
+        return int.from_bytes(bytes([byte]) * self.size, "little")
+
+    @staticmethod
+    def read(buffer: bytes) -> int:
+        """Return a buffer as an integer."""
+        return int.from_bytes(buffer, "little")
+
+    def write(self, lanes: int) -> bytearray:
+        """Return the lanes of an integer as a buffer."""
+        return bytearray(lanes.to_bytes(self.size, "little"))
+
+    def is_zero(self, lanes: int) -> int:
+        """Return 1 in each lane that is zero, else 0."""
+        # the high bit of (lane & 0x7f) + 0x7f is set for any non-zero low seven bits.
+        return (~(((lanes & self.low) + self.low) | lanes) & self.high) >> 7
+
+    def greater(self, left: int, right: int) -> int:
+        """Return 1 in each lane where left is greater than right, else 0."""
+        return (((left | self.high) - (right + self.ones)) & self.high) >> 7
+
+    def word_sums(self, lanes: int) -> int:
+        """Return the sum of each word's lanes, in the first lane of the word."""
+        # multiplying by `word` adds each lane to the next length - 1 lanes, so the
+        # last lane of each word holds the sum of the whole word.
+        return (lanes * self.word) >> 8 * (self.length - 1) & self.first
+
+    def spread(self, lanes: int) -> int:
+        """Return the first lane of each word copied into every lane of the word."""
+        return (lanes & self.first) * self.word
+
+    def preceding(self, lanes: int) -> int:
+        """Return the sum of the earlier lanes of the same word, in each lane."""
+        total = 0
+        for shift in range(1, self.length):
+            total += (lanes << 8 * shift) & self.after[shift]
+        return total
+
+
+def batch_feedback(secrets: Any, guesses: Any, length: int) -> Feedback:
+    """
+    Return the feedback of every guess against its secret word.
+
+    Parameters
+    ----------
+    secrets : a bytes-like object of secret words, as returned by `encode_words`
+    guesses : a bytes-like object of guesses, the same size as the secrets
+    length : int, the number of letters in every word, no more than 127
+
+    Examples
+    --------
+    >>> feedback = batch_feedback(
+    ...     encode_words(["array", "mamma"]), encode_words(["rarer", "madam"]), 5
+    ... )
+    >>> decode_feedback(feedback, encode_words(["rarer", "madam"]), 5, index=0)
+    (('', '', 'r', '', ''), ('r', 'a', '', '', ''), ('e', 'rrr'))
+    """
+    secrets, guesses = bytes(secrets), bytes(guesses)
+    if len(secrets) != len(guesses):
+        raise ValueError("secrets and guesses must have the same size")
+    if not 0 < length < 128 or len(secrets) % length:
+        raise ValueError("the size of the buffers must be a multiple of length")
+
+    lanes = Lanes(len(secrets), length)
+    secret, guess = lanes.read(secrets), lanes.read(guesses)
+    matched = lanes.is_zero(secret ^ guess)
+    unmatched = lanes.ones ^ matched
+    misplaced = excluded = 0
+    for letter in set(guesses):
+        letter_misplaced, letter_excluded = _letter_feedback(
+            lanes, secret, guess, unmatched, letter
+        )
+        misplaced |= letter_misplaced
+        excluded |= letter_excluded
+
+    correct = secret & matched * 0xFF
+    return Feedback(lanes.write(correct), lanes.write(misplaced), lanes.write(excluded))
+
+
+def _letter_feedback(
+    lanes: Lanes, secret: int, guess: int, unmatched: int, letter: int
+) -> Tuple[int, int]:
+    """Return the misplaced and excluded lanes of one letter of the guesses."""
+    in_guess = lanes.is_zero(guess ^ lanes.repeat(letter))
+    in_secret = lanes.is_zero(secret ^ lanes.repeat(letter))
+
+    # excluded: where the guess has more of this letter than the secret, store one
+    # more than the secret's count at the letter's first position in the guess.
+    secret_count = lanes.word_sums(in_secret)
+    more = lanes.greater(lanes.word_sums(in_guess), secret_count)
+    first = in_guess & lanes.is_zero(lanes.preceding(in_guess))
+    counts = lanes.spread((secret_count + lanes.starts) & more * 0xFF)
+    excluded = counts & first * 0xFF
+
+    # misplaced: the unmatched letters of the guess are marked from left to right, as
+    # long as the secret has unmatched copies of the letter left to use up.
+    candidates = in_guess & unmatched
+    available = lanes.spread(lanes.word_sums(in_secret & unmatched))
+    used = lanes.preceding(candidates)
+    return (candidates & lanes.greater(available, used)) * letter, excluded
+
+
+def decode_feedback(
+    feedback: Feedback, guesses: Any, length: int, index: int
+) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Return the (correct, misplaced, excluded) letters of one pair in a batch.
+
+    The three tuples are identical to the output of `correct_letters`,
+    `misplaced_letters` and `excluded_letters` for that secret and guess.
+    """
+    start, stop = index * length, (index + 1) * length
+    guess = bytes(guesses[start:stop]).decode("latin-1")
+    correct = tuple(chr(c) if c else "" for c in feedback.correct[start:stop])
+    misplaced = tuple(chr(c) if c else "" for c in feedback.misplaced[start:stop])
+    excluded = sorted(
+        letter * count
+        for letter, count in zip(guess, feedback.excluded[start:stop])
+        if count
+    )
+    return correct, misplaced, tuple(excluded)
@@ -0,0 +1,172 @@
+"""
+A thread-safe, bounded cache of Lingo partitions and potential solutions.
+
+Solvers call `partitions` and `potential_solutions` with the same guess and the same
+list of words again and again, across turns and across players. A PartitionCache
+remembers the most recently used results, keyed on the arguments: the guess (and the
+secret word), plus a fingerprint of the word list. The fingerprint is a 16-byte
+BLAKE2b digest of the sorted, distinct words, so keys stay small however long the list
+is, and a hit compares 16 bytes instead of every word. The cache remembers the
+fingerprint of each set of words it has seen, so the words are only sorted and hashed
+once per collection, and passing the same frozenset on every call avoids copying it.
+
+Neither result depends on the order of the words. Partitions are sorted, and a word is
+a potential solution or not on its own, so the cache stores the set of potential
+solutions and returns them in the order of the words it's given.
+"""
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import Lock
+from typing import Any, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from playful.lingo.game import partitions, potential_solutions
+
+# a cache key: the name of the function, its word arguments, then the fingerprint
+Key = Tuple[Any, ...]
+
+
+def fingerprint(words: Iterable[str]) -> bytes:
+    """Return a digest that identifies a collection of words, in any order."""
+    data = "\n".join(sorted(set(words))).encode("utf-8")
+    return blake2b(data, digest_size=16).digest()
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a PartitionCache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class PartitionCache:
+    """
+    A least-recently-used cache for `partitions` and `potential_solutions`.
+
+    Results are copied on the way in and out, so callers can change them freely. The
+    cache can be shared between threads.
+
+    Parameters
+    ----------
+    maxsize : int, default 1024, the largest number of results to keep. When the cache
+        is full, the least recently used result is discarded.
+
+    Examples
+    --------
+    >>> cache = PartitionCache(maxsize=2)
+    >>> cache.partitions("crate", ["react", "trace", "crate"])
+    [['crate'], ['react'], ['trace']]
+    >>> cache.partitions("crate", ["trace", "crate", "react"])
+    [['crate'], ['react'], ['trace']]
+    >>> cache.info()
+    CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._results: "OrderedDict[Key, Any]" = OrderedDict()
+        self._digests: "OrderedDict[FrozenSet[str], bytes]" = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self) -> str:
+        """Return a string representation of this PartitionCache."""
+        return f"{self.__class__.__qualname__}(maxsize={self.maxsize})"
+
+    def __len__(self) -> int:
+        """Return the number of results in this PartitionCache."""
+        return len(self._results)
+
+    def partitions(self, guess: str, words: Iterable[str]) -> List[List[str]]:
+        """Return the partitions that a guess creates among words, as `partitions`."""
+        wordset = frozenset(words)
+        key = ("partitions", guess, self._fingerprint(wordset))
+        result = self._get(key)
+        if result is None:
+            result = partitions(guess=guess, words=wordset)
+            self._put(key, [list(part) for part in result])
+        return [list(part) for part in result]
+
+    def potential_solutions(
+        self, secret: str, guess: str, words: Iterable[str]
+    ) -> List[str]:
+        """Return the words that are still potential solutions, as the function does."""
+        wordlist = list(words)
+        digest = self._fingerprint(frozenset(wordlist))
+        key = ("potential_solutions", secret, guess, digest)
+        solutions = self._get(key)
+        if solutions is None:
+            found = potential_solutions(secret=secret, guess=guess, words=wordlist)
+            solutions = frozenset(found)
+            self._put(key, solutions)
+        return [word for word in wordlist if word in solutions]
+
+    def info(self) -> CacheInfo:
+        """Return the hits, misses, maximum size and current size of the cache."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._results))
+
+    def invalidate(self, words: Optional[Iterable[str]] = None) -> int:
+        """
+        Discard cached results, and return how many were discarded.
+
+        Parameters
+        ----------
+        words : Optional[Iterable[str]], default None, if provided, only discard the
+            results computed from this collection of words, in any order. Otherwise,
+            discard every result.
+        """
+        digest = None if words is None else self._fingerprint(frozenset(words))
+        with self._lock:
+            if digest is None:
+                count = len(self._results)
+                self._results.clear()
+                return count
+            stale = [key for key in self._results if key[-1] == digest]
+            for key in stale:
+                del self._results[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        """Discard every cached result and reset the statistics."""
+        with self._lock:
+            self._results.clear()
+            self._digests.clear()
+            self._hits = self._misses = 0
+
+    def _fingerprint(self, wordset: FrozenSet[str]) -> bytes:
+        """Return the fingerprint of a set of words, computing it once per set."""
+        with self._lock:
+            digest = self._digests.get(wordset)
+            if digest is not None:
+                self._digests.move_to_end(wordset)
+                return digest
+        digest = fingerprint(wordset)
+        with self._lock:
+            self._digests[wordset] = digest
+            while len(self._digests) > self.maxsize:
+                self._digests.popitem(last=False)
+        return digest
+
+    def _get(self, key: Key) -> Any:
+        """Return the result of a key and mark it as recently used, or None."""
+        with self._lock:
+            result = self._results.get(key)
+            if result is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._results.move_to_end(key)
+            return result
+
+    def _put(self, key: Key, result: Any) -> None:
+        """Store the result of a key, discarding the least recently used if full."""
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
@@ -0,0 +1,137 @@
+"""
+Compiled constraints for filtering Lingo candidate words.
+
+The feedback from one guess can be compiled into a single Constraint: a bitmask of
+allowed letters for each position, plus lower and upper bounds on how many times some
+letters may appear. Checking a candidate word against a Constraint takes one pass over
+the word, and bulk filtering can check the letter bounds against precomputed letter
+counts before looking at any word at all.
+"""
+from array import array
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+# letter counts of a list of words, stored as one column of counts per letter.
+LetterCounts = Mapping[str, Sequence[int]]
+
+
+def letter_counts(words: Sequence[str]) -> Dict[str, "array[int]"]:
+    """Return a dictionary mapping each letter to its count in every word."""
+    counts: Dict[str, "array[int]"] = {}
+    for index, word in enumerate(words):
+        for letter in set(word):
+            if letter not in counts:
+                counts[letter] = array("B", bytes(len(words)))
+            counts[letter][index] = word.count(letter)
+    return counts
+
+
+class Constraint(NamedTuple):
+    """
+    A Constraint describes the words that are consistent with the feedback of a guess.
+
+    Parameters
+    ----------
+    masks : Tuple[int, ...], a bitmask for each position of the word, where bit
+        `ord(letter)` is set if the letter is allowed in that position
+    minimum : Tuple[Tuple[str, int], ...], pairs of letters and the minimum number of
+        times each must appear in the word
+    maximum : Tuple[Tuple[str, int], ...], pairs of letters and the maximum number of
+        times each may appear in the word
+    """
+
+    masks: Tuple[int, ...]
+    minimum: Tuple[Tuple[str, int], ...]
+    maximum: Tuple[Tuple[str, int], ...]
+
+    @classmethod
+    def from_feedback(
+        cls,
+        correct: Tuple[str, ...],
+        misplaced: Tuple[str, ...],
+        excluded: Tuple[str, ...],
+    ) -> "Constraint":
+        """
+        Compile a Constraint from correct, misplaced and excluded letters.
+
+        A word matches the compiled Constraint if and only if it satisfies
+        `has_correct_letters`, `has_misplaced_letters` and not `has_excluded_letters`
+        for the same letters.
+        """
+        masks = []
+        for correct_letter, misplaced_letter in zip(correct, misplaced):
+            mask = 1 << ord(correct_letter) if correct_letter else -1
+            if misplaced_letter:
+                mask &= ~(1 << ord(misplaced_letter))
+            masks.append(mask)
+
+        minimum = {letter: 1 for letter in misplaced if letter}
+        maximum: Dict[str, int] = {}
+        for letters in excluded:
+            bound = len(letters) - 1
+            maximum[letters[0]] = min(maximum.get(letters[0], bound), bound)
+
+        return cls(
+            masks=tuple(masks),
+            minimum=tuple(sorted(minimum.items())),
+            maximum=tuple(sorted(maximum.items())),
+        )
+
+    def matches_positions(self, word: str) -> bool:
+        """Return a boolean indicating if every letter is allowed in its position."""
+        return all(mask >> ord(letter) & 1 for letter, mask in zip(word, self.masks))
+
+    def matches(self, word: str) -> bool:
+        """Return a boolean indicating if a word is consistent with this Constraint."""
+        return (
+            all(word.count(letter) >= low for letter, low in self.minimum)
+            and all(word.count(letter) <= high for letter, high in self.maximum)
+            and self.matches_positions(word)
+        )
+
+    def filter(
+        self, words: Iterable[str], counts: Optional[LetterCounts] = None
+    ) -> List[str]:
+        """
+        Return a list of the words that are consistent with this Constraint.
+
+        Parameters
+        ----------
+        words : Iterable[str], the candidate words to filter
+        counts : Optional[LetterCounts], default None, the letter counts of the words,
+            as returned by `letter_counts`. If provided, the letter bounds are checked
+            against these counts, and only the words within bounds are examined.
+        """
+        if counts is None:
+            return [word for word in words if self.matches(word)]
+        words = words if isinstance(words, Sequence) else list(words)
+        return [words[i] for i in self.filter_ids(words, counts)]
+
+    def filter_ids(
+        self,
+        words: Sequence[str],
+        counts: LetterCounts,
+        ids: Optional[Iterable[int]] = None,
+    ) -> List[int]:
+        """
+        Return a list of the indexes of the words that are consistent with this
+        Constraint, checking the letter bounds against precomputed letter counts.
+
+        Parameters
+        ----------
+        words : Sequence[str], the candidate words to filter
+        counts : LetterCounts, the letter counts of the words, as returned by
+            `letter_counts`
+        ids : Optional[Iterable[int]], default None, the indexes of the words to
+            consider, in order. If None, consider every word.
+        """
+        remaining = range(len(words)) if ids is None else ids
+        for letter, low in self.minimum:
+            column = counts.get(letter)
+            if column is None:
+                return []
+            remaining = [i for i in remaining if column[i] >= low]
+        for letter, high in self.maximum:
+            column = counts.get(letter)
+            if column is not None:
+                remaining = [i for i in remaining if column[i] <= high]
+        return [i for i in remaining if self.matches_positions(words[i])]
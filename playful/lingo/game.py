@@ -4,6 +4,10 @@ https://en.wikipedia.org/wiki/Lingo_(American_game_show)
 """
 from typing import Iterable, List, Tuple
 
+from playful.core.profiling import count, profiled
+from playful.lingo.constraint import Constraint
+from playful.lingo.packed import PackedWords
+
 
 def correct_letters(secret: str, guess: str) -> Tuple[str, ...]:
     """Return a tuple of letters where the guess letter equals the secret letter."""
@@ -70,15 +74,32 @@ def is_potential_solution(secret: str, guess: str, word: str) -> bool:
     return True
 
 
+def compile_constraint(secret: str, guess: str) -> Constraint:
+    """Return a Constraint that matches the potential solutions, given a guess."""
+    return Constraint.from_feedback(
+        correct=correct_letters(secret=secret, guess=guess),
+        misplaced=misplaced_letters(secret=secret, guess=guess),
+        excluded=excluded_letters(secret=secret, guess=guess),
+    )
+
+
+@profiled("lingo.potential_solutions")
 def potential_solutions(secret: str, guess: str, words: Iterable[str]) -> List[str]:
     """Return a list of words that are still potential solutions, given a guess."""
-    return [
-        w for w in words if is_potential_solution(secret=secret, guess=guess, word=w)
-    ]
+    constraint = compile_constraint(secret=secret, guess=guess)
+    if isinstance(words, PackedWords):
+        out = constraint.filter(words, counts=words.letter_counts())
+    else:
+        out = constraint.filter(words)
+    count("lingo.candidates", len(out))
+    return out
 
 
+@profiled("lingo.partitions")
 def partitions(guess: str, words: Iterable[str]) -> List[List[str]]:
     """Return a list of the partitions that a guess will create among a list of words."""
+    if isinstance(words, PackedWords):
+        return packed_partitions(guess=guess, words=words)
     wordset = set(words)
     out = []
     while wordset:
@@ -89,6 +110,23 @@ def partitions(guess: str, words: Iterable[str]) -> List[List[str]]:
     return out
 
 
+def packed_partitions(guess: str, words: PackedWords) -> List[List[str]]:
+    """Return a list of the partitions that a guess will create among packed words."""
+    # packed words are sorted and unique, so the smallest remaining word always has
+    # the smallest remaining index, and partitions can be tracked as word indexes.
+    counts = words.letter_counts()
+    remaining = list(range(len(words)))
+    out = []
+    while remaining:
+        constraint = compile_constraint(secret=words[remaining[0]], guess=guess)
+        partition = constraint.filter_ids(words, counts, ids=remaining)
+        out.append([words[i] for i in partition])
+        taken = set(partition)
+        remaining = [i for i in remaining if i not in taken]
+    return out
+
+
+@profiled("lingo.best_splitting_word")
 def best_splitting_word(candidates: Iterable[str], words: Iterable[str]) -> str:
     """Return the word that splits a partition of words into the most sub-partitions."""
     best_word, best_split = "", 0
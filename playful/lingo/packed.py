@@ -0,0 +1,162 @@
+"""
+A packed, memory-mappable file format for Lingo dictionaries.
+
+A packed dictionary stores every word as a fixed-width row of one-byte letter codes,
+followed by a table that counts each letter of the alphabet in every word. Loading a
+packed file memory-maps it without copying, so many worker processes that load the
+same dictionary share the same pages of memory instead of building their own lists of
+Python strings.
+
+Layout (all integers little-endian)
+-----------------------------------
+header : magic b"PLWD", version (uint16), word length (uint16), alphabet size
+    (uint16), padding (uint16), word count (uint32)
+alphabet : one uint32 code point per letter
+letters : word count x word length uint8 letter codes
+histogram : word count x alphabet size uint8 letter counts
+"""
+import mmap
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union, overload
+
+MAGIC = b"PLWD"
+VERSION = 1
+HEADER = struct.Struct("<4sHHHHI")
+
+
+def pack_words(words: Iterable[str]) -> bytes:
+    """
+    Return the packed representation of a collection of words.
+
+    Duplicates are removed and the words are sorted. All words must have the same
+    length, and there may be no more than 255 distinct letters.
+    """
+    words = sorted(set(words))
+    lengths = {len(word) for word in words}
+    if len(lengths) > 1:
+        raise ValueError("all words must have the same length")
+    length = lengths.pop() if lengths else 0
+    alphabet = sorted({letter for word in words for letter in word})
+    if len(alphabet) > 255:
+        raise ValueError("words may contain no more than 255 distinct letters")
+
+    codes = {letter: code for code, letter in enumerate(alphabet)}
+    letters = bytearray(len(words) * length)
+    histogram = bytearray(len(words) * len(alphabet))
+    for index, word in enumerate(words):
+        for position, letter in enumerate(word):
+            letters[index * length + position] = codes[letter]
+            histogram[index * len(alphabet) + codes[letter]] += 1
+
+    header = HEADER.pack(MAGIC, VERSION, length, len(alphabet), 0, len(words))
+    points = struct.pack(f"<{len(alphabet)}I", *map(ord, alphabet))
+    return header + points + bytes(letters) + bytes(histogram)
+
+
+def write_packed(words: Iterable[str], path: str) -> None:
+    """Write a collection of words to a packed file."""
+    with open(path, "wb") as file:
+        file.write(pack_words(words))
+
+
+class PackedWords(Sequence[str]):
+    """
+    A sorted sequence of words, backed by a buffer in the packed format.
+
+    Words are decoded from their letter codes on access, and the letter counts of every
+    word are available without decoding any words at all. The lingo functions accept a
+    PackedWords anywhere they accept an iterable of words.
+
+    Parameters
+    ----------
+    buffer : a bytes-like object in the packed format. It is not copied.
+
+    Examples
+    --------
+    >>> words = PackedWords(pack_words(["trace", "crate", "react"]))
+    >>> list(words)
+    ['crate', 'react', 'trace']
+    >>> list(words.letter_counts()["c"])
+    [1, 1, 1]
+    """
+
+    def __init__(self, buffer: Any) -> None:
+        view = memoryview(buffer).cast("B")
+        magic, version, length, size, _, count = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("buffer is not a packed word list")
+        start = HEADER.size
+        points = struct.unpack_from(f"<{size}I", view, start)
+        start += 4 * size
+        self.alphabet: Tuple[str, ...] = tuple(map(chr, points))
+        self.length: int = length
+        self.path: Optional[str] = None
+        self._count: int = count
+        self._letters = view[start : start + count * length]
+        start += count * length
+        self._histogram = view[start : start + count * size]
+        self._mmap: Optional[mmap.mmap] = None
+
+    @classmethod
+    def load(cls, path: str) -> "PackedWords":
+        """Return the words of a packed file, memory-mapped without copying."""
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        words = cls(mapped)
+        words.path, words._mmap = path, mapped  # pylint: disable=protected-access
+        return words
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle memory-mapped words by path, so other processes map the same file."""
+        if self.path is not None:
+            return (self.__class__.load, (self.path,))
+        return (self.__class__, (pack_words(self),))
+
+    def __repr__(self) -> str:
+        """Return a string representation of this PackedWords."""
+        name = self.__class__.__qualname__
+        return f"{name}(words={len(self)}, length={self.length})"
+
+    def __len__(self) -> int:
+        """Return the number of words."""
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        """Return the word, or list of words, at an index or slice."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("word index out of range")
+        start = index * self.length
+        codes = self._letters[start : start + self.length]
+        return "".join([self.alphabet[code] for code in codes])
+
+    def letter_counts(self) -> Dict[str, memoryview]:
+        """Return a dictionary mapping each letter to its count in every word."""
+        size = len(self.alphabet)
+        return {
+            letter: self._histogram[code::size]
+            for code, letter in enumerate(self.alphabet)
+        }
+
+    def close(self) -> None:
+        """
+        Release the underlying buffer, closing the memory-mapped file if any.
+
+        Letter counts returned by `letter_counts` are views into the same buffer, and
+        must be released before the words are closed.
+        """
+        self._letters.release()
+        self._histogram.release()
+        if self._mmap is not None:
+            self._mmap.close()
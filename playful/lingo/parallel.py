@@ -0,0 +1,109 @@
+"""
+Search for the best splitting word across a pool of processes.
+
+Scoring one candidate word is independent of every other candidate, so the search in
+`best_splitting_word` can be divided into chunks of candidates and scored on several
+cores at once. The list of words is not sent with every chunk: each worker process
+loads the words once, when it starts, and keeps them for every chunk it scores. Python
+3.6 executors can't run code when a worker starts, so there, every chunk carries the
+words.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import os
+import sys
+from types import TracebackType
+from typing import Iterable, List, Optional, Type
+
+from playful.lingo.game import partitions
+
+# the words of the splitter that started this worker process.
+_WORDS: List[str] = []
+
+
+def _load_words(words: List[str]) -> None:
+    """Keep the words to split in this worker process."""
+    _WORDS[:] = words
+
+
+def _partition_counts(
+    candidates: List[str], words: Optional[List[str]] = None
+) -> List[int]:
+    """
+    Return the number of partitions that each candidate creates among the words, or
+    among the words loaded by this worker process if None.
+    """
+    known = _WORDS if words is None else words
+    return [len(partitions(guess=word, words=known)) for word in candidates]
+
+
+class ParallelSplitter:
+    """
+    Find the best splitting word for a list of words using a pool of processes.
+
+    The results are identical to `best_splitting_word`, including how ties are broken:
+    when several candidates create the same number of partitions, the first of them is
+    returned. The pool is started when the splitter is created and can be reused for
+    many searches over the same words; use it as a context manager, or call `close`,
+    to shut the pool down.
+
+    Parameters
+    ----------
+    words : Iterable[str], the words to split
+    workers : Optional[int], default None, the number of worker processes. If None,
+        use the number of processors on the machine.
+    chunksize : Optional[int], default None, the number of candidates sent to a worker
+        at a time. If None, candidates are divided into about four chunks per worker.
+    """
+
+    def __init__(
+        self,
+        words: Iterable[str],
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+    ) -> None:
+        self.words = list(words)
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        # the words sent with every chunk, when workers can't load them as they start.
+        if sys.version_info >= (3, 7):
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_load_words,
+                initargs=(self.words,),
+            )
+            self._words: Optional[List[str]] = None
+        else:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            self._words = self.words
+
+    def __enter__(self) -> "ParallelSplitter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the pool of worker processes."""
+        self._executor.shutdown(wait=True)
+
+    def chunks(self, candidates: List[str]) -> List[List[str]]:
+        """Return the candidates divided into consecutive chunks."""
+        size = self.chunksize or max(1, -(-len(candidates) // (self.workers * 4)))
+        return [candidates[i : i + size] for i in range(0, len(candidates), size)]
+
+    def best_splitting_word(self, candidates: Iterable[str]) -> str:
+        """Return the word that splits the words into the most sub-partitions."""
+        chunks = self.chunks(list(candidates))
+        counts = self._executor.map(_partition_counts, chunks, repeat(self._words))
+        best_word, best_split = "", 0
+        for chunk, splits in zip(chunks, counts):
+            for word, split in zip(chunk, splits):
+                if split > best_split:
+                    best_word, best_split = word, split
+        return best_word
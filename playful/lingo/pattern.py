@@ -0,0 +1,168 @@
+"""
+Feedback patterns for the Lingo word game.
+
+Each letter of a guess is either correct, misplaced, or absent from the secret word.
+Encoding those three outcomes as base-3 digits packs the feedback for a whole guess
+into a single small integer. Two secret words are indistinguishable after a guess if
+and only if they produce the same pattern, so splitting a list of words by a guess
+becomes a matter of counting integers instead of re-filtering the list.
+"""
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+ABSENT, MISPLACED, CORRECT = 0, 1, 2
+
+
+def feedback_pattern(secret: str, guess: str) -> int:
+    """
+    Return the feedback of a guess against a secret word, encoded as an integer.
+
+    The first letter of the guess is the most significant base-3 digit, and each digit
+    is one of ABSENT (0), MISPLACED (1), or CORRECT (2).
+
+    Examples
+    --------
+    >>> feedback_pattern(secret="match", guess="match")
+    242
+    >>> feedback_pattern(secret="tacos", guess="teach")
+    174
+    >>> feedback_pattern(secret="tangy", guess="zzzzz")
+    0
+    """
+    available = [s for s, g in zip(secret, guess) if s != g]
+    pattern = 0
+    for secret_letter, guess_letter in zip(secret, guess):
+        pattern *= 3
+        if secret_letter == guess_letter:
+            pattern += CORRECT
+        elif guess_letter in available:
+            pattern += MISPLACED
+            available.remove(guess_letter)
+    return pattern
+
+
+def pattern_digits(pattern: int, length: int) -> Tuple[int, ...]:
+    """Return the per-letter digits of a feedback pattern, first letter first."""
+    digits = []
+    for _ in range(length):
+        pattern, digit = divmod(pattern, 3)
+        digits.append(digit)
+    return tuple(reversed(digits))
+
+
+def pattern_feedback(
+    guess: str, pattern: int
+) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Return the (correct, misplaced, excluded) letters described by a pattern.
+
+    The three tuples are identical to the output of `correct_letters`,
+    `misplaced_letters` and `excluded_letters` for any secret word that produces this
+    pattern, so a pattern can stand in for the secret word once a guess is scored.
+    """
+    digits = pattern_digits(pattern, len(guess))
+    correct = tuple(g if d == CORRECT else "" for g, d in zip(guess, digits))
+    misplaced = tuple(g if d == MISPLACED else "" for g, d in zip(guess, digits))
+    excluded = []
+    for letter in set(guess):
+        marked = sum(g == letter and d != ABSENT for g, d in zip(guess, digits))
+        if guess.count(letter) > marked:
+            excluded.append(letter * (marked + 1))
+    return correct, misplaced, tuple(sorted(excluded))
+
+
+def pattern_typecode(length: int) -> str:
+    """Return the smallest array typecode that can hold patterns of a word length."""
+    for typecode in ("B", "H", "L", "Q"):
+        if 3 ** length <= 256 ** array(typecode).itemsize:
+            return typecode
+    raise ValueError(f"words of length {length} are too long to encode as patterns")
+
+
+class PatternMatrix:
+    """
+    A precomputed table of feedback patterns for every (guess, secret) pair.
+
+    Each row of the matrix holds the patterns of one guess against every secret word,
+    stored as a compact array of unsigned integers. Once built, partitions of the
+    secret words are buckets of equal patterns within a single row, and the number of
+    partitions a guess creates is the number of distinct values in its row.
+
+    Partitions are buckets of exact feedback patterns. They match `partitions` when
+    the guess has no repeated letters, but when it does, `partitions` can group
+    together secrets whose exact feedback differs, so the matrix may split the secrets
+    more finely. For example, "court" and "torch" share a partition of "mecca" under
+    `partitions`, but not here: the first "c" of "mecca" is misplaced in "court" and
+    the second "c" is correct in "torch".
+
+    Parameters
+    ----------
+    guesses : Iterable[str], the words that may be used as guesses
+    secrets : Iterable[str], the words that may be the secret word. Duplicates are
+        removed and the words are sorted, matching the behavior of `partitions`.
+
+    Examples
+    --------
+    >>> matrix = PatternMatrix(guesses=["crate", "trace"], secrets=["react", "trace"])
+    >>> matrix.partitions("crate")
+    [['react'], ['trace']]
+    >>> matrix.best_splitting_word()
+    'crate'
+    """
+
+    def __init__(self, guesses: Iterable[str], secrets: Iterable[str]) -> None:
+        self.guesses = list(dict.fromkeys(guesses))
+        self.secrets = sorted(set(secrets))
+        length = max((len(word) for word in self.guesses), default=0)
+        self.typecode = pattern_typecode(length)
+        self._rows: Dict[str, "array[int]"] = {
+            guess: array(
+                self.typecode, [feedback_pattern(s, guess) for s in self.secrets]
+            )
+            for guess in self.guesses
+        }
+
+    def __repr__(self) -> str:
+        """Return a string representation of this PatternMatrix."""
+        name = self.__class__.__qualname__
+        return f"{name}(guesses={len(self.guesses)}, secrets={len(self.secrets)})"
+
+    def row(self, guess: str) -> "array[int]":
+        """Return the patterns of a guess against every secret word."""
+        try:
+            return self._rows[guess]
+        except KeyError:
+            raise KeyError(f"{guess!r} is not one of this matrix's guesses") from None
+
+    def buckets(self, guess: str) -> Dict[int, List[str]]:
+        """Return a dictionary mapping each pattern of a guess to its secret words."""
+        out: Dict[int, List[str]] = {}
+        for secret, pattern in zip(self.secrets, self.row(guess)):
+            out.setdefault(pattern, []).append(secret)
+        return out
+
+    def partitions(self, guess: str) -> List[List[str]]:
+        """
+        Return a list of the partitions that a guess creates among the secrets.
+
+        Partitions are sorted by their smallest word, and each partition is sorted,
+        like `partitions`. For guesses without repeated letters, the partitions are
+        also the same as those of `partitions`; for guesses with repeated letters,
+        they are buckets of exact feedback, and may be finer.
+        """
+        # secrets are sorted, so buckets are created in order of their smallest word,
+        # and each bucket is already sorted.
+        return list(self.buckets(guess).values())
+
+    def partition_count(self, guess: str) -> int:
+        """Return the number of partitions that a guess creates among the secrets."""
+        return len(set(self.row(guess)))
+
+    def best_splitting_word(self, candidates: Optional[Iterable[str]] = None) -> str:
+        """Return the guess that splits the secrets into the most partitions."""
+        best_word, best_split = "", 0
+        for word in self.guesses if candidates is None else candidates:
+            split = self.partition_count(word)
+            if split > best_split:
+                best_word, best_split = word, split
+        return best_word
@@ -0,0 +1,114 @@
+"""
+A stateful Lingo solver that narrows down the possible secret words turn by turn.
+
+A session numbers its dictionary once, then tracks the words that are still possible
+as a compact array of word ids. Each guess only examines the words that survived the
+previous turns, so later turns get cheaper as the game goes on.
+"""
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from playful.lingo.pattern import feedback_pattern
+
+
+class LingoSession:
+    """
+    A LingoSession tracks the words that could still be the secret word in one game.
+
+    Parameters
+    ----------
+    words : Iterable[str], the dictionary of words that may be the secret word.
+        Duplicates are removed and the words are sorted.
+
+    Examples
+    --------
+    >>> session = LingoSession(["crate", "react", "trace", "teach"])
+    >>> session.guess("trace", feedback_pattern(secret="crate", guess="trace"))
+    1
+    >>> session.candidates()
+    ['crate']
+    """
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.words = sorted(set(words))
+        self.history: List[Tuple[str, int]] = []
+        self._survivors = array("L", range(len(self.words)))
+
+    def __repr__(self) -> str:
+        """Return a string representation of this LingoSession."""
+        name = self.__class__.__qualname__
+        return f"{name}(words={len(self.words)}, candidates={len(self)})"
+
+    def __len__(self) -> int:
+        """Return the number of words that could still be the secret word."""
+        return len(self._survivors)
+
+    def __contains__(self, word: object) -> bool:
+        """Return a boolean indicating if a word could still be the secret word."""
+        if not isinstance(word, str):
+            return False
+        word_id = bisect_left(self.words, word)
+        if word_id == len(self.words) or self.words[word_id] != word:
+            return False
+        position = bisect_left(self._survivors, word_id)
+        return position < len(self._survivors) and self._survivors[position] == word_id
+
+    def candidates(self) -> List[str]:
+        """Return a sorted list of the words that could still be the secret word."""
+        return [self.words[i] for i in self._survivors]
+
+    def guess(self, guess: str, pattern: int) -> int:
+        """
+        Remove the words that are inconsistent with the feedback from a guess.
+
+        Parameters
+        ----------
+        guess : str, the word that was guessed
+        pattern : int, the feedback received for the guess, as encoded by
+            `feedback_pattern`
+
+        Returns
+        -------
+        The number of words that could still be the secret word.
+        """
+        words = self.words
+        self._survivors = array(
+            "L",
+            (
+                i
+                for i in self._survivors
+                if feedback_pattern(words[i], guess) == pattern
+            ),
+        )
+        self.history.append((guess, pattern))
+        return len(self._survivors)
+
+    def reset(self) -> None:
+        """Start a new game, making every word in the dictionary a candidate again."""
+        self.history.clear()
+        self._survivors = array("L", range(len(self.words)))
+
+    def partitions(self, guess: str) -> List[List[str]]:
+        """Return a list of the partitions that a guess creates among the candidates."""
+        buckets: Dict[int, List[str]] = {}
+        for word in self.candidates():
+            buckets.setdefault(feedback_pattern(word, guess), []).append(word)
+        return list(buckets.values())
+
+    def best_splitting_word(self, candidates: Optional[Iterable[str]] = None) -> str:
+        """
+        Return the word that splits the remaining candidates into the most partitions.
+
+        Parameters
+        ----------
+        candidates : Optional[Iterable[str]], default None, the words to consider as
+            the next guess. If None, only the remaining candidates are considered.
+        """
+        remaining = self.candidates()
+        best_word, best_split = "", 0
+        for word in remaining if candidates is None else candidates:
+            split = len({feedback_pattern(secret, word) for secret in remaining})
+            if split > best_split:
+                best_word, best_split = word, split
+        return best_word
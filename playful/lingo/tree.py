@@ -0,0 +1,297 @@
+"""
+Precomputed guessing strategies for the Lingo word game.
+
+A strategy is a decision tree: each node holds the word to guess, and has one child for
+each feedback pattern that guess can receive, holding the next word to guess among the
+words that produce that pattern. Building the tree does all of the searching up front,
+so playing a game is one dictionary lookup per turn.
+
+The tree is built by choosing the best guess for a group of words, splitting the group
+by the feedback patterns of that guess, and recursing into each part. The parts of a
+group never overlap, so every group of words is reached along exactly one path.
+
+Trees are saved in a compact binary format that stores each node once.
+
+Layout (all integers little-endian)
+-----------------------------------
+header : magic b"PLTR", version (uint16), padding (uint16), word table size in bytes
+    (uint32), node count (uint32), edge count (uint32)
+words : the guessed words, utf-8 encoded and separated by newlines
+nodes : (word index (uint32), first edge (uint32), edge count (uint32), wins (uint8))
+    records, children before their parents; the root is the last node
+edges : (pattern (uint64), child node (uint32)) records
+"""
+from collections import Counter
+import struct
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from playful.lingo.pattern import PatternMatrix
+
+MAGIC = b"PLTR"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIII")
+NODE = struct.Struct("<IIIB")
+EDGE = struct.Struct("<QI")
+
+# each score turns the sizes of the groups that a guess creates into a sort key, where
+# smaller keys are better guesses.
+SCORES: Dict[str, Callable[[List[int]], int]] = {
+    "partitions": lambda sizes: -len(sizes),
+    "expected": lambda sizes: sum(size * size for size in sizes),
+    "minimax": max,
+}
+
+
+class Node(NamedTuple):
+    """
+    A Node of a decision tree holds the word to guess, and the next Node for each
+    feedback pattern it can receive, other than the pattern of a correct guess.
+
+    `wins` is True if the guess is one of the words that could still be the secret.
+    """
+
+    guess: str
+    wins: bool
+    # the child Nodes, as Any, because mypy can't check recursive NamedTuples.
+    children: Dict[int, Any]
+
+
+class DecisionTree:
+    """
+    A DecisionTree answers each turn of a Lingo game with one lookup.
+
+    Parameters
+    ----------
+    root : Node, the first Node of the tree
+
+    Examples
+    --------
+    >>> from playful.lingo.pattern import feedback_pattern
+    >>> words = ["crate", "react", "trace", "teach", "beach", "leach"]
+    >>> tree = DecisionTree.build(words, score="minimax")
+    >>> tree.guess()
+    'beach'
+    >>> tree.guess([feedback_pattern(secret="leach", guess="beach")])
+    'leach'
+    >>> tree.max_guesses()
+    3
+    """
+
+    def __init__(self, root: Node) -> None:
+        self.root = root
+
+    def __repr__(self) -> str:
+        """Return a string representation of this DecisionTree."""
+        name = self.__class__.__qualname__
+        return f"{name}(root={self.root.guess!r}, secrets={self.secrets()})"
+
+    def __eq__(self, other: object) -> bool:
+        """Return a boolean indicating if two DecisionTrees play the same way."""
+        if not isinstance(other, DecisionTree):
+            return NotImplemented
+        return self.root == other.root
+
+    @classmethod
+    def build(
+        cls,
+        words: Iterable[str],
+        guesses: Optional[Iterable[str]] = None,
+        score: str = "partitions",
+    ) -> "DecisionTree":
+        """
+        Build the DecisionTree of a dictionary.
+
+        Parameters
+        ----------
+        words : Iterable[str], the words that may be the secret word
+        guesses : Optional[Iterable[str]], default None, the words that may be guessed.
+            If None, only guess words that could still be the secret word.
+        score : str, default "partitions", how to choose each guess: "partitions"
+            creates the most groups, "expected" minimizes the expected size of the
+            group that remains, and "minimax" minimizes the size of the largest group.
+            Ties go to guesses that could win, then to the first guess.
+        """
+        if score not in SCORES:
+            raise ValueError(f"score must be one of {sorted(SCORES)}")
+        secrets = sorted(set(words))
+        allowed = None if guesses is None else list(dict.fromkeys(guesses))
+        matrix = PatternMatrix(secrets + (allowed or []), secrets)
+        return cls(_Builder(matrix, allowed, SCORES[score]).node(range(len(secrets))))
+
+    def node(self, patterns: Sequence[int] = ()) -> Node:
+        """Return the Node reached by the feedback patterns of the previous guesses."""
+        node = self.root
+        for pattern in patterns:
+            try:
+                node = node.children[pattern]
+            except KeyError:
+                raise KeyError(f"no word matches the feedback {pattern}") from None
+        return node
+
+    def guess(self, patterns: Sequence[int] = ()) -> str:
+        """Return the next word to guess, after receiving feedback patterns."""
+        return self.node(patterns).guess
+
+    def secrets(self) -> int:
+        """Return the number of secret words that this tree can solve."""
+        return sum(1 for _ in self._depths(self.root, 1))
+
+    def average_guesses(self) -> float:
+        """Return the average number of guesses needed to solve each secret word."""
+        depths = list(self._depths(self.root, 1))
+        return sum(depths) / len(depths) if depths else 0.0
+
+    def max_guesses(self) -> int:
+        """Return the most guesses needed to solve any secret word."""
+        return max(self._depths(self.root, 1), default=0)
+
+    def _depths(self, node: Node, depth: int) -> Iterable[int]:
+        """Yield the number of guesses that solve each secret word below a Node."""
+        if node.wins:
+            yield depth
+        for child in node.children.values():
+            yield from self._depths(child, depth + 1)
+
+    def dumps(self) -> bytes:
+        """Return the compact binary representation of this tree."""
+        # number the nodes children first, so every node is numbered before the node
+        # that refers to it.
+        nodes: List[Node] = []
+        edges: List[List[Tuple[int, int]]] = []
+
+        def visit(node: Node) -> int:
+            links = [
+                (pattern, visit(child)) for pattern, child in node.children.items()
+            ]
+            nodes.append(node)
+            edges.append(links)
+            return len(nodes) - 1
+
+        visit(self.root)
+        table = sorted({node.guess for node in nodes})
+        index = {word: i for i, word in enumerate(table)}
+
+        node_records: List[bytes] = []
+        edge_records: List[bytes] = []
+        for node, links in zip(nodes, edges):
+            first = len(edge_records)
+            edge_records.extend(EDGE.pack(*link) for link in links)
+            record = (index[node.guess], first, len(links), node.wins)
+            node_records.append(NODE.pack(*record))
+
+        blob = "\n".join(table).encode("utf-8")
+        header = HEADER.pack(
+            MAGIC, VERSION, 0, len(blob), len(node_records), len(edge_records)
+        )
+        return header + blob + b"".join(node_records) + b"".join(edge_records)
+
+    @classmethod
+    def loads(cls, data: bytes) -> "DecisionTree":
+        """Return the tree stored in its compact binary representation."""
+        table, records, edges = _unpack_sections(data)
+
+        # children always come before their parents, and the root is last.
+        nodes: List[Node] = []
+        for word, first, count, wins in records:
+            children = {
+                pattern: nodes[child] for pattern, child in edges[first : first + count]
+            }
+            nodes.append(Node(table[word], bool(wins), children))
+        if not nodes:
+            raise ValueError("a lingo decision tree must have a root")
+        return cls(nodes[-1])
+
+    def save(self, path: str) -> None:
+        """Write this tree to a file."""
+        with open(path, "wb") as file:
+            file.write(self.dumps())
+
+    @classmethod
+    def load(cls, path: str) -> "DecisionTree":
+        """Read a tree from a file."""
+        with open(path, "rb") as file:
+            return cls.loads(file.read())
+
+
+def _unpack_sections(
+    data: bytes,
+) -> Tuple[List[str], List[Tuple[int, ...]], List[Tuple[int, ...]]]:
+    """Return the word table, node records and edge records of a stored tree."""
+    view = memoryview(data).cast("B")
+    if len(view) < HEADER.size:
+        raise ValueError("buffer is not a lingo decision tree")
+    magic, version, _, size, n_nodes, n_edges = HEADER.unpack_from(view)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("buffer is not a lingo decision tree")
+    start = HEADER.size
+    table = bytes(view[start : start + size]).decode("utf-8").split("\n")
+    start += size
+    records = list(NODE.iter_unpack(view[start : start + n_nodes * NODE.size]))
+    start += n_nodes * NODE.size
+    edges = list(EDGE.iter_unpack(view[start : start + n_edges * EDGE.size]))
+    return table, records, edges
+
+
+class _Builder:
+    """Build the Nodes of a DecisionTree from a PatternMatrix."""
+
+    def __init__(
+        self,
+        matrix: PatternMatrix,
+        guesses: Optional[List[str]],
+        score: Callable[[List[int]], int],
+    ) -> None:
+        self.matrix = matrix
+        self.guesses = guesses
+        self.score = score
+
+    def node(self, ids: Iterable[int]) -> Node:
+        """Return the Node that guesses among the secret words with some indexes."""
+        return self._build(tuple(ids))
+
+    def choose(self, ids: Tuple[int, ...]) -> str:
+        """Return the best guess among the secret words with some indexes."""
+        remaining = [self.matrix.secrets[i] for i in ids]
+        candidates = remaining if self.guesses is None else self.guesses
+        possible = set(remaining)
+        best_key: Optional[Tuple[int, bool, int]] = None
+        best_guess = None
+        for position, guess in enumerate(candidates):
+            row = self.matrix.row(guess)
+            sizes = list(Counter(row[i] for i in ids).values())
+            if len(sizes) == 1 and guess not in possible:
+                continue  # this guess can't tell the words apart
+            key = (self.score(sizes), guess not in possible, position)
+            if best_key is None or key < best_key:
+                best_key, best_guess = key, guess
+        # if no allowed guess tells the words apart, guess one of the words itself.
+        return remaining[0] if best_guess is None else best_guess
+
+    def _build(self, ids: Tuple[int, ...]) -> Node:
+        """Choose the best guess among secret words, and build a child for each part."""
+        secrets = self.matrix.secrets
+        if len(ids) == 1:
+            return Node(secrets[ids[0]], True, {})
+
+        guess = self.choose(ids)
+        groups: Dict[int, List[int]] = {}
+        row = self.matrix.row(guess)
+        for secret in ids:
+            groups.setdefault(row[secret], []).append(secret)
+        solved = 3 ** len(guess) - 1
+        children = {
+            pattern: self.node(group)
+            for pattern, group in groups.items()
+            if pattern != solved
+        }
+        return Node(guess, guess in {secrets[i] for i in ids}, children)
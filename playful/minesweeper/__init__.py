@@ -1,6 +1,22 @@
 """Top-level imports."""
+from playful.minesweeper.array_board import ArrayBoard
 from playful.minesweeper.board import Board
 from playful.minesweeper.cell import Cell
+from playful.minesweeper.infinite import InfiniteBoard
+from playful.minesweeper.persistent import PersistentBoard
+from playful.minesweeper.probability import ProbabilityEngine
+from playful.minesweeper.render import IncrementalRenderer, Viewport
+from playful.minesweeper.solver import Solver
 
 
-__all__ = ("Board", "Cell")
+__all__ = (
+    "ArrayBoard",
+    "Board",
+    "Cell",
+    "IncrementalRenderer",
+    "InfiniteBoard",
+    "PersistentBoard",
+    "ProbabilityEngine",
+    "Solver",
+    "Viewport",
+)
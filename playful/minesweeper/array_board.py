@@ -0,0 +1,382 @@
+"""
+Array-backed minesweeper Board.
+
+An ArrayBoard stores every Cell of a Board as a single byte in a flat buffer, indexed
+by position, rather than as a set of Cell objects. Looking up a Cell, finding its
+neighbors and changing its state take constant time, and the counts of each state are
+kept up to date as states change, so boards with millions of Cells stay responsive.
+
+Each byte packs a Cell's state into the high nibble, as an index into STATES, and its
+value plus one into the low nibble, so a hidden bomb is stored as zero.
+"""
+from abc import ABC, abstractmethod
+from collections import Counter
+import random
+import typing
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TextIO,
+    Union,
+)
+
+from playful.core import Point
+from playful.core.grid import within
+from playful.core.profiling import profiled
+from playful.minesweeper.board import Board, board_repr
+from playful.minesweeper.cell import Cell
+from playful.minesweeper.layout import bomb_mask, hidden_layout
+from playful.minesweeper.render import Viewport, frame, write_lines
+from playful.minesweeper.reveal import flood_fill
+
+STATES = ("hidden", "revealed", "flagged")
+STATE_CODES = {state: code for code, state in enumerate(STATES)}
+
+# a writable buffer of packed Cells, such as a bytearray or a view of a mapped file
+Buffer = Union[bytearray, memoryview]
+
+# the visualization of each packed byte, as a table for bytes.translate
+SYMBOLS = bytes(
+    ord(Cell(Point(0, 0), (code & 0x0F) - 1, STATES[code >> 4]).visualize())
+    if code >> 4 < len(STATES) and code & 0x0F <= 9
+    else ord("?")
+    for code in range(256)
+)
+
+
+def encode_cell(value: int, state: str) -> int:
+    """Return the byte that represents a Cell's value and state."""
+    return STATE_CODES[state] << 4 | (value + 1)
+
+
+# the byte of a revealed bomb, which loses the game
+EXPLODED = encode_cell(-1, "revealed")
+
+
+class PackedBoard(ABC):
+    """
+    The methods shared by Boards that pack their Cells into bytes by position.
+
+    Cell (x, y) is at index `y * width + x`. Subclasses store the width and height of
+    the Board, and provide `cell_at`, `symbol_rows`, `states` and `bombs`.
+    """
+
+    __slots__ = ()
+
+    width: int
+    height: int
+
+    def __repr__(self) -> str:
+        """Return a string representation of this Board."""
+        return board_repr(self)
+
+    def __contains__(self, point: object) -> bool:
+        """Return a boolean indicating if a Point lies within this Board."""
+        return within(point, self.width, self.height)
+
+    def __getitem__(self, point: Point) -> Cell:
+        """Return the Cell at a Point."""
+        return self.cell(point)
+
+    def __len__(self) -> int:
+        """Return the number of Cells in this Board."""
+        return self.width * self.height
+
+    def index(self, point: Point) -> int:
+        """Return the buffer index of a Point."""
+        if point not in self:
+            raise IndexError(f"{point} is outside of the board")
+        return point.y * self.width + point.x
+
+    def point(self, index: int) -> Point:
+        """Return the Point of a buffer index."""
+        y, x = divmod(index, self.width)
+        return Point(x, y)
+
+    def cell(self, point: Point) -> Cell:
+        """Return the Cell at a Point."""
+        return self.cell_at(self.index(point))
+
+    @abstractmethod
+    def cell_at(self, index: int) -> Cell:
+        """Return the Cell at a buffer index."""
+
+    def neighbor_indices(self, index: int) -> List[int]:
+        """Return the buffer indexes of the Cells that border a buffer index."""
+        width, height = self.width, self.height
+        y, x = divmod(index, width)
+        return [
+            ny * width + nx
+            for ny in range(max(y - 1, 0), min(y + 2, height))
+            for nx in range(max(x - 1, 0), min(x + 2, width))
+            if nx != x or ny != y
+        ]
+
+    def viewport(self, viewport: Optional[Viewport] = None) -> Viewport:
+        """Return a Viewport clipped to this Board, or one that covers all of it."""
+        if viewport is None:
+            return Viewport(0, 0, self.width, self.height)
+        return viewport.clip(self.width, self.height)
+
+    @abstractmethod
+    def symbol_rows(self, viewport: Optional[Viewport] = None) -> Iterator[str]:
+        """Yield the symbols of the Cells in a Viewport, one row at a time."""
+
+    def lines(self, viewport: Optional[Viewport] = None) -> Iterator[str]:
+        """Yield the lines of a visualization of this Board, or part of it."""
+        viewport = self.viewport(viewport)
+        return frame(self.symbol_rows(viewport), viewport.width)
+
+    def write(self, stream: TextIO, viewport: Optional[Viewport] = None) -> None:
+        """Write a visualization of this Board, or part of it, to a text stream."""
+        write_lines(self.lines(viewport), stream)
+
+    def visualize(self, viewport: Optional[Viewport] = None) -> str:
+        """Return a string visualization of the Board and its cells."""
+        return "\n".join(self.lines(viewport))
+
+
+class ArrayBoard(PackedBoard):  # pylint: disable=too-many-public-methods
+    """
+    A minesweeper Board whose Cells are packed into a flat, position-indexed buffer.
+
+    Cell (x, y) is stored at index `y * width + x`. An ArrayBoard can be converted to
+    and from a Board, or any collection of Cells that covers a full rectangle.
+
+    Parameters
+    ----------
+    width : int, the width (x) dimension of the Board
+    height : int, the height (y) dimension of the Board
+    cells : Optional[Buffer], default None, the packed Cells of the Board, as returned
+        by `encode_cell`. The buffer is not copied. If None, every Cell is hidden with
+        a value of zero.
+    """
+
+    __slots__ = ("width", "height", "cells", "_counts", "_bombs", "_exploded")
+
+    def __init__(self, width: int, height: int, cells: Optional[Buffer] = None) -> None:
+        if cells is None:
+            cells = bytearray([encode_cell(0, "hidden")]) * (width * height)
+        if len(cells) != width * height:
+            raise ValueError("the number of cells must equal width * height")
+        self.width = width
+        self.height = height
+        self.cells: Buffer = cells
+        self._counts = [0] * len(STATES)
+        self._bombs = self._exploded = 0
+        for code, count in Counter(cells).items():
+            self._counts[code >> 4] += count
+            if code & 0x0F == 0:
+                self._bombs += count
+            if code == EXPLODED:
+                self._exploded = count
+
+    @classmethod
+    @profiled("minesweeper.ArrayBoard.create")
+    def create(  # pylint: disable=too-many-arguments
+        cls,
+        width: int,
+        height: int,
+        n_bombs: int,
+        random_state: Optional[int],
+        rng: Optional[random.Random] = None,
+    ) -> "ArrayBoard":
+        """
+        Create an ArrayBoard with a given size and number of randomly-distributed bombs.
+
+        For the same arguments, the bombs are placed exactly where `Board.create` places
+        them, without creating a Cell for every location. If a generator is given as
+        `rng`, the bombs are sampled from it instead of the seeded global generator, as
+        in `bomb_mask`.
+        """
+        mask = bomb_mask(width, height, n_bombs, random_state, rng)
+        return cls(width, height, hidden_layout(mask, width, height))
+
+    @classmethod
+    def from_buffer(  # pylint: disable=too-many-arguments
+        cls, width: int, height: int, cells: Buffer, counts: Sequence[int], bombs: int
+    ) -> "ArrayBoard":
+        """
+        Create an ArrayBoard around a buffer of packed Cells whose number of Cells in
+        each state, and number of bombs, are already known, without counting them.
+        Revealed bombs are only searched for if some Cells have been revealed.
+        """
+        if len(cells) != width * height or len(counts) != len(STATES):
+            raise ValueError("the number of cells must equal width * height")
+        board: "ArrayBoard" = cls.__new__(cls)
+        board.width, board.height, board.cells = width, height, cells
+        board._counts, board._bombs = list(counts), bombs
+        revealed = counts[STATE_CODES["revealed"]]
+        board._exploded = bytes(cells).count(EXPLODED) if revealed else 0
+        return board
+
+    @classmethod
+    def from_cells(cls, cells: Iterable[Cell]) -> "ArrayBoard":
+        """Create an ArrayBoard from a collection of Cells that covers a rectangle."""
+        cells = list(cells)
+        width = max(cell.location.x for cell in cells) + 1
+        height = max(cell.location.y for cell in cells) + 1
+        packed = bytearray(width * height)
+        for cell in cells:
+            x, y = cell.location
+            packed[y * width + x] = encode_cell(cell.value, cell.state)
+        if len({cell.location for cell in cells}) != width * height:
+            raise ValueError("cells must cover every location of the board")
+        return cls(width, height, packed)
+
+    @classmethod
+    def from_board(cls, board: Board) -> "ArrayBoard":
+        """Create an ArrayBoard from a Board."""
+        return cls.from_cells(board.cells)
+
+    def to_cells(self) -> Set[Cell]:
+        """Return a set of the Cells in this ArrayBoard."""
+        return {self.cell_at(i) for i in range(len(self.cells))}
+
+    def to_board(self) -> Board:
+        """Return a Board containing the Cells in this ArrayBoard."""
+        return Board(self.to_cells())
+
+    def copy(self) -> "ArrayBoard":
+        """Return a copy of this ArrayBoard, which can be changed independently."""
+        return self.__class__(self.width, self.height, bytearray(self.cells))
+
+    def cell_at(self, index: int) -> Cell:
+        """Return the Cell at a buffer index."""
+        code = self.cells[index]
+        return Cell(self.point(index), value=(code & 0x0F) - 1, state=STATES[code >> 4])
+
+    def value(self, point: Point) -> int:
+        """Return the value of the Cell at a Point."""
+        return (self.cells[self.index(point)] & 0x0F) - 1
+
+    def state(self, point: Point) -> str:
+        """Return the state of the Cell at a Point."""
+        return STATES[self.cells[self.index(point)] >> 4]
+
+    def set_state(self, point: Point, state: str) -> Cell:
+        """Change the state of the Cell at a Point, and return the new Cell."""
+        return self.set_state_at(self.index(point), state)
+
+    def set_state_at(self, index: int, state: str) -> Cell:
+        """Change the state of the Cell at a buffer index, and return the new Cell."""
+        code = self.cells[index]
+        new_state = STATE_CODES[state]
+        self._counts[code >> 4] -= 1
+        self._counts[new_state] += 1
+        self.cells[index] = new_code = new_state << 4 | (code & 0x0F)
+        self._exploded += (new_code == EXPLODED) - (code == EXPLODED)
+        return self.cell_at(index)
+
+    @profiled("minesweeper.ArrayBoard.reveal")
+    def reveal(self, point: Point) -> List[Cell]:
+        """
+        Reveal the Cell at a Point in place, and return the list of changed Cells.
+
+        Reveals cascade through Cells with a value of zero in the same way as
+        `Board.reveal`.
+        """
+        cells = self.cells
+        revealed = flood_fill(
+            self.index(point),
+            value=lambda i: (cells[i] & 0x0F) - 1,
+            state=lambda i: STATES[cells[i] >> 4],
+            neighbors=self.neighbor_indices,
+        )
+        return [self.set_state_at(i, "revealed") for i in revealed]
+
+    def flag(self, point: Point) -> List[Cell]:
+        """
+        Flag the Cell at a Point in place, and return the list of changed Cells.
+
+        Flags are toggled in the same way as `Board.flag`.
+        """
+        index = self.index(point)
+        state = STATES[self.cells[index] >> 4]
+        if state == "hidden":
+            return [self.set_state_at(index, "flagged")]
+        if state == "flagged":
+            return [self.set_state_at(index, "hidden")]
+        return []
+
+    def neighbors(self, point: Point) -> Set[Cell]:
+        """Return a set of the Cells that border a Point."""
+        return {self.cell_at(i) for i in self.neighbor_indices(self.index(point))}
+
+    def neighbor_states(self, point: Point) -> typing.Counter[str]:
+        """Return a dictionary of the states and counts of a Point's neighbors."""
+        cells = self.cells
+        neighbors = self.neighbor_indices(self.index(point))
+        return Counter(STATES[cells[i] >> 4] for i in neighbors)
+
+    def symbol_rows(self, viewport: Optional[Viewport] = None) -> Iterator[str]:
+        """
+        Yield the symbols of the Cells in a Viewport, one row at a time.
+
+        Each row is translated straight from the packed buffer, without creating Cells.
+        """
+        x, y, width, height = self.viewport(viewport)
+        for row in range(y, y + height):
+            start = row * self.width + x
+            codes = bytes(self.cells[start : start + width])
+            yield codes.translate(SYMBOLS).decode("ascii")
+
+    @property
+    def bombs(self) -> int:
+        """Return the number of bombs contained in this ArrayBoard."""
+        return self._bombs
+
+    def states(self) -> typing.Counter[str]:
+        """Return a dictionary of the states of all Cells in this ArrayBoard."""
+        return Counter(
+            {
+                state: count
+                for state, count in sorted(zip(STATES, self._counts))
+                if count
+            }
+        )
+
+    def is_won(self) -> bool:
+        """Return a boolean indicating if every Cell without a bomb has been revealed."""
+        revealed = self._counts[STATE_CODES["revealed"]]
+        return not self._exploded and revealed == len(self.cells) - self._bombs
+
+    def is_lost(self) -> bool:
+        """Return a boolean indicating if a Cell with a bomb has been revealed."""
+        return self._exploded > 0
+
+    def bomb_cells(self) -> Set[Cell]:
+        """Return the set of Cells in this ArrayBoard that contain bombs."""
+        return self._select(lambda code: code & 0x0F == 0)
+
+    def safe_cells(self) -> Set[Cell]:
+        """Return the set of Cells in this ArrayBoard that don't contain bombs."""
+        return self._select(lambda code: code & 0x0F != 0)
+
+    def flagged_cells(self) -> Set[Cell]:
+        """Return the set of Cells in this ArrayBoard that have been flagged."""
+        return self._select_state("flagged")
+
+    def hidden_cells(self) -> Set[Cell]:
+        """Return the set of Cells in this ArrayBoard that have been hidden."""
+        return self._select_state("hidden")
+
+    def revealed_cells(self) -> Set[Cell]:
+        """Return the set of Cells in this ArrayBoard that have been revealed."""
+        return self._select_state("revealed")
+
+    def _select(self, condition: Callable[[int], bool]) -> Set[Cell]:
+        """Return the set of Cells whose packed byte meets a condition."""
+        return {self.cell_at(i) for i, code in enumerate(self.cells) if condition(code)}
+
+    def _select_state(self, state: str) -> Set[Cell]:
+        """Return the set of Cells in a given state."""
+        if not self._counts[STATE_CODES[state]]:
+            return set()
+        code = STATE_CODES[state]
+        return self._select(lambda packed: packed >> 4 == code)
@@ -1,92 +1,211 @@
 """Minesweeper Board class"""
-from collections import Counter
-from itertools import product
-import random
 import typing
-from typing import NamedTuple, Optional, Set
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+)
 
 from playful.core import Point
+from playful.core.profiling import count, profiled
 from playful.minesweeper.cell import Cell
+from playful.minesweeper.index import BoardIndex
+from playful.minesweeper.layout import bomb_mask, hidden_layout
+from playful.minesweeper.render import Viewport, cell_rows, frame, write_lines
+from playful.minesweeper.reveal import flood_fill
 
 
-class Board(NamedTuple):
-    """A minesweeper Board contains a set of Cells and methods to play the game."""
+def board_repr(board: typing.Any) -> str:
+    """Return the string representation of any kind of Board, from its counts."""
+    attributes = dict(
+        height=board.height,
+        width=board.width,
+        bombs=board.bombs,
+        **board.states(),
+    )
+    attrs = ", ".join(f"{k}={repr(v)}" for k, v in attributes.items())
+    return f"{board.__class__.__qualname__}({attrs})"
+
+
+class _Cells(NamedTuple):
+    """The fields of a Board."""
 
     cells: Set[Cell]
 
+
+class Board(_Cells):  # pylint: disable=too-many-public-methods
+    """
+    A minesweeper Board contains a set of Cells and methods to play the game.
+
+    Boards keep a BoardIndex of their Cells, which is built the first time it's needed,
+    so questions about the Cells in each state, the bombs, and whether the game is won
+    or lost don't have to look at every Cell. Playing a move hands the index over to
+    the new Board and updates it for the changed Cells only.
+    """
+
     def __repr__(self) -> str:
         """Return a string representation of this Board."""
-        attributes = dict(
-            height=self.height,
-            width=self.width,
-            bombs=self.bombs,
-            **self.states(),
-        )
-        attrs = ", ".join(f"{k}={repr(v)}" for k, v in attributes.items())
-        return f"{self.__class__.__qualname__}({attrs})"
+        return board_repr(self)
+
+    def __reduce__(self) -> Tuple[type, Tuple[Set[Cell]]]:
+        """Pickle and copy Boards without their index, which is rebuilt when needed."""
+        return self.__class__, (self.cells,)
 
     @classmethod
+    @profiled("minesweeper.Board.create")
     def create(
         cls, width: int, height: int, n_bombs: int, random_state: Optional[int]
     ) -> "Board":
         """Create a Board with a given size and number of randomly-distributed bombs."""
-        random.seed(random_state)
-        points = [Point(x, y) for x, y in product(range(width), range(height))]
-        bombs = set(random.sample(points, n_bombs))
+        mask = bomb_mask(width, height, n_bombs, random_state)
+        layout = hidden_layout(mask, width, height)
+        count("core.points", len(layout))
         cells = {
-            Cell(
-                p,
-                value=-1 if p in bombs else len(p.borders().intersection(bombs)),
-                state="hidden",
-            )
-            for p in points
+            Cell(Point(i % width, i // width), value=code - 1, state="hidden")
+            for i, code in enumerate(layout)
         }
         return cls(cells)
 
-    def visualize(self) -> str:
+    @profiled("minesweeper.Board.reveal")
+    def reveal(self, point: Point) -> Tuple["Board", List[Cell]]:
+        """
+        Return a new Board by revealing the Cell at a Point, plus the changed Cells.
+
+        Revealing a Cell with a value of zero also reveals its hidden neighbors, and the
+        reveal cascades through every connected Cell with a value of zero. All of the
+        changes are applied to the new Board at once. Revealing a Cell that isn't
+        hidden changes nothing.
+        """
+        cells = self._indexed().locations
+        if point not in cells:
+            raise KeyError(f"{point} is not a location on this board")
+        revealed = flood_fill(
+            point,
+            value=lambda p: cells[p].value,
+            state=lambda p: cells[p].state,
+            neighbors=lambda p: (q for q in p.borders() if q in cells),
+        )
+        changed = [cells[p].reveal() for p in revealed]
+        return self.update(changed), changed
+
+    def flag(self, point: Point) -> Tuple["Board", List[Cell]]:
+        """
+        Return a new Board by flagging the Cell at a Point, plus the changed Cells.
+
+        Flagging a hidden Cell flags it, and flagging a flagged Cell removes the flag.
+        Revealed Cells can't be flagged, so flagging one changes nothing.
+        """
+        cells = self._indexed().locations
+        if point not in cells:
+            raise KeyError(f"{point} is not a location on this board")
+        toggled = cells[point].toggle_flag()
+        changed = [] if toggled is None else [toggled]
+        return self.update(changed), changed
+
+    def update(self, changed: Iterable[Cell]) -> "Board":
+        """Return a new Board by replacing Cells with changed Cells at their locations."""
+        # the new Board takes this Board's index and updates it for the changed Cells,
+        # rather than copying it. This Board builds a new index if it needs one again.
+        index = self.__dict__.pop("_index", None)
+        if index is None:
+            index = BoardIndex(self.cells)
+        new_cells = set(self.cells)
+        for cell in changed:
+            old = index.locations.get(cell.location)
+            if old is not None:
+                new_cells.discard(old)
+            new_cells.add(cell)
+            index.apply((cell,))
+        board = self.__class__(new_cells)
+        board.__dict__["_index"] = index
+        return board
+
+    def _indexed(self) -> BoardIndex:
+        """Return the BoardIndex of this Board, building it the first time."""
+        index = self.__dict__.get("_index")
+        if index is None:
+            index = self.__dict__["_index"] = BoardIndex(self.cells)
+        return index
+
+    def locations(self) -> Dict[Point, Cell]:
+        """Return a dictionary mapping each location on this Board to its Cell."""
+        return dict(self._indexed().locations)
+
+    def viewport(self, viewport: Optional[Viewport] = None) -> Viewport:
+        """Return a Viewport clipped to this Board, or one that covers all of it."""
+        width, height = self.width, self.height
+        if viewport is None:
+            return Viewport(0, 0, width, height)
+        return viewport.clip(width, height)
+
+    def symbol_rows(self, viewport: Optional[Viewport] = None) -> List[List[str]]:
+        """Return the symbols of the Cells in a Viewport, as a list of rows."""
+        return cell_rows(self.cells, self.viewport(viewport))
+
+    def lines(self, viewport: Optional[Viewport] = None) -> Iterator[str]:
+        """Yield the lines of a visualization of this Board, or part of it."""
+        viewport = self.viewport(viewport)
+        return frame(cell_rows(self.cells, viewport), viewport.width)
+
+    def write(self, stream: TextIO, viewport: Optional[Viewport] = None) -> None:
+        """Write a visualization of this Board, or part of it, to a text stream."""
+        write_lines(self.lines(viewport), stream)
+
+    @profiled("minesweeper.Board.visualize")
+    def visualize(self, viewport: Optional[Viewport] = None) -> str:
         """Return a string visualization of the Board and its cells."""
-        border = f"#{'-' * (self.width * 2 - 1)}#"
-        contents = "\n"
-        for row in range(self.height):
-            cells = (c for c in self.cells if c.location.y == row)
-            contents += "|" + "|".join(c.visualize() for c in cells) + "|\n"
-        return border + contents + border
+        return "\n".join(self.lines(viewport))
 
     @property
     def bombs(self) -> int:
         """Return the number of bombs contained in this Board."""
-        return sum(cell.is_bomb() for cell in self.cells)
+        return len(self._indexed().bombs)
 
     @property
     def height(self) -> int:
         """Return the height (y) dimension of this Board."""
-        return max(cell.location.y for cell in self.cells) + 1
+        return self._indexed().height
 
     @property
     def width(self) -> int:
         """Return the width (x) dimension of this Board."""
-        return max(cell.location.x for cell in self.cells) + 1
+        return self._indexed().width
 
     def states(self) -> typing.Counter[str]:
         """Return a dictionary of the states of all Cells in this Board."""
-        return Counter(sorted(cell.state for cell in self.cells))
+        return self._indexed().states()
 
     def bomb_cells(self) -> Set["Cell"]:
         """Return the set of Cells in this Board that contain bombs."""
-        return set(cell for cell in self.cells if cell.is_bomb())
+        return set(self._indexed().bombs)
 
     def safe_cells(self) -> Set["Cell"]:
         """Return the set of Cells in this Board that don't contain bombs."""
-        return set(cell for cell in self.cells if not cell.is_bomb())
+        index = self._indexed()
+        return index.cells() - index.bombs
 
     def flagged_cells(self) -> Set["Cell"]:
         """Return the set of Cells in this Board that have been flagged."""
-        return set(cell for cell in self.cells if cell.state == "flagged")
+        return self._indexed().cells("flagged")
 
     def hidden_cells(self) -> Set["Cell"]:
         """Return the set of Cells in this Board that have been hidden."""
-        return set(cell for cell in self.cells if cell.state == "hidden")
+        return self._indexed().cells("hidden")
 
     def revealed_cells(self) -> Set["Cell"]:
         """Return the set of Cells in this Board that have been revealed."""
-        return set(cell for cell in self.cells if cell.state == "revealed")
+        return self._indexed().cells("revealed")
+
+    def is_won(self) -> bool:
+        """Return a boolean indicating if every Cell without a bomb has been revealed."""
+        return self._indexed().is_won()
+
+    def is_lost(self) -> bool:
+        """Return a boolean indicating if a Cell with a bomb has been revealed."""
+        return self._indexed().is_lost()
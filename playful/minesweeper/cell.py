@@ -1,6 +1,6 @@
 """Minesweeper Cell class"""
 from collections import Counter
-from typing import Dict, Iterable, NamedTuple, Set
+from typing import Dict, Iterable, NamedTuple, Optional, Set
 
 from playful.core import Point
 
@@ -36,7 +36,7 @@ class Cell(NamedTuple):
         """Return a set of the Cells among a group that border this Cell."""
         # we have to pass an iterable of Cells to this function because a Cell has no
         # concept of its neighbors - that only exists in the context of a Board object.
-        return set(cell for cell in cells if cell.location in self.location.borders())
+        return set(cell for cell in cells if self.location.is_border(cell.location))
 
     def neighbor_states(self, cells: Iterable["Cell"]) -> Dict[str, int]:
         """Return a dictionary of the states and counts of this Cell's neighbors."""
@@ -52,6 +52,19 @@ class Cell(NamedTuple):
         """Return a new Cell by flagging this one."""
         return self.__class__(location=self.location, value=self.value, state="flagged")
 
+    def toggle_flag(self) -> Optional["Cell"]:
+        """
+        Return a new Cell by flagging this one if it's hidden, or by removing its flag
+        if it's flagged. Revealed Cells can't be flagged, so return None for them.
+        """
+        if self.state == "hidden":
+            return self.flag()
+        if self.state == "flagged":
+            return self.__class__(
+                location=self.location, value=self.value, state="hidden"
+            )
+        return None
+
     def visualize(self) -> str:
         """Return a string visualization of this cell based on its value and state."""
         if self.state == "hidden":
@@ -0,0 +1,249 @@
+"""
+Generate minesweeper Boards that can be solved without guessing.
+
+A Board is solvable from a first click if the Solver, starting from that click, can
+prove every safe Cell safe, one deduction after another. The generator places bombs at
+random, away from the first click, and plays the Board with the Solver. Play stops as
+soon as the Solver is stuck, and then, rather than starting over with a new Board, some
+of the bombs that the Solver couldn't work out are moved to Cells that play hasn't
+reached yet. Moving a bomb only changes the values of its neighbors, so the Board is
+repaired in place, and play starts again from the first click. Each move clears up the
+part of the Board where play got stuck, so few moves are usually needed; if there is
+no Cell left to move a bomb to, the generator starts over with new bombs.
+
+Boards take a little while to generate, so a BoardPool can generate them ahead of time
+in a pool of processes, and hand out a ready Board on request.
+"""
+from collections import deque
+
+# Future is only used in a string annotation, which pylint doesn't read.
+from concurrent.futures import Future  # pylint: disable=unused-import
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import random
+from typing import Any, Deque, List, Optional, Set
+
+from playful.core import Point
+from playful.core.profiling import count, profiled
+from playful.minesweeper.array_board import ArrayBoard
+from playful.minesweeper.layout import hidden_layout
+from playful.minesweeper.solver import Solver
+
+
+def move_bomb(board: ArrayBoard, source: int, target: int) -> None:
+    """
+    Move the bomb at one buffer index of a hidden ArrayBoard to another, in place,
+    updating the values of the Cells around both.
+    """
+    cells = board.cells
+    if cells[source] & 0x0F or not cells[target] & 0x0F:
+        raise ValueError("a bomb can only be moved to a Cell without a bomb")
+    # place the new bomb first, so the old one's Cell counts it if they're neighbors.
+    for neighbor in board.neighbor_indices(target):
+        if cells[neighbor] & 0x0F:
+            cells[neighbor] += 1
+    cells[target] &= 0xF0
+    neighbors = board.neighbor_indices(source)
+    for neighbor in neighbors:
+        if cells[neighbor] & 0x0F:
+            cells[neighbor] -= 1
+    bombs = sum(not cells[i] & 0x0F for i in neighbors)
+    cells[source] = cells[source] & 0xF0 | bombs + 1
+
+
+def deduce(board: ArrayBoard, start: Point) -> Solver:
+    """
+    Reveal the first click on an ArrayBoard, in place, then keep revealing every Cell
+    that the Solver proves safe, until every safe Cell is revealed or the Solver is
+    stuck. Return the Solver.
+    """
+    solver = Solver(board.to_board())
+    solver.update(board.reveal(start))
+    safe, _ = solver.solve()
+    while safe:
+        for point in sorted(safe):
+            solver.update(board.reveal(point))
+        safe, _ = solver.solve()
+    return solver
+
+
+def random_board(
+    width: int, height: int, n_bombs: int, start: Point, rng: random.Random
+) -> ArrayBoard:
+    """Return a hidden ArrayBoard with bombs placed at random, away from a Point."""
+    board = ArrayBoard(width, height)
+    clear = set(board.neighbor_indices(board.index(start))) | {board.index(start)}
+    places = [i for i in range(len(board)) if i not in clear]
+    if n_bombs > len(places):
+        raise ValueError("too many bombs to keep the first click clear")
+    mask = bytearray(len(board))
+    for index in rng.sample(places, n_bombs):
+        mask[index] = 1
+    return ArrayBoard(width, height, hidden_layout(mask, width, height))
+
+
+def relocate(board: ArrayBoard, played: ArrayBoard, rng: random.Random) -> bool:
+    """
+    Move some of the bombs that the Solver got stuck on, about one in four, to Cells
+    that play never reached.
+
+    Parameters
+    ----------
+    board : ArrayBoard, the hidden Board to change in place
+    played : ArrayBoard, a copy of the Board, played by `deduce` until it got stuck
+    rng : random.Random, chooses which bomb to move and where
+
+    Returns
+    -------
+    A boolean indicating if any bombs were moved. If not, there's nowhere to move them.
+    """
+    cells = played.cells
+    frontier: Set[int] = set()
+    for index, code in enumerate(cells):
+        if code >> 4 == 1:  # revealed
+            neighbors = played.neighbor_indices(index)
+            frontier.update(j for j in neighbors if cells[j] >> 4 != 1)
+    sources = sorted(i for i in frontier if not cells[i] & 0x0F)
+    unknown = [i for i, code in enumerate(cells) if code >> 4 != 1 and code & 0x0F]
+    # prefer Cells that play hasn't reached, but a safe Cell on the frontier will do.
+    targets = [i for i in unknown if i not in frontier] or unknown
+    if not sources or not targets:
+        return False
+    moves = min(max(1, len(sources) // 4), len(targets))
+    for source, target in zip(rng.sample(sources, moves), rng.sample(targets, moves)):
+        move_bomb(board, source, target)
+    return True
+
+
+@profiled("minesweeper.generator.generate")
+def generate(  # pylint: disable=too-many-arguments
+    width: int,
+    height: int,
+    n_bombs: int,
+    start: Point,
+    seed: Optional[int] = None,
+    max_attempts: int = 100,
+) -> ArrayBoard:
+    """
+    Return a hidden ArrayBoard that the Solver can solve, without guessing, from a
+    first click at a Point. The first click and its neighbors never hold a bomb.
+
+    Parameters
+    ----------
+    width : int, the width (x) dimension of the Board
+    height : int, the height (y) dimension of the Board
+    n_bombs : int, the number of bombs on the Board
+    start : Point, the location of the first click
+    seed : Optional[int], default None, the seed of the random generator, so the same
+        arguments always generate the same Board
+    max_attempts : int, default 100, the most Boards to start from, before giving up
+
+    Examples
+    --------
+    >>> board = generate(9, 9, 10, start=Point(4, 4), seed=0)
+    >>> board.bombs, board.states()
+    (10, Counter({'hidden': 81}))
+    >>> solver = deduce(board.copy(), Point(4, 4))
+    >>> len(solver.bombs), len(solver.safe)
+    (10, 0)
+    """
+    rng = random.Random(seed)
+    for _ in range(max_attempts):
+        count("minesweeper.generator.boards")
+        board = random_board(width, height, n_bombs, start, rng)
+        while True:
+            played = board.copy()
+            deduce(played, start)
+            if played.states()["revealed"] == len(played) - n_bombs:
+                return board
+            count("minesweeper.generator.relocations")
+            if not relocate(board, played, rng):
+                break
+    raise ValueError(f"no solvable board was found in {max_attempts} attempts")
+
+
+def board_seeds(n_boards: int, seed: int) -> List[int]:
+    """Return the seed of each Board in a series, derived from the seed of the series."""
+    rng = random.Random(seed)
+    return [rng.getrandbits(32) for _ in range(n_boards)]
+
+
+class BoardPool:
+    """
+    A BoardPool keeps solvable Boards ready, generating more as they're taken.
+
+    Parameters
+    ----------
+    width : int, the width (x) dimension of each Board
+    height : int, the height (y) dimension of each Board
+    n_bombs : int, the number of bombs on each Board
+    start : Point, the location of the first click on each Board
+    size : int, default 4, the number of Boards to generate ahead of time
+    seed : int, default 0, the seed from which the seed of every Board is derived
+    workers : Optional[int], default 1, the number of worker processes. If 1, generate
+        each Board in this process when it's requested, without generating ahead. If
+        None, use the number of processors on the machine.
+
+    Examples
+    --------
+    >>> with BoardPool(9, 9, 10, start=Point(0, 0), seed=1) as pool:
+    ...     board = pool.get()
+    >>> board.state(Point(0, 0)), board.bombs
+    ('hidden', 10)
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        width: int,
+        height: int,
+        n_bombs: int,
+        start: Point,
+        size: int = 4,
+        seed: int = 0,
+        workers: Optional[int] = 1,
+    ) -> None:
+        self.generate = partial(generate, width, height, n_bombs, start)
+        self.size = size
+        self._rng = random.Random(seed)
+        self._ready: Deque["Future[ArrayBoard]"] = deque()
+        self._executor = None if workers == 1 else ProcessPoolExecutor(workers)
+        self._fill()
+
+    def __repr__(self) -> str:
+        """Return a string representation of this BoardPool."""
+        return f"{self.__class__.__qualname__}(size={self.size})"
+
+    def __enter__(self) -> "BoardPool":
+        """Return this BoardPool, which is closed when the block ends."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Close this BoardPool."""
+        self.close()
+
+    def _seed(self) -> int:
+        """Return the seed of the next Board."""
+        return self._rng.getrandbits(32)
+
+    def _fill(self) -> None:
+        """Start generating Boards until enough are ready or on the way."""
+        if self._executor is not None:
+            while len(self._ready) < self.size:
+                self._ready.append(self._executor.submit(self.generate, self._seed()))
+
+    def get(self) -> ArrayBoard:
+        """Return the next solvable Board, and start generating another."""
+        if self._executor is None:
+            return self.generate(self._seed())
+        board = self._ready.popleft().result()
+        self._fill()
+        return board
+
+    def close(self) -> None:
+        """Stop generating Boards, and shut down the worker processes."""
+        if self._executor is not None:
+            for future in self._ready:
+                future.cancel()
+            self._ready.clear()
+            self._executor.shutdown()
+            self._executor = None
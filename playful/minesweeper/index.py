@@ -0,0 +1,105 @@
+"""
+An index of the Cells on a minesweeper Board, kept up to date as the game is played.
+
+A Board is a plain set of Cells, so answering a question like "which Cells are still
+hidden?" means looking at every Cell. A BoardIndex groups the Cells by location, by
+state and by whether they hold a bomb, and counts the bombs that have been revealed,
+so those questions, and whether the game has been won or lost, are answered without a
+scan. Each move replaces a few Cells, and the index is updated for those Cells only.
+"""
+from collections import Counter
+import typing
+from typing import Dict, Iterable, Optional, Set
+
+from playful.core import Point
+from playful.minesweeper.cell import Cell
+
+STATES = ("flagged", "hidden", "revealed")
+
+
+class BoardIndex:
+    """
+    A BoardIndex groups the Cells of a Board by location, state and bomb.
+
+    Parameters
+    ----------
+    cells : Iterable[Cell], the Cells of a Board
+
+    Examples
+    --------
+    >>> index = BoardIndex(
+    ...     [Cell(Point(0, 0), -1, "hidden"), Cell(Point(1, 0), 1, "hidden")]
+    ... )
+    >>> index.apply([Cell(Point(1, 0), 1, "revealed")])
+    >>> index.states()
+    Counter({'hidden': 1, 'revealed': 1})
+    >>> index.is_won(), index.is_lost()
+    (True, False)
+    """
+
+    def __init__(self, cells: Iterable[Cell] = ()) -> None:
+        self.locations: Dict[Point, Cell] = {}
+        self.by_state: Dict[str, Set[Cell]] = {state: set() for state in STATES}
+        self.bombs: Set[Cell] = set()
+        self.exploded = 0
+        self.width = self.height = 0
+        self.apply(cells)
+
+    def __repr__(self) -> str:
+        """Return a string representation of this BoardIndex."""
+        return f"{self.__class__.__qualname__}(cells={len(self.locations)})"
+
+    def __len__(self) -> int:
+        """Return the number of Cells in this BoardIndex."""
+        return len(self.locations)
+
+    def apply(self, changed: Iterable[Cell]) -> None:
+        """Replace the Cells at the locations of changed Cells, in place."""
+        for cell in changed:
+            old = self.locations.get(cell.location)
+            if old is not None:
+                self._discard(old)
+            self._add(cell)
+
+    def _add(self, cell: Cell) -> None:
+        """Add a Cell to every group it belongs to."""
+        location = cell.location
+        self.locations[location] = cell
+        self.by_state.setdefault(cell.state, set()).add(cell)
+        if cell.is_bomb():
+            self.bombs.add(cell)
+            self.exploded += cell.state == "revealed"
+        self.width = max(self.width, location.x + 1)
+        self.height = max(self.height, location.y + 1)
+
+    def _discard(self, cell: Cell) -> None:
+        """Remove a Cell from every group it belongs to."""
+        self.by_state[cell.state].discard(cell)
+        if cell.is_bomb():
+            self.bombs.discard(cell)
+            self.exploded -= cell.state == "revealed"
+
+    def cells(self, state: Optional[str] = None) -> Set[Cell]:
+        """Return a new set of the Cells with a state, or of every Cell."""
+        if state is None:
+            return set(self.locations.values())
+        return set(self.by_state.get(state, ()))
+
+    def states(self) -> typing.Counter[str]:
+        """Return a dictionary of the number of Cells in each state."""
+        return Counter(
+            {
+                state: len(cells)
+                for state, cells in sorted(self.by_state.items())
+                if cells
+            }
+        )
+
+    def is_won(self) -> bool:
+        """Return a boolean indicating if every Cell without a bomb has been revealed."""
+        revealed = len(self.by_state["revealed"])
+        return not self.exploded and revealed == len(self.locations) - len(self.bombs)
+
+    def is_lost(self) -> bool:
+        """Return a boolean indicating if a Cell with a bomb has been revealed."""
+        return self.exploded > 0
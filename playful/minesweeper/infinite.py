@@ -0,0 +1,294 @@
+"""
+Unbounded minesweeper fields, generated one chunk at a time.
+
+An InfiniteBoard has no edges. It is divided into square chunks, and the bombs in each
+chunk are placed by a random generator seeded with the board's seed and the chunk's
+coordinates, so any chunk can be rebuilt, identically, at any time. Nothing is built up
+front: a chunk is generated the first time a reveal, a rendering or a lookup touches
+it, and the least recently used chunks are discarded when too many are held in memory.
+
+Only the layout of each chunk, its bombs and values, is ever discarded. Moves are
+stored separately, as the states of the chunks that the player has changed, and those
+are always kept.
+"""
+from collections import Counter, OrderedDict
+import random
+import typing
+from typing import Dict, Iterator, List, Optional, Set, TextIO, Tuple
+
+from playful.core import Point
+from playful.core.profiling import count, profiled
+from playful.minesweeper.array_board import STATE_CODES, STATES, SYMBOLS
+from playful.minesweeper.cell import Cell
+from playful.minesweeper.layout import hidden_layout
+from playful.minesweeper.render import Viewport, frame, write_lines
+from playful.minesweeper.reveal import flood_fill
+
+# below this density of bombs, connected regions of zeros can go on without end, so a
+# single reveal could cascade forever.
+MIN_DENSITY = 0.15
+
+Chunk = Tuple[int, int]
+
+
+class InfiniteBoard:  # pylint: disable=too-many-instance-attributes
+    """
+    A minesweeper Board that extends without limit in every direction.
+
+    Reveals and flags change the board in place and return the changed Cells, like
+    `ArrayBoard`. Any Point, including negative coordinates, is on the board.
+
+    Parameters
+    ----------
+    seed : int, the seed that places every bomb on the board
+    density : float, default 0.2, the fraction of each chunk's Cells that are bombs,
+        from MIN_DENSITY up to, but not including, 1
+    chunk_size : int, default 32, the width and height of each chunk
+    max_chunks : int, default 1024, the most chunk layouts to keep in memory
+
+    Examples
+    --------
+    >>> board = InfiniteBoard(seed=0, density=0.2, chunk_size=8)
+    >>> print(board.visualize(Viewport(-2, -2, 4, 2)))
+    #-------#
+    |?|?|?|?|
+    |?|?|?|?|
+    #-------#
+    >>> board[Point(10**12, -(10**12))].state
+    'hidden'
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        density: float = 0.2,
+        chunk_size: int = 32,
+        max_chunks: int = 1024,
+    ) -> None:
+        if not MIN_DENSITY <= density < 1:
+            raise ValueError(f"density must be at least {MIN_DENSITY} and below 1")
+        if chunk_size < 1 or max_chunks < 1:
+            raise ValueError("chunk_size and max_chunks must be at least 1")
+        self.seed = seed
+        self.density = density
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        # layouts and bomb masks of recently used chunks, least recently used first.
+        self._layouts: "OrderedDict[Chunk, bytes]" = OrderedDict()
+        self._masks: "OrderedDict[Chunk, bytes]" = OrderedDict()
+        # the state of every Cell in each chunk the player has changed, as packed bytes.
+        self._states: Dict[Chunk, bytearray] = {}
+        self._counts = [0] * len(STATES)
+        self._exploded = 0
+
+    def __repr__(self) -> str:
+        """Return a string representation of this InfiniteBoard."""
+        attributes = dict(
+            seed=self.seed,
+            density=self.density,
+            chunks=len(self._layouts),
+            **self.states(),
+        )
+        attrs = ", ".join(f"{k}={repr(v)}" for k, v in attributes.items())
+        return f"{self.__class__.__qualname__}({attrs})"
+
+    def __contains__(self, point: object) -> bool:
+        """Return a boolean indicating if a Point is on this InfiniteBoard."""
+        return isinstance(point, tuple) and len(point) == 2
+
+    def __getitem__(self, point: Point) -> Cell:
+        """Return the Cell at a Point."""
+        return self.cell(point)
+
+    def chunk(self, point: Point) -> Tuple[Chunk, int]:
+        """Return the coordinates of the chunk that holds a Point, and its offset."""
+        size = self.chunk_size
+        chunk_x, x = divmod(point.x, size)
+        chunk_y, y = divmod(point.y, size)
+        return (chunk_x, chunk_y), y * size + x
+
+    def mask(self, chunk: Chunk) -> bytes:
+        """Return the bombs of a chunk, as a byte of 1 for each bomb and 0 otherwise."""
+        mask = self._cached(self._masks, chunk)
+        if mask is None:
+            size = self.chunk_size * self.chunk_size
+            rng = random.Random(f"{self.seed}:{chunk[0]}:{chunk[1]}")
+            bombs = bytearray(size)
+            for index in rng.sample(range(size), round(self.density * size)):
+                bombs[index] = 1
+            mask = self._store(self._masks, chunk, bytes(bombs))
+        return mask
+
+    def layout(self, chunk: Chunk) -> bytes:
+        """Return the value of each Cell in a chunk plus one, with bombs stored as 0."""
+        layout = self._cached(self._layouts, chunk)
+        if layout is None:
+            count("minesweeper.InfiniteBoard.chunks")
+            # lay out the chunk with a one-Cell margin taken from its eight neighbors,
+            # so that Cells along its edges count the bombs across the border.
+            size, (chunk_x, chunk_y) = self.chunk_size, chunk
+            padded = bytearray()
+            for dy in (-1, 0, 1):
+                masks = [self.mask((chunk_x + dx, chunk_y + dy)) for dx in (-1, 0, 1)]
+                rows = range(size) if dy == 0 else [size - 1 if dy < 0 else 0]
+                for row in rows:
+                    start = row * size
+                    padded.append(masks[0][start + size - 1])
+                    padded += masks[1][start : start + size]
+                    padded.append(masks[2][start])
+            codes = hidden_layout(padded, size + 2, size + 2)
+            layout = b"".join(
+                codes[(y + 1) * (size + 2) + 1 : (y + 2) * (size + 2) - 1]
+                for y in range(size)
+            )
+            layout = self._store(self._layouts, chunk, layout)
+        return layout
+
+    @staticmethod
+    def _cached(cache: "OrderedDict[Chunk, bytes]", chunk: Chunk) -> Optional[bytes]:
+        """Return a chunk's entry in a cache and mark it as recently used, or None."""
+        entry = cache.get(chunk)
+        if entry is not None:
+            cache.move_to_end(chunk)
+        return entry
+
+    def _store(
+        self, cache: "OrderedDict[Chunk, bytes]", chunk: Chunk, entry: bytes
+    ) -> bytes:
+        """Store a chunk's entry in a cache, discarding the least recently used."""
+        cache[chunk] = entry
+        while len(cache) > self.max_chunks:
+            cache.popitem(last=False)
+        return entry
+
+    def code(self, point: Point) -> int:
+        """Return the Cell at a Point, packed into a byte as by `encode_cell`."""
+        chunk, offset = self.chunk(point)
+        states = self._states.get(chunk)
+        state = states[offset] if states is not None else 0
+        return state | self.layout(chunk)[offset]
+
+    def cell(self, point: Point) -> Cell:
+        """Return the Cell at a Point."""
+        code = self.code(point)
+        return Cell(point, (code & 0x0F) - 1, STATES[code >> 4])
+
+    def value(self, point: Point) -> int:
+        """Return the value of the Cell at a Point."""
+        return (self.code(point) & 0x0F) - 1
+
+    def state(self, point: Point) -> str:
+        """Return the state of the Cell at a Point."""
+        return STATES[self.code(point) >> 4]
+
+    def neighbors(self, point: Point) -> Set[Cell]:
+        """Return a set of the Cells that border a Point."""
+        return {self.cell(p) for p in point.borders()}
+
+    def set_state(self, point: Point, state: str) -> Cell:
+        """Change the state of the Cell at a Point in place, and return the new Cell."""
+        chunk, offset = self.chunk(point)
+        states = self._states.get(chunk)
+        if states is None:
+            states = self._states[chunk] = bytearray(self.chunk_size ** 2)
+        value = self.layout(chunk)[offset] - 1
+        old, new = states[offset] >> 4, STATE_CODES[state]
+        self._counts[old] -= 1
+        self._counts[new] += 1
+        if value == -1:
+            revealed = STATE_CODES["revealed"]
+            self._exploded += (new == revealed) - (old == revealed)
+        states[offset] = new << 4
+        return Cell(point, value, state)
+
+    @profiled("minesweeper.InfiniteBoard.reveal")
+    def reveal(self, point: Point) -> List[Cell]:
+        """
+        Reveal the Cell at a Point in place, and return the list of changed Cells.
+
+        Reveals cascade through Cells with a value of zero in the same way as
+        `Board.reveal`, generating chunks as the cascade reaches them.
+        """
+        revealed = flood_fill(
+            point,
+            value=self.value,
+            state=self.state,
+            neighbors=lambda p: p.borders(),
+        )
+        return [self.set_state(p, "revealed") for p in revealed]
+
+    def flag(self, point: Point) -> List[Cell]:
+        """
+        Flag the Cell at a Point in place, and return the list of changed Cells.
+
+        Flags are toggled in the same way as `Board.flag`.
+        """
+        state = self.state(point)
+        if state == "hidden":
+            return [self.set_state(point, "flagged")]
+        if state == "flagged":
+            return [self.set_state(point, "hidden")]
+        return []
+
+    def symbol_rows(self, viewport: Viewport) -> Iterator[str]:
+        """
+        Yield the symbols of the Cells in a Viewport, one row at a time.
+
+        Each row is built from whole slices of the chunks it crosses, and translated
+        straight from packed bytes, without creating Cells.
+        """
+        left, top, width, height = viewport
+        for y in range(top, top + height):
+            codes = self._row_codes(left, left + width, y)
+            yield codes.translate(SYMBOLS).decode("ascii")
+
+    def _row_codes(self, start: int, stop: int, y: int) -> bytes:
+        """Return the packed Cells of a row, from one x coordinate up to another."""
+        size = self.chunk_size
+        codes = bytearray()
+        x = start
+        while x < stop:
+            chunk, offset = self.chunk(Point(x, y))
+            end = offset + min(size - offset % size, stop - x)
+            piece = self.layout(chunk)[offset:end]
+            states = self._states.get(chunk)
+            if states is not None:
+                mixed = int.from_bytes(piece, "little")
+                mixed |= int.from_bytes(states[offset:end], "little")
+                piece = mixed.to_bytes(end - offset, "little")
+            codes += piece
+            x += end - offset
+        return bytes(codes)
+
+    def lines(self, viewport: Viewport) -> Iterator[str]:
+        """Yield the lines of a visualization of a Viewport of this InfiniteBoard."""
+        return frame(self.symbol_rows(viewport), viewport.width)
+
+    def write(self, stream: TextIO, viewport: Viewport) -> None:
+        """Write a visualization of a Viewport of this InfiniteBoard to a text stream."""
+        write_lines(self.lines(viewport), stream)
+
+    def visualize(self, viewport: Viewport) -> str:
+        """Return a string visualization of a Viewport of this InfiniteBoard."""
+        return "\n".join(self.lines(viewport))
+
+    def states(self) -> typing.Counter[str]:
+        """
+        Return a dictionary of the number of Cells that have been revealed or flagged.
+        Every other Cell, of which there are infinitely many, is hidden.
+        """
+        return Counter(
+            {
+                state: n
+                for state, n in sorted(zip(STATES, self._counts))
+                if n > 0 and state != "hidden"
+            }
+        )
+
+    def chunks(self) -> int:
+        """Return the number of chunk layouts held in memory."""
+        return len(self._layouts)
+
+    def is_lost(self) -> bool:
+        """Return a boolean indicating if a Cell with a bomb has been revealed."""
+        return self._exploded > 0
@@ -0,0 +1,69 @@
+"""
+Fast generation of minesweeper bomb layouts.
+
+A layout is a flat, row-major buffer with one byte per Cell, where Cell (x, y) is at
+index `y * width + x`. Neighbor counts are computed for a whole row at a time: each row
+of bombs is read as one large integer with a byte per Cell, so shifting that integer by
+a byte moves every bomb one Cell sideways, and adding shifted rows together sums the
+3x3 neighborhood of every Cell at once. No count can exceed 9, so bytes never carry
+into each other.
+"""
+import random
+from typing import List, Optional
+
+
+def bomb_mask(
+    width: int,
+    height: int,
+    n_bombs: int,
+    random_state: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+) -> bytearray:
+    """
+    Return a layout with a byte of 1 for each randomly-placed bomb, and 0 otherwise.
+
+    Bombs are placed exactly where `Board.create` places them for the same arguments:
+    the global random generator is seeded with `random_state`, then bombs are sampled
+    from the Points of the Board in (x, y) order. If a generator is given as `rng`,
+    bombs are sampled from it instead and `random_state` is ignored, so the global
+    generator is left alone, and concurrent callers can't reseed each other. A
+    `random.Random(random_state)` places bombs where the global generator would.
+    """
+    if rng is None:
+        random.seed(random_state)
+        sample = random.sample
+    else:
+        sample = rng.sample
+    mask = bytearray(width * height)
+    for index in sample(range(width * height), n_bombs):
+        x, y = divmod(index, height)
+        mask[y * width + x] = 1
+    return mask
+
+
+def hidden_layout(mask: bytearray, width: int, height: int) -> bytearray:
+    """
+    Return a layout of hidden Cells, with the value of each Cell plus one in each byte.
+
+    Bombs are stored as zero, and other Cells store one more than the number of bombs
+    that border them, which is how `ArrayBoard` encodes hidden Cells.
+    """
+    full = (1 << 8 * width) - 1
+    ones = int.from_bytes(b"\x01" * width, "little")
+    rows: List[int] = [
+        int.from_bytes(mask[y * width : (y + 1) * width], "little")
+        for y in range(height)
+    ]
+    sums = [(row + (row << 8) + (row >> 8)) & full for row in rows]
+
+    out = bytearray()
+    for y, row in enumerate(rows):
+        total = sums[y]
+        if y > 0:
+            total += sums[y - 1]
+        if y < height - 1:
+            total += sums[y + 1]
+        # remove each Cell from its own neighborhood, add one, then zero out bombs.
+        codes = (total - row + ones) & ~(row * 0xFF)
+        out += codes.to_bytes(width, "little")
+    return out
@@ -0,0 +1,320 @@
+"""
+Persistent minesweeper Board, for branching games cheaply.
+
+A PersistentBoard packs its Cells into bytes in the same way as an ArrayBoard, but
+splits them into small, immutable chunks that are the leaves of a wide trie. A move
+copies only the chunks it changes, plus the few trie nodes on the path from the root to
+each of them, and shares everything else with the Board it came from. Every Board stays
+valid after a move, so a solver can explore many hypothetical moves from the same
+position, or keep a complete undo history, using a few hundred bytes per move rather
+than a copy of the whole Board.
+"""
+from collections import Counter
+import typing
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from playful.core import Point
+from playful.core.profiling import profiled
+from playful.minesweeper.array_board import (
+    EXPLODED,
+    STATE_CODES,
+    STATES,
+    SYMBOLS,
+    ArrayBoard,
+    PackedBoard,
+    encode_cell,
+)
+from playful.minesweeper.board import Board
+from playful.minesweeper.cell import Cell
+from playful.minesweeper.layout import bomb_mask, hidden_layout
+from playful.minesweeper.render import Viewport
+from playful.minesweeper.reveal import flood_fill
+
+CHUNK = 64  # Cells per leaf
+BITS = 5  # each trie node has up to 2 ** BITS children
+MASK = (1 << BITS) - 1
+
+# a trie node is a tuple of child nodes, or of chunks at the lowest level
+Node = Tuple[Any, ...]
+
+
+def build_trie(chunks: List[bytes]) -> Tuple[Node, int]:
+    """Return the root and the number of levels of a trie that holds chunks in order."""
+    nodes: List[Any] = list(chunks)
+    depth = 0
+    while depth == 0 or len(nodes) > 1:
+        width = 1 << BITS
+        nodes = [tuple(nodes[i : i + width]) for i in range(0, len(nodes), width)]
+        depth += 1
+    return (nodes[0] if nodes else ()), depth
+
+
+def assoc(node: Node, level: int, chunks: Dict[int, bytes]) -> Node:
+    """
+    Return a copy of a trie node with some chunks replaced, sharing the rest.
+
+    Parameters
+    ----------
+    node : Node, the trie node to copy
+    level : int, the level of the node, where nodes holding chunks are level 0
+    chunks : Dict[int, bytes], the new chunks, by chunk number
+    """
+    children = list(node)
+    shift = BITS * level
+    groups: Dict[int, Dict[int, bytes]] = {}
+    for number, chunk in chunks.items():
+        groups.setdefault(number >> shift & MASK, {})[number] = chunk
+    for slot, group in groups.items():
+        if level == 0:
+            (children[slot],) = group.values()
+        else:
+            children[slot] = assoc(children[slot], level - 1, group)
+    return tuple(children)
+
+
+class PersistentBoard(PackedBoard):  # pylint: disable=too-many-public-methods
+    """
+    An immutable minesweeper Board that shares unchanged Cells with earlier Boards.
+
+    Cell (x, y) is stored at index `y * width + x`, in chunk `index // CHUNK`. Moves
+    return a new PersistentBoard and leave this one unchanged, like `Board`. Use
+    `create` or one of the `from_` methods, rather than building the trie directly.
+
+    Parameters
+    ----------
+    width : int, the width (x) dimension of the Board
+    height : int, the height (y) dimension of the Board
+    root : Node, the root of the trie of packed chunks
+    depth : int, the number of levels in the trie
+    counts : Tuple[int, ...], the number of Cells in each state, ordered as STATES
+    bombs : int, the number of bombs on the Board
+    exploded : int, the number of bombs that have been revealed
+
+    Examples
+    --------
+    >>> board = PersistentBoard.create(4, 3, 2, random_state=0)
+    >>> branch, changed = board.reveal(Point(3, 0))
+    >>> [cell.state for cell in changed]
+    ['revealed']
+    >>> board.state(Point(3, 0)), branch.state(Point(3, 0))
+    ('hidden', 'revealed')
+    """
+
+    __slots__ = ("width", "height", "root", "depth", "counts", "bombs", "exploded")
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        width: int,
+        height: int,
+        root: Node,
+        depth: int,
+        counts: Tuple[int, ...],
+        bombs: int,
+        exploded: int = 0,
+    ) -> None:
+        self.width = width
+        self.height = height
+        self.root = root
+        self.depth = depth
+        self.counts = counts
+        self.bombs = bombs
+        self.exploded = exploded
+
+    def __eq__(self, other: object) -> bool:
+        """Return a boolean indicating if two PersistentBoards hold the same Cells."""
+        if not isinstance(other, PersistentBoard):
+            return NotImplemented
+        mine = (self.width, self.height, self.root)
+        return mine == (other.width, other.height, other.root)
+
+    @classmethod
+    def from_buffer(cls, width: int, height: int, cells: Any) -> "PersistentBoard":
+        """Create a PersistentBoard from a buffer of Cells packed as by `encode_cell`."""
+        cells = bytes(cells)
+        if len(cells) != width * height:
+            raise ValueError("the number of cells must equal width * height")
+        counts = [0] * len(STATES)
+        bombs = exploded = 0
+        tally: "typing.Counter[int]" = Counter(cells)
+        for code, count in tally.items():
+            counts[code >> 4] += count
+            if code & 0x0F == 0:
+                bombs += count
+                exploded += count if code == EXPLODED else 0
+        chunks = [cells[i : i + CHUNK] for i in range(0, len(cells), CHUNK)]
+        root, depth = build_trie(chunks)
+        return cls(width, height, root, depth, tuple(counts), bombs, exploded)
+
+    @classmethod
+    @profiled("minesweeper.PersistentBoard.create")
+    def create(
+        cls, width: int, height: int, n_bombs: int, random_state: Optional[int]
+    ) -> "PersistentBoard":
+        """
+        Create a PersistentBoard with a given size and number of random bombs.
+
+        For the same arguments, the bombs are placed exactly where `Board.create` places
+        them.
+        """
+        mask = bomb_mask(width, height, n_bombs, random_state)
+        return cls.from_buffer(width, height, hidden_layout(mask, width, height))
+
+    @classmethod
+    def from_array_board(cls, board: ArrayBoard) -> "PersistentBoard":
+        """Create a PersistentBoard from an ArrayBoard."""
+        return cls.from_buffer(board.width, board.height, board.cells)
+
+    @classmethod
+    def from_cells(cls, cells: Iterable[Cell]) -> "PersistentBoard":
+        """Create a PersistentBoard from a collection of Cells that covers a rectangle."""
+        return cls.from_array_board(ArrayBoard.from_cells(cells))
+
+    @classmethod
+    def from_board(cls, board: Board) -> "PersistentBoard":
+        """Create a PersistentBoard from a Board."""
+        return cls.from_cells(board.cells)
+
+    def to_array_board(self) -> ArrayBoard:
+        """Return an ArrayBoard, which can be changed in place, with the same Cells."""
+        return ArrayBoard(self.width, self.height, bytearray(self.packed()))
+
+    def to_cells(self) -> Set[Cell]:
+        """Return a set of the Cells in this PersistentBoard."""
+        return {self._cell(i, code) for i, code in enumerate(self.packed())}
+
+    def to_board(self) -> Board:
+        """Return a Board containing the Cells in this PersistentBoard."""
+        return Board(self.to_cells())
+
+    def chunks(self) -> Iterator[bytes]:
+        """Yield the packed chunks of this PersistentBoard, in order."""
+        stack: List[Any] = [self.root]
+        for _ in range(self.depth):
+            stack = [child for node in stack for child in node]
+        return iter(stack)
+
+    def packed(self, start: int = 0, stop: Optional[int] = None) -> bytes:
+        """Return the packed Cells from one buffer index up to another."""
+        stop = len(self) if stop is None else stop
+        if start == 0 and stop == len(self):
+            return b"".join(self.chunks())
+        first, last = start // CHUNK, (stop - 1) // CHUNK
+        data = b"".join(self._chunk(n) for n in range(first, last + 1))
+        offset = first * CHUNK
+        return data[start - offset : stop - offset]
+
+    def _chunk(self, number: int) -> bytes:
+        """Return a chunk by its number."""
+        node = self.root
+        for level in range(self.depth - 1, -1, -1):
+            node = node[number >> BITS * level & MASK]
+        return typing.cast(bytes, node)
+
+    def code(self, index: int) -> int:
+        """Return the packed byte of the Cell at a buffer index."""
+        return self._chunk(index // CHUNK)[index % CHUNK]
+
+    def cell_at(self, index: int) -> Cell:
+        """Return the Cell at a buffer index."""
+        return self._cell(index, self.code(index))
+
+    def _cell(self, index: int, code: int) -> Cell:
+        """Return the Cell at a buffer index, from its packed byte."""
+        return Cell(self.point(index), (code & 0x0F) - 1, STATES[code >> 4])
+
+    def value(self, point: Point) -> int:
+        """Return the value of the Cell at a Point."""
+        return (self.code(self.index(point)) & 0x0F) - 1
+
+    def state(self, point: Point) -> str:
+        """Return the state of the Cell at a Point."""
+        return STATES[self.code(self.index(point)) >> 4]
+
+    @profiled("minesweeper.PersistentBoard.reveal")
+    def reveal(self, point: Point) -> Tuple["PersistentBoard", List[Cell]]:
+        """
+        Return a new PersistentBoard by revealing the Cell at a Point, plus the changed
+        Cells. Reveals cascade in the same way as `Board.reveal`.
+        """
+        code = self.code
+        revealed = flood_fill(
+            self.index(point),
+            value=lambda i: (code(i) & 0x0F) - 1,
+            state=lambda i: STATES[code(i) >> 4],
+            neighbors=self.neighbor_indices,
+        )
+        changed = [self._cell(i, code(i))._replace(state="revealed") for i in revealed]
+        return self.update(changed), changed
+
+    def flag(self, point: Point) -> Tuple["PersistentBoard", List[Cell]]:
+        """
+        Return a new PersistentBoard by flagging the Cell at a Point, plus the changed
+        Cells. Flags are toggled in the same way as `Board.flag`.
+        """
+        toggled = self.cell(point).toggle_flag()
+        changed = [] if toggled is None else [toggled]
+        return self.update(changed), changed
+
+    def update(self, changed: Iterable[Cell]) -> "PersistentBoard":
+        """
+        Return a new PersistentBoard by replacing Cells with changed Cells at their
+        locations. Only the chunks that hold a changed Cell are copied.
+        """
+        codes = {
+            self.index(cell.location): encode_cell(cell.value, cell.state)
+            for cell in changed
+        }
+        if not codes:
+            return self
+        counts = list(self.counts)
+        bombs, exploded = self.bombs, self.exploded
+        chunks: Dict[int, bytearray] = {}
+        for index, new in codes.items():
+            number, offset = divmod(index, CHUNK)
+            if number not in chunks:
+                chunks[number] = bytearray(self._chunk(number))
+            old = chunks[number][offset]
+            chunks[number][offset] = new
+            counts[old >> 4] -= 1
+            counts[new >> 4] += 1
+            bombs += (new & 0x0F == 0) - (old & 0x0F == 0)
+            exploded += (new == EXPLODED) - (old == EXPLODED)
+        frozen = {number: bytes(chunk) for number, chunk in chunks.items()}
+        root = assoc(self.root, self.depth - 1, frozen)
+        return self.__class__(
+            self.width, self.height, root, self.depth, tuple(counts), bombs, exploded
+        )
+
+    def symbol_rows(self, viewport: Optional[Viewport] = None) -> Iterator[str]:
+        """Yield the symbols of the Cells in a Viewport, one row at a time."""
+        x, y, width, height = self.viewport(viewport)
+        start = y * self.width + x
+        stop = start + (height - 1) * self.width + width
+        codes = self.packed(start, stop) if width and height else b""
+        for row in range(height):
+            offset = row * self.width
+            yield codes[offset : offset + width].translate(SYMBOLS).decode("ascii")
+
+    def states(self) -> typing.Counter[str]:
+        """Return a dictionary of the states of all Cells in this PersistentBoard."""
+        return Counter(
+            {state: count for state, count in sorted(zip(STATES, self.counts)) if count}
+        )
+
+    def is_won(self) -> bool:
+        """Return a boolean indicating if every Cell without a bomb has been revealed."""
+        revealed = self.counts[STATE_CODES["revealed"]]
+        return not self.exploded and revealed == len(self) - self.bombs
+
+    def is_lost(self) -> bool:
+        """Return a boolean indicating if a Cell with a bomb has been revealed."""
+        return self.exploded > 0
@@ -0,0 +1,337 @@
+"""
+Bomb probabilities for the hidden Cells of a minesweeper Board.
+
+When no hidden Cell is provably safe, the next best move is the Cell least likely to
+hold a bomb. Revealed numbers only constrain the hidden Cells that border them (the
+frontier), and the frontier splits into connected components whose constraints don't
+share any Cells. Each component is solved on its own:
+
+* exactly, by enumerating every consistent assignment of bombs with backtracking, and
+  memoizing on the bomb counts still required by each constraint; or
+* approximately, by seeded sequential importance sampling of random assignments, when
+  the component has too many Cells to enumerate.
+
+Both methods produce a table that maps a number of bombs in the component to the
+(relative) number of assignments with that many bombs, and how often each Cell holds
+a bomb among them. The tables are then combined, weighting each total number of
+frontier bombs by the number of ways to place the remaining bombs among the Cells
+that no number constrains.
+"""
+from collections import defaultdict
+from math import exp, lgamma
+import random
+from time import perf_counter
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from playful.core import Point
+from playful.minesweeper.board import Board
+
+# a table maps a number of bombs to (weight, per-cell bomb weights)
+Table = Dict[int, Tuple[float, Tuple[float, ...]]]
+Counts = Dict[int, Tuple[int, Tuple[int, ...]]]
+
+
+class Component(NamedTuple):
+    """A Component is a group of frontier Cells that share constraints."""
+
+    cells: Tuple[Point, ...]
+    constraints: Tuple[Tuple[Tuple[int, ...], int], ...]
+
+
+class ComponentResult(NamedTuple):
+    """The solved table of a Component, plus how it was solved and how long it took."""
+
+    component: Component
+    method: str
+    seconds: float
+    table: Table
+
+
+def frontier_components(board: Board) -> Tuple[List[Component], Set[Point]]:
+    """
+    Return the independent frontier components of a Board, and the unknown Cells that
+    no revealed number constrains.
+
+    Unknown Cells are those that are hidden or flagged. Each constraint is stored as a
+    tuple of indexes into its Component's Cells, and the number of bombs among them.
+    """
+    cells = board.locations()
+    unknown = {p for p, cell in cells.items() if cell.state != "revealed"}
+    raw: List[Tuple[Tuple[Point, ...], int]] = []
+    for cell in board.revealed_cells():
+        if cell.is_bomb():
+            continue
+        neighbors = tuple(sorted(p for p in cell.location.borders() if p in unknown))
+        if neighbors:
+            raw.append((neighbors, cell.value))
+
+    components = []
+    for constraints in _connected_constraints(raw):
+        points = tuple(sorted({p for neighbors, _ in constraints for p in neighbors}))
+        index = {p: i for i, p in enumerate(points)}
+        packed = tuple(
+            (tuple(index[p] for p in neighbors), bombs)
+            for neighbors, bombs in sorted(set(constraints))
+        )
+        components.append(Component(points, packed))
+    frontier = {p for component in components for p in component.cells}
+    return components, unknown - frontier
+
+
+def _connected_constraints(
+    raw: List[Tuple[Tuple[Point, ...], int]]
+) -> List[List[Tuple[Tuple[Point, ...], int]]]:
+    """Return constraints grouped so that no two groups share a Cell, by union-find."""
+    parent: Dict[Point, Point] = {}
+
+    def find(point: Point) -> Point:
+        while parent[point] != point:
+            parent[point] = parent[parent[point]]
+            point = parent[point]
+        return point
+
+    for neighbors, _ in raw:
+        for point in neighbors:
+            parent.setdefault(point, point)
+        root = find(neighbors[0])
+        for point in neighbors[1:]:
+            parent[find(point)] = root
+
+    groups: Dict[Point, List[Tuple[Tuple[Point, ...], int]]] = defaultdict(list)
+    for neighbors, bombs in raw:
+        groups[find(neighbors[0])].append((neighbors, bombs))
+    return list(groups.values())
+
+
+def enumerate_component(component: Component) -> Table:
+    """Return the exact table of a Component, by enumerating every assignment."""
+    size = len(component.cells)
+    containing, after = _constraint_index(component)
+    memo: Dict[Tuple[int, Tuple[int, ...]], Counts] = {}
+
+    def solve(cell: int, remaining: Tuple[int, ...]) -> Counts:
+        if cell == size:
+            return {0: (1, ())}
+        key = (cell, remaining)
+        if key in memo:
+            return memo[key]
+        out: Counts = {}
+        for bomb in (0, 1):
+            counts = list(remaining)
+            valid = True
+            for constraint in containing[cell]:
+                counts[constraint] -= bomb
+                if not 0 <= counts[constraint] <= after[constraint][cell]:
+                    valid = False
+                    break
+            if not valid:
+                continue
+            for later, (total, per_cell) in solve(cell + 1, tuple(counts)).items():
+                entry = (total, (bomb * total,) + per_cell)
+                if later + bomb in out:
+                    old_total, old_cells = out[later + bomb]
+                    entry = (
+                        old_total + entry[0],
+                        tuple(a + b for a, b in zip(old_cells, entry[1])),
+                    )
+                out[later + bomb] = entry
+        memo[key] = out
+        return out
+
+    initial = tuple(bombs for _, bombs in component.constraints)
+    return {
+        k: (float(total), tuple(map(float, per_cell)))
+        for k, (total, per_cell) in solve(0, initial).items()
+    }
+
+
+def sample_component(component: Component, samples: int, rng: random.Random) -> Table:
+    """
+    Return an estimated table of a Component, by sampling assignments at random.
+
+    Each sample walks through the Cells in order, choosing uniformly between the
+    values (bomb or safe) that still leave every constraint satisfiable, and is
+    weighted by the product of the number of choices it had at each step. Samples that
+    reach a dead end get no weight. The weighted tallies are unbiased estimates of the
+    exact table, up to a constant factor that cancels out when tables are combined.
+    """
+    size = len(component.cells)
+    index = _constraint_index(component)
+    totals: Dict[int, List[float]] = {}
+    for _ in range(samples):
+        state, weight = _sample_assignment(component, index, rng)
+        if weight:
+            tally = totals.setdefault(sum(state), [0.0] * (size + 1))
+            tally[0] += weight
+            for cell, bomb in enumerate(state):
+                tally[cell + 1] += weight * bomb
+    return {k: (tally[0], tuple(tally[1:])) for k, tally in totals.items()}
+
+
+def _sample_assignment(
+    component: Component,
+    index: Tuple[List[List[int]], List[List[int]]],
+    rng: random.Random,
+) -> Tuple[List[int], float]:
+    """
+    Return one random assignment of bombs to the Cells of a Component, as a 1 or 0 for
+    each Cell, and its weight, which is zero if the assignment reached a dead end.
+    """
+    containing, after = index
+    remaining = [bombs for _, bombs in component.constraints]
+    state, weight = [0] * len(component.cells), 1.0
+    for cell, constraints in enumerate(containing):
+        choices = [
+            bomb
+            for bomb in (0, 1)
+            if all(0 <= remaining[c] - bomb <= after[c][cell] for c in constraints)
+        ]
+        if not choices:
+            return state, 0.0
+        weight *= len(choices)
+        state[cell] = rng.choice(choices)
+        for constraint in constraints:
+            remaining[constraint] -= state[cell]
+    return state, weight
+
+
+def _constraint_index(component: Component) -> Tuple[List[List[int]], List[List[int]]]:
+    """
+    Return the constraints that contain each Cell of a Component, and the number of
+    Cells of each constraint that come after each Cell.
+    """
+    size = len(component.cells)
+    containing: List[List[int]] = [[] for _ in range(size)]
+    for constraint, (indexes, _) in enumerate(component.constraints):
+        for cell in indexes:
+            containing[cell].append(constraint)
+    after = [
+        [sum(j > i for j in indexes) for i in range(size)]
+        for indexes, _ in component.constraints
+    ]
+    return containing, after
+
+
+class ProbabilityEngine:
+    """
+    A ProbabilityEngine computes the bomb probability of every unknown Cell of a Board.
+
+    Parameters
+    ----------
+    max_exact_cells : int, default 40, the largest component to solve by exact
+        enumeration. Larger components are sampled instead.
+    samples : int, default 20000, the number of random assignments used to estimate the
+        table of a large component
+    random_state : Optional[int], default None, the seed of the sampler
+
+    Attributes
+    ----------
+    results : List[ComponentResult], the solved components of the last Board, including
+        the method used and the time taken to solve each one, for tuning the cutoff
+        between exact enumeration and sampling
+
+    Examples
+    --------
+    >>> from playful.minesweeper.cell import Cell
+    >>> cells = {
+    ...     Cell(Point(0, 0), value=-1, state="hidden"),
+    ...     Cell(Point(1, 0), value=1, state="hidden"),
+    ...     Cell(Point(0, 1), value=1, state="revealed"),
+    ...     Cell(Point(1, 1), value=1, state="revealed"),
+    ... }
+    >>> ProbabilityEngine().probabilities(Board(cells))
+    {Point(x=0, y=0): 0.5, Point(x=1, y=0): 0.5}
+    """
+
+    def __init__(
+        self,
+        max_exact_cells: int = 40,
+        samples: int = 20000,
+        random_state: Optional[int] = None,
+    ) -> None:
+        self.max_exact_cells = max_exact_cells
+        self.samples = samples
+        self.random = random.Random(random_state)
+        self.results: List[ComponentResult] = []
+
+    def solve(self, component: Component) -> ComponentResult:
+        """Solve a single Component, exactly or by sampling depending on its size."""
+        start = perf_counter()
+        if len(component.cells) <= self.max_exact_cells:
+            method, table = "exact", enumerate_component(component)
+        else:
+            method = "monte-carlo"
+            table = sample_component(component, self.samples, self.random)
+        return ComponentResult(component, method, perf_counter() - start, table)
+
+    def probabilities(self, board: Board) -> Dict[Point, float]:
+        """Return a dictionary mapping each unknown Point to its bomb probability."""
+        components, interior = frontier_components(board)
+        self.results = [self.solve(component) for component in components]
+
+        # the total weight of each number of frontier bombs, for every component but one
+        totals = [
+            {k: total for k, (total, _) in result.table.items()}
+            for result in self.results
+        ]
+        everything = _convolve_all(totals)
+        others = [
+            _convolve_all(totals[:j] + totals[j + 1 :]) for j in range(len(totals))
+        ]
+        weights = _placement_weights(board.bombs, len(interior), everything)
+        norm = sum(total * weights.get(k, 0.0) for k, total in everything.items())
+        if norm == 0:
+            raise ValueError("the revealed numbers are inconsistent")
+
+        out: Dict[Point, float] = {}
+        for result, rest in zip(self.results, others):
+            for cell, point in enumerate(result.component.cells):
+                out[point] = (
+                    sum(
+                        per_cell[cell] * count * weights[k + r]
+                        for k, (_, per_cell) in result.table.items()
+                        for r, count in rest.items()
+                        if k + r in weights
+                    )
+                    / norm
+                )
+        if interior:
+            expected = sum(
+                total * weights.get(k, 0.0) * (board.bombs - k)
+                for k, total in everything.items()
+            )
+            for point in sorted(interior):
+                out[point] = expected / norm / len(interior)
+        return out
+
+
+def _convolve_all(polynomials: List[Dict[int, float]]) -> Dict[int, float]:
+    """Return the product of polynomials, stored as dictionaries of coefficients."""
+    out = {0: 1.0}
+    for polynomial in polynomials:
+        product: Dict[int, float] = defaultdict(float)
+        for degree, coefficient in out.items():
+            for other, other_coefficient in polynomial.items():
+                product[degree + other] += coefficient * other_coefficient
+        out = dict(product)
+    return out
+
+
+def _placement_weights(
+    bombs: int, interior: int, frontier: Dict[int, float]
+) -> Dict[int, float]:
+    """
+    Return the relative number of ways to place the bombs left over after the frontier
+    among the interior Cells, for each possible number of frontier bombs.
+    """
+    logs = {
+        k: lgamma(interior + 1)
+        - lgamma(bombs - k + 1)
+        - lgamma(interior - bombs + k + 1)
+        for k in frontier
+        if 0 <= bombs - k <= interior
+    }
+    if not logs:
+        return {}
+    top = max(logs.values())
+    return {k: exp(log - top) for k, log in logs.items()}
@@ -0,0 +1,144 @@
+"""
+Render minesweeper Boards as text, one row at a time.
+
+A rendering is a border line, one line per row of Cells, and another border line:
+
+    #-----#
+    |1|?|!|
+    | |1|B|
+    #-----#
+
+Boards place their Cells into (y, x) order in a single pass, then rows are produced one
+line at a time, so a rendering can be written to a stream without ever building the
+whole thing as one string. Rendering can be limited to a Viewport, a rectangular window
+of the Board, and an IncrementalRenderer keeps a rendering up to date by re-rendering
+only the rows that contain changed Cells.
+"""
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Sequence, TextIO
+
+from playful.minesweeper.cell import Cell
+
+
+class Viewport(NamedTuple):
+    """A Viewport is a rectangular window of a Board, with its top-left at (x, y)."""
+
+    x: int
+    y: int
+    width: int
+    height: int
+
+    def clip(self, width: int, height: int) -> "Viewport":
+        """Return the part of this Viewport that lies on a Board of a given size."""
+        x, y = min(max(self.x, 0), width), min(max(self.y, 0), height)
+        right = min(max(self.x + self.width, x), width)
+        bottom = min(max(self.y + self.height, y), height)
+        return Viewport(x, y, right - x, bottom - y)
+
+
+def border(width: int) -> str:
+    """Return the line above and below a rendering that is a number of Cells wide."""
+    return f"#{'-' * (width * 2 - 1)}#"
+
+
+def row_line(symbols: Sequence[str]) -> str:
+    """Return the line of a rendering that shows a row of Cell symbols."""
+    return "|" + "|".join(symbols) + "|"
+
+
+def frame(rows: Iterable[Sequence[str]], width: int) -> Iterator[str]:
+    """Yield the lines of a rendering of rows of Cell symbols, including borders."""
+    yield border(width)
+    for symbols in rows:
+        yield row_line(symbols)
+    yield border(width)
+
+
+def cell_rows(cells: Iterable[Cell], viewport: Viewport) -> List[List[str]]:
+    """
+    Return the symbols of the Cells inside a Viewport, as a list of rows.
+
+    The Cells are visited once, in any order, and each one is placed directly into its
+    row and column. Cells outside the Viewport are skipped.
+    """
+    left, top, width, height = viewport
+    rows = [[" "] * width for _ in range(height)]
+    for cell in cells:
+        x, y = cell.location.x - left, cell.location.y - top
+        if 0 <= x < width and 0 <= y < height:
+            rows[y][x] = cell.visualize()
+    return rows
+
+
+def write_lines(lines: Iterable[str], stream: TextIO) -> None:
+    """Write the lines of a rendering to a text stream, one line at a time."""
+    for line in lines:
+        stream.write(line)
+        stream.write("\n")
+
+
+class IncrementalRenderer:
+    """
+    An IncrementalRenderer keeps the rendering of a Board up to date as Cells change.
+
+    Each row's line is kept between updates, and only the rows that contain changed
+    Cells are joined again.
+
+    Parameters
+    ----------
+    rows : Iterable[Sequence[str]], the rows of Cell symbols inside the Viewport, as
+        returned by `Board.symbol_rows` or `ArrayBoard.symbol_rows`
+    viewport : Viewport, the window of the Board that the rows show
+
+    Examples
+    --------
+    >>> from playful.core import Point
+    >>> from playful.minesweeper.board import Board
+    >>> board = Board.create(width=3, height=2, n_bombs=1, random_state=0)
+    >>> viewport = Viewport(0, 0, board.width, board.height)
+    >>> renderer = IncrementalRenderer(board.symbol_rows(viewport), viewport)
+    >>> board, changed = board.reveal(Point(0, 1))
+    >>> renderer.update(changed)
+    {1: '|1|?|?|'}
+    >>> print(renderer)
+    #-----#
+    |?|?|?|
+    |1|?|?|
+    #-----#
+    """
+
+    def __init__(self, rows: Iterable[Sequence[str]], viewport: Viewport) -> None:
+        self.viewport = viewport
+        self.rows = [list(symbols) for symbols in rows]
+        self.lines = [row_line(symbols) for symbols in self.rows]
+
+    def __repr__(self) -> str:
+        """Return a string representation of this IncrementalRenderer."""
+        return f"{self.__class__.__qualname__}(viewport={self.viewport})"
+
+    def __str__(self) -> str:
+        """Return the whole rendering as a string."""
+        return "\n".join(self)
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield the lines of the rendering, including borders."""
+        yield border(self.viewport.width)
+        yield from self.lines
+        yield border(self.viewport.width)
+
+    def update(self, changed: Iterable[Cell]) -> Dict[int, str]:
+        """
+        Apply changed Cells to the rendering, and return the new line of every row that
+        changed, keyed by the row's y coordinate on the Board.
+        """
+        left, top, width, height = self.viewport
+        dirty = set()
+        for cell in changed:
+            x, y = cell.location.x - left, cell.location.y - top
+            if 0 <= x < width and 0 <= y < height:
+                self.rows[y][x] = cell.visualize()
+                dirty.add(y)
+        out = {}
+        for y in sorted(dirty):
+            self.lines[y] = row_line(self.rows[y])
+            out[y + top] = self.lines[y]
+        return out
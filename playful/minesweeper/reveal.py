@@ -0,0 +1,49 @@
+"""
+Flood-fill reveals for minesweeper.
+
+Revealing a Cell that borders no bombs also reveals all of its hidden neighbors, and
+the reveal cascades through every connected Cell with a value of zero. The cascade is
+computed with an iterative breadth-first search, so it works the same way for any
+representation of a Board that can report a location's value, state and neighbors.
+"""
+from collections import deque
+from typing import Callable, Deque, Hashable, Iterable, List, Set, TypeVar
+
+Location = TypeVar("Location", bound=Hashable)
+
+
+def flood_fill(
+    start: Location,
+    value: Callable[[Location], int],
+    state: Callable[[Location], str],
+    neighbors: Callable[[Location], Iterable[Location]],
+) -> List[Location]:
+    """
+    Return the locations revealed by revealing a starting location, in reveal order.
+
+    Only hidden locations are revealed, so the result is empty if the starting location
+    is already revealed or flagged. Flagged neighbors are never revealed by a cascade.
+
+    Parameters
+    ----------
+    start : Location, the location to reveal, such as a Point or a buffer index
+    value : Callable[[Location], int], a function that returns the value of a location
+    state : Callable[[Location], str], a function that returns the state of a location
+    neighbors : Callable[[Location], Iterable[Location]], a function that returns the
+        locations that border a location
+    """
+    if state(start) != "hidden":
+        return []
+    queue: Deque[Location] = deque([start])
+    seen: Set[Location] = {start}
+    revealed = []
+    while queue:
+        location = queue.popleft()
+        revealed.append(location)
+        if value(location) != 0:
+            continue
+        for neighbor in neighbors(location):
+            if neighbor not in seen and state(neighbor) == "hidden":
+                seen.add(neighbor)
+                queue.append(neighbor)
+    return revealed
@@ -0,0 +1,213 @@
+"""
+Play many games of minesweeper automatically, to evaluate move policies.
+
+Each game starts from a Board created by `Board.create` with its own seed, and a Policy
+chooses which Cell to reveal next until the player reveals a bomb or every safe Cell.
+Games are independent, so a batch of games can be spread across a pool of processes.
+The seed of every game is derived from the seed of the batch, so a batch produces the
+same results no matter how many processes play it.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import os
+import random
+from time import perf_counter
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from playful.core import Point
+from playful.minesweeper.board import Board
+from playful.minesweeper.cell import Cell
+from playful.minesweeper.probability import ProbabilityEngine
+from playful.minesweeper.solver import Solver
+
+
+class GameResult(NamedTuple):
+    """The outcome of one simulated game."""
+
+    seed: int
+    won: bool
+    moves: int
+    revealed: int
+    seconds: float
+
+
+class SimulationStats(NamedTuple):
+    """Summary statistics of a batch of simulated games."""
+
+    games: int
+    wins: int
+    win_rate: float
+    mean_moves: float
+    mean_revealed: float
+    seconds: float
+
+
+class Policy:
+    """
+    A Policy chooses the next Point to reveal in a game.
+
+    The base Policy keeps track of the Points that haven't been revealed yet, and
+    chooses one of them at random. Subclasses override `choose` to play better.
+    """
+
+    def __init__(self) -> None:
+        self.rng = random.Random()
+        self.unknown: List[Point] = []
+        self._positions: Dict[Point, int] = {}
+
+    def __repr__(self) -> str:
+        """Return a string representation of this Policy."""
+        return f"{self.__class__.__qualname__}()"
+
+    def start(self, board: Board, rng: random.Random) -> None:
+        """Prepare to play a new game on a Board, using a seeded random generator."""
+        self.rng = rng
+        self.unknown = sorted(c.location for c in board.cells if c.state != "revealed")
+        self._positions = {point: i for i, point in enumerate(self.unknown)}
+
+    def update(self, changed: Iterable[Cell]) -> None:
+        """Record the Cells changed by the last move."""
+        for cell in changed:
+            if cell.state == "revealed" and cell.location in self._positions:
+                # swap the revealed Point with the last one, so removal takes O(1).
+                position = self._positions.pop(cell.location)
+                last = self.unknown.pop()
+                if position < len(self.unknown):
+                    self.unknown[position] = last
+                    self._positions[last] = position
+
+    def choose(self, board: Board) -> Point:  # pylint: disable=unused-argument
+        """Return the next Point to reveal."""
+        return self.rng.choice(self.unknown)
+
+
+class SolverPolicy(Policy):
+    """
+    A SolverPolicy reveals Cells that the Solver proves are safe, and guesses otherwise.
+
+    Parameters
+    ----------
+    engine : Optional[ProbabilityEngine], default None, if provided, guess the Cell that
+        is least likely to be a bomb. Otherwise, guess at random among the Cells that
+        aren't known to be bombs.
+    """
+
+    def __init__(self, engine: Optional[ProbabilityEngine] = None) -> None:
+        super().__init__()
+        self.engine = engine
+        self.solver: Optional[Solver] = None
+
+    def __repr__(self) -> str:
+        """Return a string representation of this SolverPolicy."""
+        return f"{self.__class__.__qualname__}(engine={self.engine})"
+
+    def start(self, board: Board, rng: random.Random) -> None:
+        """Prepare to play a new game on a Board, using a seeded random generator."""
+        super().start(board, rng)
+        self.solver = Solver(board)
+        if self.engine is not None:
+            self.engine.random = random.Random(rng.getrandbits(32))
+
+    def update(self, changed: Iterable[Cell]) -> None:
+        """Record the Cells changed by the last move."""
+        changed = list(changed)
+        super().update(changed)
+        if self.solver is not None:
+            self.solver.update(changed)
+
+    def choose(self, board: Board) -> Point:
+        """Return a provably safe Point to reveal, or the best guess."""
+        if self.solver is None:
+            raise RuntimeError("start must be called before choose")
+        safe, bombs = self.solver.solve()
+        if safe:
+            return min(safe)
+        if self.engine is not None:
+            probabilities = self.engine.probabilities(board)
+            return min(probabilities, key=lambda p: (probabilities[p], p))
+        return self.rng.choice(
+            [p for p in self.unknown if p not in bombs] or self.unknown
+        )
+
+
+def play(
+    width: int, height: int, n_bombs: int, seed: int, policy: Policy
+) -> GameResult:
+    """Play one game on a seeded Board until it's won or lost."""
+    start = perf_counter()
+    board = Board.create(width, height, n_bombs, random_state=seed)
+    # the Board's bombs were sampled with this seed, so the Policy needs a different
+    # one; otherwise its first random guess would land on the first bomb placed.
+    policy.start(board, random.Random(f"policy:{seed}"))
+    safe, revealed, moves = width * height - n_bombs, 0, 0
+    while revealed < safe:
+        board, changed = board.reveal(policy.choose(board))
+        moves += 1
+        if any(cell.is_bomb() for cell in changed):
+            return GameResult(seed, False, moves, revealed, perf_counter() - start)
+        revealed += len(changed)
+        policy.update(changed)
+    return GameResult(seed, True, moves, revealed, perf_counter() - start)
+
+
+def game_seeds(n_games: int, seed: int) -> List[int]:
+    """Return the seed of each game in a batch, derived from the seed of the batch."""
+    rng = random.Random(seed)
+    return [rng.getrandbits(32) for _ in range(n_games)]
+
+
+def simulate(  # pylint: disable=too-many-arguments
+    n_games: int,
+    width: int,
+    height: int,
+    n_bombs: int,
+    policy: Policy,
+    seed: int = 0,
+    workers: Optional[int] = 1,
+    chunksize: Optional[int] = None,
+) -> List[GameResult]:
+    """
+    Play a batch of games with a Policy, and return their results in seed order.
+
+    Parameters
+    ----------
+    n_games : int, the number of games to play
+    width : int, the width (x) dimension of each Board
+    height : int, the height (y) dimension of each Board
+    n_bombs : int, the number of bombs on each Board
+    policy : Policy, the Policy that plays every game. It's copied to each worker.
+    seed : int, default 0, the seed from which every game's seed is derived
+    workers : Optional[int], default 1, the number of worker processes. If 1, play in
+        this process. If None, use the number of processors on the machine.
+    chunksize : Optional[int], default None, the number of games sent to a worker at a
+        time. If None, games are divided into about four chunks per worker.
+
+    Examples
+    --------
+    >>> results = simulate(20, width=9, height=9, n_bombs=10, policy=SolverPolicy())
+    >>> summarize(results).games
+    20
+    """
+    seeds = game_seeds(n_games, seed)
+    game = partial(play, width, height, n_bombs, policy=policy)
+    if workers == 1:
+        return [game(s) for s in seeds]
+    workers = workers or os.cpu_count() or 1
+    size = chunksize or max(1, -(-n_games // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(game, seeds, chunksize=size))
+
+
+def summarize(results: Iterable[GameResult]) -> SimulationStats:
+    """Return summary statistics of a batch of games."""
+    results = list(results)
+    games = len(results)
+    wins = sum(result.won for result in results)
+    return SimulationStats(
+        games=games,
+        wins=wins,
+        win_rate=wins / games if games else 0.0,
+        mean_moves=sum(r.moves for r in results) / games if games else 0.0,
+        mean_revealed=sum(r.revealed for r in results) / games if games else 0.0,
+        seconds=sum(r.seconds for r in results),
+    )
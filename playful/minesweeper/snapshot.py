@@ -0,0 +1,136 @@
+"""
+A compact binary format for minesweeper Board snapshots and replay logs.
+
+A snapshot stores a Board as a small header followed by one byte per Cell, in exactly
+the packed layout of an ArrayBoard: the Cell's state in the high nibble and its value
+plus one in the low nibble. Loading a snapshot wraps that buffer in an ArrayBoard
+without copying or decoding it, so a memory-mapped snapshot of a million Cells loads
+in microseconds.
+
+Moves can be appended to the end of a snapshot, one fixed-size record at a time, so a
+game can be recorded as it's played and replayed later from its starting Board.
+
+Layout (all integers little-endian)
+-----------------------------------
+header : magic b"PLMB", version (uint16), padding (uint16), width (uint32), height
+    (uint32), bombs (uint32), and the number of hidden, revealed and flagged Cells
+    (uint32 each)
+cells : width x height packed Cells, as returned by `encode_cell`
+moves : any number of (x (uint32), y (uint32), action (uint8)) records
+"""
+import mmap
+import struct
+from typing import Any, Iterable, List, NamedTuple, Union
+
+from playful.core import Point
+from playful.minesweeper.array_board import STATES, ArrayBoard
+from playful.minesweeper.board import Board
+from playful.minesweeper.cell import Cell
+
+MAGIC = b"PLMB"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIIIII")
+MOVE = struct.Struct("<IIB")
+ACTIONS = ("reveal", "flag")
+
+
+class Move(NamedTuple):
+    """A Move reveals or flags the Cell at a Point."""
+
+    point: Point
+    action: str
+
+
+class Snapshot(NamedTuple):
+    """A Snapshot holds a loaded ArrayBoard and the Moves recorded after it."""
+
+    board: ArrayBoard
+    moves: List[Move]
+
+
+def pack_moves(moves: Iterable[Move]) -> bytes:
+    """Return the packed records of a collection of Moves."""
+    return b"".join(
+        MOVE.pack(move.point.x, move.point.y, ACTIONS.index(move.action))
+        for move in moves
+    )
+
+
+def dumps(board: Union[Board, ArrayBoard], moves: Iterable[Move] = ()) -> bytes:
+    """Return the snapshot of a Board, followed by the records of any Moves."""
+    if isinstance(board, Board):
+        board = ArrayBoard.from_board(board)
+    states = board.states()
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        0,
+        board.width,
+        board.height,
+        board.bombs,
+        *(states[state] for state in STATES),
+    )
+    return header + bytes(board.cells) + pack_moves(moves)
+
+
+def loads(buffer: Any) -> Snapshot:
+    """
+    Return the ArrayBoard and Moves of a snapshot, without copying its Cells.
+
+    The ArrayBoard shares the buffer, so changes to the ArrayBoard change the buffer,
+    and an ArrayBoard loaded from a read-only buffer (such as bytes) can't be changed;
+    use `ArrayBoard.copy` to get one that can.
+    """
+    view = memoryview(buffer).cast("B")
+    magic, version, _, width, height, bombs, *counts = HEADER.unpack_from(view)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("buffer is not a minesweeper snapshot")
+    start = HEADER.size
+    cells = view[start : start + width * height]
+    board = ArrayBoard.from_buffer(width, height, cells, counts, bombs)
+
+    start += width * height
+    # ignore a partly-written record at the end of the log
+    end = start + (len(view) - start) // MOVE.size * MOVE.size
+    moves = [
+        Move(Point(x, y), ACTIONS[action])
+        for x, y, action in MOVE.iter_unpack(view[start:end])
+    ]
+    return Snapshot(board, moves)
+
+
+def save(
+    board: Union[Board, ArrayBoard], path: str, moves: Iterable[Move] = ()
+) -> None:
+    """Write the snapshot of a Board, and any Moves, to a file."""
+    with open(path, "wb") as file:
+        file.write(dumps(board, moves))
+
+
+def load(path: str) -> Snapshot:
+    """
+    Return the ArrayBoard and Moves of a snapshot file, memory-mapped without copying.
+
+    The file is mapped copy-on-write: the ArrayBoard can be changed, but the changes
+    are never written back to the file.
+    """
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    return loads(mapped)
+
+
+def append_moves(path: str, moves: Iterable[Move]) -> None:
+    """Append Moves to the log at the end of a snapshot file."""
+    with open(path, "ab") as file:
+        file.write(pack_moves(moves))
+
+
+def replay(board: ArrayBoard, moves: Iterable[Move]) -> List[Cell]:
+    """Apply Moves to an ArrayBoard in place, and return every changed Cell in order."""
+    changed = []
+    for point, action in moves:
+        if action == "reveal":
+            changed.extend(board.reveal(point))
+        else:
+            changed.extend(board.flag(point))
+    return changed
@@ -0,0 +1,169 @@
+"""
+Deduce which hidden Cells of a minesweeper Board are provably safe or provably bombs.
+
+Every revealed number gives a constraint: among its hidden neighbors, exactly that
+many (less any known bombs) are bombs. The Solver applies two kinds of rules to these
+constraints until nothing more can be learned:
+
+1. single-cell rules: if a constraint has no bombs left, all of its Cells are safe; if
+   it has as many bombs as Cells, all of its Cells are bombs.
+2. set-difference rules: if one constraint's Cells are a subset of another's, the
+   Cells in the difference hold the difference in bombs; and if two overlapping
+   constraints differ in bombs by exactly the number of Cells only the first one has,
+   those Cells are bombs and the Cells only the second one has are safe.
+
+The Solver keeps what it has learned between moves. After a move, only constraints
+near the changed Cells are examined again, so solving a whole game stays close to
+linear in the size of the Board.
+
+Flags are treated as the player's guesses, not as facts: a flagged Cell is unknown to
+the Solver until it deduces what the Cell contains.
+"""
+from collections import deque
+from typing import Deque, Dict, FrozenSet, Iterable, NamedTuple, Optional, Set, Tuple
+
+from playful.core import Grid, Point
+from playful.minesweeper.board import Board
+from playful.minesweeper.cell import Cell
+
+
+class Constraint(NamedTuple):
+    """A Constraint requires a number of bombs among a set of unknown Cells."""
+
+    cells: FrozenSet[Point]
+    bombs: int
+
+
+class Solver:
+    """
+    A Solver deduces safe Cells and bombs from the revealed numbers on a Board.
+
+    Parameters
+    ----------
+    board : Board, the Board to solve
+
+    Examples
+    --------
+    >>> board = Board.create(width=9, height=9, n_bombs=10, random_state=3)
+    >>> board, changed = board.reveal(Point(0, 0))
+    >>> solver = Solver(board)
+    >>> safe, bombs = solver.solve()
+    >>> all(not board.locations()[p].is_bomb() for p in safe)
+    True
+    """
+
+    def __init__(self, board: Board) -> None:
+        self.cells: Dict[Point, Cell] = board.locations()
+        self.grid = Grid(board.width, board.height)
+        self.safe: Set[Point] = set()
+        self.bombs: Set[Point] = set()
+        self._pending: Deque[Point] = deque()
+        self._queued: Set[Point] = set()
+        for cell in board.revealed_cells():
+            self._enqueue(cell.location)
+
+    def __repr__(self) -> str:
+        """Return a string representation of this Solver."""
+        name = self.__class__.__qualname__
+        return f"{name}(safe={len(self.safe)}, bombs={len(self.bombs)})"
+
+    def update(self, changed: Iterable[Cell]) -> None:
+        """Record changed Cells, such as those returned by `Board.reveal`."""
+        for cell in changed:
+            self.cells[cell.location] = cell
+            if cell.state == "revealed":
+                self.safe.discard(cell.location)
+                self._enqueue(cell.location)
+                self._enqueue_neighbors(cell.location)
+
+    def solve(self) -> Tuple[Set[Point], Set[Point]]:
+        """
+        Return the sets of hidden Points that are provably safe and provably bombs.
+
+        Only constraints that may have changed since the last call are examined.
+        """
+        while self._pending:
+            point = self._pending.popleft()
+            self._queued.discard(point)
+            constraint = self.constraint(point)
+            if constraint is not None:
+                self._examine(point, constraint)
+        return set(self.safe), set(self.bombs)
+
+    def constraint(self, point: Point) -> Optional[Constraint]:
+        """Return the Constraint of a revealed number, or None if it has nothing left."""
+        cell = self.cells.get(point)
+        if cell is None or cell.state != "revealed" or cell.is_bomb():
+            return None
+        unknown, bombs = set(), cell.value
+        for neighbor in self._neighbors(point):
+            if self.cells[neighbor].state == "revealed" or neighbor in self.safe:
+                continue
+            if neighbor in self.bombs:
+                bombs -= 1
+            else:
+                unknown.add(neighbor)
+        if not unknown:
+            return None
+        return Constraint(frozenset(unknown), bombs)
+
+    def _examine(self, point: Point, constraint: Constraint) -> None:
+        """Apply the single-cell and set-difference rules to a Constraint."""
+        if self._apply(constraint.cells, constraint.bombs):
+            return
+
+        others = {
+            other
+            for cell in constraint.cells
+            for other in self._neighbors(cell)
+            if other != point
+        }
+        for other in others:
+            overlap = self.constraint(other)
+            if overlap is None or not overlap.cells & constraint.cells:
+                continue
+            for first, second in ((constraint, overlap), (overlap, constraint)):
+                if second.cells <= first.cells:
+                    self._apply(first.cells - second.cells, first.bombs - second.bombs)
+                elif first.bombs - second.bombs == len(first.cells - second.cells):
+                    self._mark(first.cells - second.cells, bomb=True)
+                    self._mark(second.cells - first.cells, bomb=False)
+            if self.constraint(point) != constraint:
+                # what we know has changed; this point has been queued to start again.
+                return
+
+    def _apply(self, cells: FrozenSet[Point], bombs: int) -> bool:
+        """Mark Cells if a number of bombs among them decides them all."""
+        if not cells:
+            return False
+        if bombs == 0:
+            self._mark(cells, bomb=False)
+            return True
+        if bombs == len(cells):
+            self._mark(cells, bomb=True)
+            return True
+        return False
+
+    def _mark(self, cells: Iterable[Point], bomb: bool) -> None:
+        """Record Cells as safe or bombs, and queue the constraints that contain them."""
+        known = self.bombs if bomb else self.safe
+        for cell in cells:
+            if cell not in known:
+                known.add(cell)
+                self._enqueue_neighbors(cell)
+
+    def _neighbors(self, point: Point) -> Iterable[Point]:
+        """Return the Points on the Board that border a Point."""
+        return (p for p in self.grid.borders(point) if p in self.cells)
+
+    def _enqueue(self, point: Point) -> None:
+        """Queue a revealed number to be examined."""
+        if point not in self._queued:
+            self._queued.add(point)
+            self._pending.append(point)
+
+    def _enqueue_neighbors(self, point: Point) -> None:
+        """Queue the revealed numbers that border a Point."""
+        for neighbor in self._neighbors(point):
+            if self.cells[neighbor].state == "revealed":
+                self._enqueue(neighbor)
@@ -0,0 +1,427 @@
+"""
+An asyncio game server that hosts many minesweeper and Lingo games at once.
+
+Clients send one JSON request per line, and receive one JSON response per line, over a
+local TCP socket or over stdin and stdout. Every request names an operation with "op",
+and may carry an "id", which is echoed back in its response:
+
+    {"id": 1, "op": "minesweeper.new", "width": 9, "height": 9, "bombs": 10}
+    {"id": 1, "ok": true, "session": "1"}
+
+Operations
+----------
+minesweeper.new : width, height, bombs, optional seed -> session
+minesweeper.reveal, minesweeper.flag : session, x, y -> changed Cells, truncated, won,
+    lost
+minesweeper.show : session -> board, as text
+lingo.new : words, optional secret -> session
+lingo.guess : session, guess, and a pattern unless the session has a secret
+    -> pattern, number of candidates, solved
+lingo.suggest : session -> the best splitting word among the candidates
+lingo.candidates : session -> the remaining candidate words
+close : session
+stats : -> latency percentiles of each operation, in milliseconds
+
+Requests for a Board with more than `max_cells` Cells, or a word list with more than
+`max_words` words, are refused before any work is done, and so are lines longer than
+`max_line` bytes. A reveal can cascade across most of a large Board, so a move reports
+at most `max_changes` changed Cells; when it changes more, the response is marked as
+truncated, and the client should ask for the whole Board with "minesweeper.show". Any
+other failure is reported as an error response, so one bad request never takes the
+server down.
+
+Games are kept in memory. Work that can take a while and doesn't change a game, like
+creating a large Board or searching for the best splitting word, runs in an executor,
+so the event loop keeps answering other clients in the meantime. Its result is stored
+on the event loop, so the executor can be a thread pool or a process pool. Moves and
+guesses change a game in place, so they run in the event loop's default thread pool
+instead, where they can change the game itself. Requests for the same game are
+handled one at a time, in order, so a game is never changed by two threads at once.
+
+Run `python -m playful.server --port 8765` to serve over TCP, or `--stdio` to serve
+over stdin and stdout.
+"""
+import argparse
+import asyncio
+from collections import deque
+from concurrent.futures import Executor
+from functools import partial
+from itertools import count, islice
+import json
+import random
+import sys
+from time import perf_counter
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from playful.core import Point
+from playful.lingo.pattern import feedback_pattern
+from playful.lingo.session import LingoSession
+from playful.minesweeper.array_board import ArrayBoard
+
+Result = TypeVar("Result")
+Request = Dict[str, Any]
+Response = Dict[str, Any]
+
+
+class LatencyStats:
+    """
+    LatencyStats keep the most recent latencies of each operation, and summarize them
+    as percentiles.
+
+    Parameters
+    ----------
+    samples : int, default 10000, the number of recent latencies to keep per operation
+    """
+
+    def __init__(self, samples: int = 10000) -> None:
+        self.samples = samples
+        self.latencies: Dict[str, Deque[float]] = {}
+        self.counts: Dict[str, int] = {}
+
+    def record(self, operation: str, seconds: float) -> None:
+        """Record the latency of one request."""
+        if operation not in self.latencies:
+            self.latencies[operation] = deque(maxlen=self.samples)
+            self.counts[operation] = 0
+        self.latencies[operation].append(seconds)
+        self.counts[operation] += 1
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Return the count and the 50th, 90th, 99th and 100th percentile latencies."""
+        out: Dict[str, Dict[str, float]] = {}
+        for operation, latencies in sorted(self.latencies.items()):
+            ordered = sorted(latencies)
+            out[operation] = {"count": self.counts[operation]}
+            for percent in (50, 90, 99, 100):
+                out[operation][f"p{percent}"] = percentile(ordered, percent) * 1000.0
+        return out
+
+
+def percentile(ordered: Sequence[float], percent: float) -> float:
+    """Return the nearest-rank percentile of sorted values."""
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+
+class MinesweeperGame:  # pylint: disable=too-few-public-methods
+    """A MinesweeperGame is a Board being played by one client."""
+
+    def __init__(self, board: ArrayBoard) -> None:
+        self.board = board
+        self.lock = asyncio.Lock()
+
+    def move(self, action: str, point: Point, limit: int) -> Response:
+        """
+        Reveal or flag the Cell at a Point, and describe up to `limit` changed Cells.
+        """
+        board = self.board
+        if board.is_won() or board.is_lost():
+            raise ValueError("this game is over")
+        if action == "reveal":
+            changed = board.reveal(point)
+            cells = [
+                [c.location.x, c.location.y, c.value, c.state]
+                for c in islice(changed, limit)
+            ]
+        else:
+            changed = board.flag(point)
+            cells = [[c.location.x, c.location.y, None, c.state] for c in changed]
+        return {
+            "changed": cells,
+            "truncated": len(changed) > len(cells),
+            "won": board.is_won(),
+            "lost": board.is_lost(),
+        }
+
+
+class LingoGame:  # pylint: disable=too-few-public-methods
+    """A LingoGame is a Lingo session being played by one client."""
+
+    def __init__(self, session: LingoSession, secret: Optional[str] = None) -> None:
+        self.session = session
+        self.secret = secret
+        self.lock = asyncio.Lock()
+
+    def guess(self, guess: str, pattern: Optional[int]) -> Response:
+        """Score a guess, or use the pattern given for it, and narrow the candidates."""
+        if pattern is None:
+            if self.secret is None:
+                raise ValueError("a pattern is required when the server has no secret")
+            pattern = feedback_pattern(secret=self.secret, guess=guess)
+        remaining = self.session.guess(guess, pattern)
+        solved = pattern == 3 ** len(guess) - 1
+        return {"pattern": pattern, "candidates": remaining, "solved": solved}
+
+
+class GameServer:  # pylint: disable=too-many-instance-attributes
+    """
+    A GameServer hosts games and answers JSON requests about them.
+
+    Parameters
+    ----------
+    executor : Optional[Executor], default None, where slow work runs. Only functions
+        that don't change a game are sent to it, so it may be a ProcessPoolExecutor.
+        If None, use the event loop's default thread pool.
+    samples : int, default 10000, the number of recent latencies to keep per operation
+    max_cells : int, default 250000, the largest number of Cells in a new Board
+    max_words : int, default 100000, the largest number of words in a new Lingo game
+    max_changes : int, default 10000, the most changed Cells reported by one move
+    max_line : int, default 2 ** 24, the longest request line in bytes, which fits
+        `max_words` words of up to 160 characters each
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        executor: Optional[Executor] = None,
+        samples: int = 10000,
+        max_cells: int = 250000,
+        max_words: int = 100000,
+        max_changes: int = 10000,
+        max_line: int = 2 ** 24,
+    ) -> None:
+        self.executor = executor
+        self.max_cells = max_cells
+        self.max_words = max_words
+        self.max_changes = max_changes
+        self.max_line = max_line
+        self.games: Dict[str, Any] = {}
+        self.stats = LatencyStats(samples)
+        self._ids = count(1)
+        self._operations: Dict[str, Callable[[Request], Any]] = {
+            "minesweeper.new": self._minesweeper_new,
+            "minesweeper.reveal": partial(self._minesweeper_move, "reveal"),
+            "minesweeper.flag": partial(self._minesweeper_move, "flag"),
+            "minesweeper.show": self._minesweeper_show,
+            "lingo.new": self._lingo_new,
+            "lingo.guess": self._lingo_guess,
+            "lingo.suggest": self._lingo_suggest,
+            "lingo.candidates": self._lingo_candidates,
+            "close": self._close,
+            "stats": self._stats,
+        }
+
+    def __repr__(self) -> str:
+        """Return a string representation of this GameServer."""
+        return f"{self.__class__.__qualname__}(games={len(self.games)})"
+
+    async def handle(self, request: Request) -> Response:
+        """Answer one request. Errors are reported in the response, never raised."""
+        start = perf_counter()
+        operation = request.get("op")
+        response: Response = {} if "id" not in request else {"id": request["id"]}
+        try:
+            if operation not in self._operations:
+                raise ValueError(f"unknown operation {operation!r}")
+            response.update(await self._operations[str(operation)](request), ok=True)
+        except (KeyError, IndexError, TypeError, ValueError) as error:
+            message = error.args[0] if error.args else type(error).__name__
+            response.update(ok=False, error=str(message))
+        except Exception as error:  # pylint: disable=broad-except
+            response.update(ok=False, error=f"internal error: {type(error).__name__}")
+        if operation in self._operations:
+            self.stats.record(str(operation), perf_counter() - start)
+        return response
+
+    async def handle_line(self, line: bytes) -> bytes:
+        """Answer one line of JSON with one line of JSON."""
+        try:
+            request = json.loads(line.decode("utf-8"))
+            if not isinstance(request, dict):
+                raise ValueError("a request must be a JSON object")
+        except ValueError as error:
+            response: Response = {"ok": False, "error": f"invalid request: {error}"}
+        else:
+            response = await self.handle(request)
+        return json.dumps(response).encode("utf-8") + b"\n"
+
+    async def listen(self, host: str, port: int) -> asyncio.AbstractServer:
+        """Start serving TCP connections, with lines of up to `max_line` bytes."""
+        return await asyncio.start_server(
+            self.serve_connection, host, port, limit=self.max_line
+        )
+
+    async def serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer the requests of one connection, in order, until it closes."""
+        try:
+            async for response in self._responses(reader):
+                writer.write(response)
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve_stdio(self) -> None:
+        """Answer requests from stdin on stdout until stdin closes."""
+        loop = asyncio.get_event_loop()
+        reader = asyncio.StreamReader(limit=self.max_line)
+        protocol = asyncio.StreamReaderProtocol(reader)
+        await loop.connect_read_pipe(lambda: protocol, sys.stdin)
+        async for response in self._responses(reader):
+            sys.stdout.write(response.decode("utf-8"))
+            sys.stdout.flush()
+
+    async def _responses(self, reader: asyncio.StreamReader) -> AsyncIterator[bytes]:
+        """Yield the response to each line of a stream, until it closes."""
+        while True:
+            line = await read_line(reader)
+            if line is None:
+                error = f"invalid request: a line can be at most {self.max_line} bytes"
+                yield json.dumps({"ok": False, "error": error}).encode("utf-8") + b"\n"
+            elif not line:
+                break
+            elif line.strip():
+                yield await self.handle_line(line)
+
+    async def _run(self, func: Callable[..., Result], *args: Any) -> Result:
+        """
+        Run a slow function in the executor, without blocking the event loop. The
+        function must not change its arguments, because a process pool would only
+        change copies of them.
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args))
+
+    async def _run_in_thread(self, func: Callable[..., Result], *args: Any) -> Result:
+        """
+        Run a function that changes a game in the event loop's default thread pool,
+        where it changes the game itself rather than a copy.
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, partial(func, *args))
+
+    def _game(self, request: Request, kind: type) -> Any:
+        """Return the game named by a request, checking that it's the right kind."""
+        game = self.games.get(str(request["session"]))
+        if not isinstance(game, kind):
+            raise KeyError(f"no {kind.__name__} with session {request['session']!r}")
+        return game
+
+    def _add(self, game: Any) -> Response:
+        """Store a new game, and return its session id."""
+        session = str(next(self._ids))
+        self.games[session] = game
+        return {"session": session}
+
+    async def _minesweeper_new(self, request: Request) -> Response:
+        width, height = int(request["width"]), int(request["height"])
+        bombs, seed = int(request["bombs"]), request.get("seed")
+        if width < 1 or height < 1:
+            raise ValueError("width and height must be at least 1")
+        if width * height > self.max_cells:
+            raise ValueError(f"a board can have at most {self.max_cells} cells")
+        if not 0 <= bombs <= width * height:
+            raise ValueError("bombs must be between 0 and width * height")
+        rng = random.Random(seed)
+        board = await self._run(ArrayBoard.create, width, height, bombs, None, rng)
+        return self._add(MinesweeperGame(board))
+
+    async def _minesweeper_move(self, action: str, request: Request) -> Response:
+        game = self._game(request, MinesweeperGame)
+        point = Point(int(request["x"]), int(request["y"]))
+        async with game.lock:
+            return await self._run_in_thread(game.move, action, point, self.max_changes)
+
+    async def _minesweeper_show(self, request: Request) -> Response:
+        game = self._game(request, MinesweeperGame)
+        async with game.lock:
+            board = await self._run(game.board.visualize)
+        return {"board": board}
+
+    async def _lingo_new(self, request: Request) -> Response:
+        if len(request["words"]) > self.max_words:
+            raise ValueError(f"a game can have at most {self.max_words} words")
+        words = [str(word) for word in request["words"]]
+        secret = request.get("secret")
+        if secret is not None and secret not in words:
+            raise ValueError("the secret must be one of the words")
+        session = await self._run(LingoSession, words)
+        return self._add(LingoGame(session, secret))
+
+    async def _lingo_guess(self, request: Request) -> Response:
+        game = self._game(request, LingoGame)
+        pattern = request.get("pattern")
+        pattern = None if pattern is None else int(pattern)
+        async with game.lock:
+            return await self._run_in_thread(game.guess, str(request["guess"]), pattern)
+
+    async def _lingo_suggest(self, request: Request) -> Response:
+        game = self._game(request, LingoGame)
+        async with game.lock:
+            word = await self._run(game.session.best_splitting_word)
+        return {"guess": word}
+
+    async def _lingo_candidates(self, request: Request) -> Response:
+        game = self._game(request, LingoGame)
+        async with game.lock:
+            words = game.session.candidates()
+        return {"candidates": words}
+
+    async def _close(self, request: Request) -> Response:
+        if self.games.pop(str(request["session"]), None) is None:
+            raise KeyError(f"no game with session {request['session']!r}")
+        return {}
+
+    async def _stats(self, _request: Request) -> Response:
+        return {"games": len(self.games), "latency": self.stats.summary()}
+
+
+async def read_line(reader: asyncio.StreamReader) -> Optional[bytes]:
+    """
+    Return the next line of a stream, or b"" when the stream closes. A line longer
+    than the stream's limit is discarded, up to and including its newline, and None is
+    returned instead.
+    """
+    try:
+        return await reader.readuntil(b"\n")
+    except asyncio.IncompleteReadError as error:
+        return error.partial
+    except asyncio.LimitOverrunError as error:
+        consumed = error.consumed
+    while True:
+        await reader.read(consumed)
+        try:
+            await reader.readuntil(b"\n")
+            return None
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError as error:
+            consumed = error.consumed
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run a GameServer from the command line."""
+    parser = argparse.ArgumentParser(description="Serve minesweeper and Lingo games.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--stdio", action="store_true", help="serve stdin and stdout")
+    args = parser.parse_args(argv)
+
+    server = GameServer()
+    loop = asyncio.get_event_loop()
+    if args.stdio:
+        loop.run_until_complete(server.serve_stdio())
+        return
+    listener = loop.run_until_complete(server.listen(args.host, args.port))
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        loop.run_until_complete(listener.wait_closed())
+
+
+if __name__ == "__main__":
+    main()
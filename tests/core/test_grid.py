@@ -0,0 +1,50 @@
+"""Test grid.py"""
+import unittest
+
+from playful.core import Grid, Point
+
+
+class TestGrid(unittest.TestCase):
+    """Test Grid class"""
+
+    grid = Grid(width=4, height=3)
+
+    def test_points(self):
+        """Test interning every Point of the Grid, row by row"""
+        self.assertEqual(len(self.grid), 12)
+        self.assertEqual(
+            list(self.grid)[:5],
+            [Point(0, 0), Point(1, 0), Point(2, 0), Point(3, 0), Point(0, 1)],
+        )
+        self.assertIs(self.grid.point(2, 1), self.grid.point(2, 1))
+        self.assertEqual(self.grid.index(Point(2, 1)), 6)
+        self.assertRaises(IndexError, self.grid.point, 4, 0)
+
+    def test_contains(self):
+        """Test identifying Points inside the Grid"""
+        self.assertIn(Point(3, 2), self.grid)
+        self.assertNotIn(Point(4, 2), self.grid)
+        self.assertNotIn(Point(-1, 0), self.grid)
+        self.assertNotIn("point", self.grid)
+
+    def test_neighbors(self):
+        """Test matching the Point methods, limited to the bounds of the Grid"""
+        for point in self.grid:
+            with self.subTest(f"testing point={point}"):
+                inside = set(self.grid)
+                self.assertEqual(
+                    set(self.grid.borders(point)), point.borders() & inside
+                )
+                self.assertEqual(
+                    set(self.grid.corners(point)), point.corners() & inside
+                )
+                self.assertEqual(set(self.grid.sides(point)), point.sides() & inside)
+                self.assertIs(self.grid.borders(point), self.grid.borders(point))
+
+    def test_is_neighbor(self):
+        """Test that neighbor checks agree with the neighbor sets"""
+        for point in self.grid:
+            for other in self.grid:
+                self.assertEqual(point.is_border(other), other in point.borders())
+                self.assertEqual(point.is_corner(other), other in point.corners())
+                self.assertEqual(point.is_side(other), other in point.sides())
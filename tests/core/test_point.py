@@ -108,3 +108,9 @@ class TestPoint(unittest.TestCase):
         self.assertEqual(point.rotate(around=around, degrees=180), Point(6, 4))
         self.assertEqual(point.rotate(around=around, degrees=270), Point(4, 8))
         self.assertEqual(point.rotate(around=around, degrees=-90), Point(4, 8))
+
+    def test_reflect_zero(self):
+        """Test reflecting a point over the x=0 and y=0 lines"""
+        point = Point(4, 4)
+        self.assertEqual(point.reflect(x=0), Point(-4, 4))
+        self.assertEqual(point.reflect(y=0), Point(4, -4))
@@ -0,0 +1,49 @@
+"""Test point_array.py"""
+import unittest
+
+from playful.core import Point, PointArray
+
+
+class TestPointArray(unittest.TestCase):
+    """Test PointArray class"""
+
+    points = [Point(8, 10), Point(4, 4), Point(0, -3), Point(7, 7)]
+
+    def test_round_trip(self):
+        """Test converting to and from a list of Points"""
+        array = PointArray.from_points(self.points)
+        self.assertEqual(array.to_points(), self.points)
+        self.assertEqual(list(array), self.points)
+        self.assertEqual(array[2], Point(0, -3))
+        self.assertEqual(len(array), 4)
+        self.assertEqual(PointArray.from_points([]), PointArray())
+
+    def test_translate(self):
+        """Test moving every Point"""
+        array = PointArray.from_points(self.points).translate(dx=1, dy=-2)
+        expected = [Point(9, 8), Point(5, 2), Point(1, -5), Point(8, 5)]
+        self.assertEqual(array.to_points(), expected)
+
+    def test_reflect(self):
+        """Test matching Point.reflect for every Point"""
+        array = PointArray.from_points(self.points)
+        for x, y in [(None, None), (6, None), (None, 1), (6, 1), (0, 0)]:
+            with self.subTest(f"testing x={x}, y={y}"):
+                expected = [p.reflect(x=x, y=y) for p in self.points]
+                self.assertEqual(array.reflect(x=x, y=y).to_points(), expected)
+
+    def test_rotate(self):
+        """Test matching Point.rotate for every Point"""
+        array = PointArray.from_points(self.points)
+        around = Point(7, 7)
+        for degrees in [0, 90, 180, 270, 360, -90, -270]:
+            with self.subTest(f"testing degrees={degrees}"):
+                expected = [p.rotate(around=around, degrees=degrees) for p in array]
+                self.assertEqual(array.rotate(around, degrees).to_points(), expected)
+        self.assertRaises(ValueError, array.rotate, around, 45)
+
+    def test_borders(self):
+        """Test expanding to the union of every Point's borders"""
+        array = PointArray.from_points([Point(0, 0), Point(1, 0)])
+        expected = Point(0, 0).borders() | Point(1, 0).borders()
+        self.assertEqual(array.borders().to_points(), sorted(expected))
@@ -0,0 +1,73 @@
+"""Test profiling.py"""
+import unittest
+
+from playful.core import Point, profiling
+from playful.lingo import partitions
+from playful.minesweeper import Board
+
+
+class TestProfiling(unittest.TestCase):
+    """Test profiling functions"""
+
+    def setUp(self):
+        profiling.reset()
+
+    def tearDown(self):
+        profiling.reset()
+
+    def test_disabled(self):
+        """Test that nothing is recorded while profiling is off"""
+        self.assertFalse(profiling.enabled())
+        Point(0, 0).borders()
+        profiling.count("things", 3)
+        self.assertEqual(profiling.stats(), {})
+        self.assertEqual(profiling.counters(), {})
+
+    def test_context_manager(self):
+        """Test recording calls, time and counters inside the context manager"""
+        with profiling.profiling():
+            self.assertTrue(profiling.enabled())
+            Point(0, 0).borders()
+            Board.create(width=3, height=2, n_bombs=1, random_state=0)
+            partitions("cat", ["bat", "cat", "hat", "tac"])
+        self.assertFalse(profiling.enabled())
+
+        stats = profiling.stats()
+        self.assertNotIn("core.Point.borders", stats)
+        self.assertEqual(stats["minesweeper.Board.create"].calls, 1)
+        self.assertEqual(stats["lingo.partitions"].calls, 1)
+        self.assertEqual(stats["lingo.potential_solutions"].calls, 3)
+        self.assertGreaterEqual(stats["lingo.partitions"].seconds, 0.0)
+
+        counters = profiling.counters()
+        self.assertEqual(counters["core.points"], 6)
+        self.assertEqual(counters["lingo.candidates"], 4)
+        self.assertIn("lingo.partitions", profiling.report())
+
+    def test_profiled(self):
+        """Test profiling a function that raises an exception"""
+
+        @profiling.profiled("fail")
+        def fail():
+            raise ValueError("failed")
+
+        with profiling.profiling():
+            self.assertRaises(ValueError, fail)
+        self.assertEqual(profiling.stats()["fail"].calls, 1)
+        self.assertEqual(fail.__name__, "fail")
+
+    def test_reset(self):
+        """Test clearing the registry"""
+        profiling.enable()
+        try:
+            profiling.count("things", 3)
+            profiling.count("things")
+            self.assertEqual(profiling.counters(), {"things": 4})
+        finally:
+            profiling.disable()
+        profiling.reset()
+        self.assertEqual(profiling.counters(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,11 @@
+"""Test the playful.lingo package"""
+
+# fmt: off
+WORDS = [
+    # these words should all be uniquely identified by the guess "trace".
+    "artsy", "carve", "cater", "chart", "court", "craft", "crate", "croak",
+    "erect", "farce", "force", "great", "heart", "mecca", "price", "reach",
+    "react", "recut", "retch", "roach", "scare", "stack", "stare", "teach",
+    "teary", "tease", "tiara", "torch", "trace", "trade", "twice", "wreck",
+]
+# fmt: on
@@ -0,0 +1,69 @@
+"""Test lingo/batch.py"""
+import random
+from typing import List
+import unittest
+
+from playful.lingo import (
+    batch_feedback,
+    correct_letters,
+    decode_feedback,
+    encode_words,
+    excluded_letters,
+    misplaced_letters,
+)
+
+
+class TestBatchFeedback(unittest.TestCase):
+    """Test batch_feedback function"""
+
+    def assert_matches(
+        self, secrets: List[str], guesses: List[str], length: int
+    ) -> None:
+        """Assert that every pair matches the single-game functions"""
+        guess_codes = encode_words(guesses)
+        feedback = batch_feedback(encode_words(secrets), guess_codes, length)
+        for index, (secret, guess) in enumerate(zip(secrets, guesses)):
+            expected = (
+                correct_letters(secret, guess),
+                misplaced_letters(secret, guess),
+                excluded_letters(secret, guess),
+            )
+            self.assertEqual(
+                decode_feedback(feedback, guess_codes, length, index), expected
+            )
+
+    def test_duplicate_letters(self):
+        """Test the duplicate-letter rules, including repeated exclusions"""
+        secrets = ["array", "mamma", "eerie", "speed", "abbey", "shard", "kayak"]
+        guesses = ["rarer", "madam", "eeeee", "geese", "babes", "shard", "yakka"]
+        self.assert_matches(secrets, guesses, 5)
+
+    def test_encoding(self):
+        """Test the buffer encoding of each kind of feedback"""
+        feedback = batch_feedback(b"array", b"rarer", 5)
+        self.assertEqual(feedback.correct, bytearray(b"\x00\x00r\x00\x00"))
+        self.assertEqual(feedback.misplaced, bytearray(b"ra\x00\x00\x00"))
+        # "r" is first at index 0 and the secret has two; "e" isn't in the secret.
+        self.assertEqual(feedback.excluded, bytearray([3, 0, 0, 1, 0]))
+
+    def test_random(self):
+        """Test matching the single-game functions for random words"""
+        rng = random.Random(0)
+        for length, letters in [(1, "ab"), (3, "aab"), (5, "aabcdee"), (6, "xyz")]:
+            with self.subTest(f"testing length={length}"):
+                words = [
+                    "".join(rng.choice(letters) for _ in range(length))
+                    for _ in range(400)
+                ]
+                self.assert_matches(words[:200], words[200:], length)
+
+    def test_invalid(self):
+        """Test rejecting buffers of different sizes or word lengths"""
+        self.assertRaises(ValueError, batch_feedback, b"abc", b"abcd", 1)
+        self.assertRaises(ValueError, batch_feedback, b"abcd", b"abcd", 3)
+        self.assertRaises(ValueError, encode_words, ["a\x00c"])
+        self.assertEqual(batch_feedback(b"", b"", 5).correct, bytearray())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""Test lingo/cache.py"""
+from concurrent.futures import ThreadPoolExecutor
+import unittest
+from unittest import mock
+
+from playful.lingo import PartitionCache, partitions, potential_solutions
+from playful.lingo.cache import fingerprint
+
+from tests.lingo import WORDS
+
+
+class TestPartitionCache(unittest.TestCase):
+    """Test PartitionCache class"""
+
+    words = WORDS
+
+    def test_partitions(self):
+        """Test matching partitions, for the same words in any order"""
+        cache = PartitionCache()
+        expected = partitions(guess="crate", words=self.words)
+        self.assertEqual(cache.partitions("crate", self.words), expected)
+        self.assertEqual(cache.partitions("crate", reversed(self.words)), expected)
+        self.assertEqual(
+            cache.partitions("heart", self.words[:8]),
+            partitions("heart", self.words[:8]),
+        )
+        self.assertEqual(cache.info().hits, 1)
+        self.assertEqual(cache.info().misses, 2)
+
+    def test_potential_solutions(self):
+        """Test matching potential solutions, in the order of the words given"""
+        cache = PartitionCache()
+        for words in (self.words, self.words[::-1], self.words + self.words[:3]):
+            expected = potential_solutions("heart", "crate", words)
+            self.assertEqual(
+                cache.potential_solutions("heart", "crate", words), expected
+            )
+        self.assertEqual(cache.info().hits, 2)
+
+    def test_fingerprint(self):
+        """Test that fingerprints ignore order and repeats, but not the words"""
+        digest = fingerprint(self.words)
+        self.assertEqual(len(digest), 16)
+        self.assertEqual(fingerprint(reversed(self.words + self.words)), digest)
+        self.assertNotEqual(fingerprint(self.words[1:]), digest)
+        self.assertNotEqual(fingerprint(["ab", "c"]), fingerprint(["a", "bc"]))
+
+    def test_fingerprint_once(self):
+        """Test fingerprinting each collection of words once"""
+        cache = PartitionCache()
+        wordset = frozenset(self.words)
+        with mock.patch("playful.lingo.cache.fingerprint", wraps=fingerprint) as spy:
+            for guess in self.words:
+                cache.partitions(guess, wordset)
+                cache.potential_solutions("heart", guess, self.words)
+            cache.partitions("crate", self.words[:4])
+            self.assertEqual(spy.call_count, 2)
+            self.assertEqual(cache.invalidate(self.words[::-1]), 64)
+            self.assertEqual(spy.call_count, 2)
+
+    def test_copies(self):
+        """Test that changing a returned result doesn't change the cache"""
+        cache = PartitionCache()
+        cache.partitions("crate", self.words)[0].append("zzzzz")
+        self.assertEqual(
+            cache.partitions("crate", self.words), partitions("crate", self.words)
+        )
+
+    def test_eviction(self):
+        """Test discarding the least recently used result"""
+        cache = PartitionCache(maxsize=2)
+        cache.partitions("crate", self.words)
+        cache.partitions("heart", self.words)
+        cache.partitions("crate", self.words)
+        cache.partitions("force", self.words)  # evicts "heart"
+        self.assertEqual(len(cache), 2)
+        cache.partitions("crate", self.words)
+        cache.partitions("heart", self.words)
+        self.assertEqual(cache.info().hits, 2)
+        self.assertEqual(cache.info().misses, 4)
+        self.assertRaises(ValueError, PartitionCache, 0)
+
+    def test_invalidate(self):
+        """Test discarding the results of one word list, or all of them"""
+        cache = PartitionCache()
+        cache.partitions("crate", self.words)
+        cache.potential_solutions("heart", "crate", self.words[::-1])
+        cache.partitions("crate", self.words[:4])
+        self.assertEqual(cache.invalidate(self.words), 2)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.invalidate(), 1)
+        cache.clear()
+        self.assertEqual(cache.info().hits + cache.info().misses, 0)
+
+    def test_threads(self):
+        """Test sharing one cache between threads"""
+        cache = PartitionCache(maxsize=4)
+        guesses = self.words * 10
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(lambda g: cache.partitions(g, self.words), guesses)
+            )
+        for guess, result in zip(guesses, results):
+            self.assertEqual(result, partitions(guess, self.words))
+        info = cache.info()
+        self.assertEqual(info.hits + info.misses, len(guesses))
+        self.assertLessEqual(info.currsize, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Test lingo/constraint.py"""
+from itertools import product
+import unittest
+
+from playful.lingo import (
+    Constraint,
+    compile_constraint,
+    is_potential_solution,
+    letter_counts,
+    potential_solutions,
+)
+
+
+class TestConstraint(unittest.TestCase):
+    """Test Constraint class"""
+
+    words = ["".join(letters) for letters in product("abc", repeat=3)]
+
+    def test_from_feedback(self):
+        """Test compiling correct, misplaced and excluded letters"""
+        constraint = Constraint.from_feedback(
+            correct=("r", "", "", "", ""),
+            misplaced=("", "", "o", "", ""),
+            excluded=("rr", "w", "y"),
+        )
+        self.assertEqual(constraint.masks[0], 1 << ord("r"))
+        self.assertEqual(constraint.masks[1], -1)
+        self.assertEqual(constraint.masks[2], ~(1 << ord("o")))
+        self.assertEqual(constraint.minimum, (("o", 1),))
+        self.assertEqual(constraint.maximum, (("r", 1), ("w", 0), ("y", 0)))
+
+    def test_matches(self):
+        """Test matching the same words as `is_potential_solution`"""
+        for secret, guess in product(self.words, repeat=2):
+            constraint = compile_constraint(secret=secret, guess=guess)
+            for word in self.words:
+                self.assertEqual(
+                    constraint.matches(word),
+                    is_potential_solution(secret=secret, guess=guess, word=word),
+                )
+
+    def test_filter_with_counts(self):
+        """Test filtering words in bulk using precomputed letter counts"""
+        counts = letter_counts(self.words)
+        for secret, guess in product(self.words, repeat=2):
+            constraint = compile_constraint(secret=secret, guess=guess)
+            self.assertListEqual(
+                constraint.filter(self.words, counts=counts),
+                constraint.filter(self.words),
+            )
+
+    def test_potential_solutions(self):
+        """Test identifying the potential solutions among a list of words"""
+        words = ["robed", "river", "rowed", "roped", "bored"]
+        expected = ["robed", "roped"]
+        self.assertEqual(potential_solutions("robed", "worry", words), expected)
+
+    def test_letter_counts(self):
+        """Test counting the letters of every word"""
+        counts = letter_counts(["abbot", "robed"])
+        self.assertEqual(list(counts["b"]), [2, 1])
+        self.assertEqual(list(counts["r"]), [0, 1])
+        self.assertNotIn("z", counts)
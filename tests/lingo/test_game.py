@@ -1,4 +1,4 @@
-"""Test playful/lingo.py"""
+"""Test lingo/game.py"""
 import unittest
 
 from playful.lingo import (
@@ -13,6 +13,8 @@ from playful.lingo import (
     partitions,
 )
 
+from tests.lingo import WORDS
+
 
 class TestLingo(unittest.TestCase):
     """Test Lingo functions"""
@@ -123,28 +125,10 @@ class TestLingo(unittest.TestCase):
 
     def test_single_partitions(self):
         """Test identifying known single-word partitions for a given guess"""
-        # fmt: off
-        words = [
-            # these words should all be uniquely identified by the guess "trace".
-            "artsy", "carve", "cater", "chart", "court", "craft", "crate", "croak",
-            "erect", "farce", "force", "great", "heart", "mecca", "price", "reach",
-            "react", "recut", "retch", "roach", "scare", "stack", "stare", "teach",
-            "teary", "tease", "tiara", "torch", "trace", "trade", "twice", "wreck",
-        ]
-        # fmt: on
         self.assertListEqual(
-            partitions(guess="trace", words=words), [[word] for word in words]
+            partitions(guess="trace", words=WORDS), [[word] for word in WORDS]
         )
 
     def test_best_splitting_word(self):
         """Test identifying the word that splits a collection of words the best"""
-        # fmt: off
-        words = [
-            # these words should all be uniquely identified by the guess "trace".
-            "artsy", "carve", "cater", "chart", "court", "craft", "crate", "croak",
-            "erect", "farce", "force", "great", "heart", "mecca", "price", "reach",
-            "react", "recut", "retch", "roach", "scare", "stack", "stare", "teach",
-            "teary", "tease", "tiara", "torch", "trace", "trade", "twice", "wreck",
-        ]
-        # fmt: on
-        self.assertEqual(best_splitting_word(candidates=words, words=words), "trace")
+        self.assertEqual(best_splitting_word(candidates=WORDS, words=WORDS), "trace")
@@ -0,0 +1,77 @@
+"""Test lingo/packed.py"""
+import os
+import pickle
+import tempfile
+import unittest
+
+from playful.lingo import (
+    PackedWords,
+    best_splitting_word,
+    pack_words,
+    partitions,
+    potential_solutions,
+    write_packed,
+)
+
+from tests.lingo import WORDS
+
+
+class TestPackedWords(unittest.TestCase):
+    """Test PackedWords class"""
+
+    words = WORDS
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".plwd")
+        os.close(handle)
+        write_packed(self.words[::-1] + ["trace"], self.path)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_sequence(self):
+        """Test decoding words as a sorted, unique sequence"""
+        packed = PackedWords(pack_words(self.words[::-1] + ["trace"]))
+        self.assertEqual(len(packed), len(self.words))
+        self.assertEqual(list(packed), self.words)
+        self.assertEqual(packed[-1], "wreck")
+        self.assertEqual(packed[1:3], ["carve", "cater"])
+        self.assertRaises(IndexError, packed.__getitem__, len(self.words))
+
+    def test_letter_counts(self):
+        """Test reading letter counts from the histogram table"""
+        packed = PackedWords(pack_words(self.words))
+        counts = packed.letter_counts()
+        for letter in ["a", "c", "e", "z"]:
+            with self.subTest(f"testing letter='{letter}'"):
+                column = counts.get(letter)
+                expected = [word.count(letter) for word in self.words]
+                self.assertEqual(list(column) if column else [0] * 32, expected)
+
+    def test_load(self):
+        """Test memory-mapping a packed file and pickling it by path"""
+        packed = PackedWords.load(self.path)
+        self.assertEqual(list(packed), self.words)
+        self.assertEqual(list(pickle.loads(pickle.dumps(packed))), self.words)
+        packed.close()
+
+    def test_lingo_functions(self):
+        """Test passing packed words directly to the lingo functions"""
+        packed = PackedWords.load(self.path)
+        for secret, guess in [("heart", "trace"), ("mecca", "croak")]:
+            with self.subTest(f"testing secret='{secret}' with guess='{guess}'"):
+                self.assertEqual(
+                    potential_solutions(secret, guess, packed),
+                    potential_solutions(secret, guess, self.words),
+                )
+        for guess in ["trace", "mecca", "stack"]:
+            with self.subTest(f"testing guess='{guess}'"):
+                self.assertEqual(
+                    partitions(guess, packed), partitions(guess, self.words)
+                )
+        self.assertEqual(best_splitting_word(self.words, packed), "trace")
+
+    def test_invalid(self):
+        """Test raising errors for words that can't be packed or unpacked"""
+        self.assertRaises(ValueError, pack_words, ["trace", "tracer"])
+        self.assertRaises(ValueError, PackedWords, b"JUNK" + bytes(12))
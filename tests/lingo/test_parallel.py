@@ -0,0 +1,42 @@
+"""Test lingo/parallel.py"""
+import unittest
+
+from playful.lingo import ParallelSplitter, best_splitting_word, partitions
+from playful.lingo.parallel import _load_words, _partition_counts
+
+from tests.lingo import WORDS
+
+
+class TestParallelSplitter(unittest.TestCase):
+    """Test ParallelSplitter class"""
+
+    words = WORDS
+
+    def test_chunks(self):
+        """Test dividing candidates into consecutive chunks"""
+        with ParallelSplitter(self.words, workers=1, chunksize=3) as splitter:
+            chunks = splitter.chunks(["a", "b", "c", "d", "e", "f", "g"])
+        self.assertEqual(chunks, [["a", "b", "c"], ["d", "e", "f"], ["g"]])
+
+    def test_best_splitting_word(self):
+        """Test matching the serial search, including how ties are broken"""
+        # "trade" and "teach" tie for the most partitions; the first should win.
+        candidates = ["mecca", "trade", "court", "teach", "stack"]
+        with ParallelSplitter(self.words, workers=2, chunksize=1) as splitter:
+            for order in [candidates, candidates[::-1], self.words]:
+                with self.subTest(f"testing candidates={order}"):
+                    expected = best_splitting_word(candidates=order, words=self.words)
+                    self.assertEqual(splitter.best_splitting_word(order), expected)
+
+    def test_empty_candidates(self):
+        """Test returning an empty string when there are no candidates"""
+        with ParallelSplitter(self.words, workers=1) as splitter:
+            self.assertEqual(splitter.best_splitting_word([]), "")
+
+    def test_partition_counts(self):
+        """Test scoring candidates among the words a worker loaded, or the words sent"""
+        self.addCleanup(_load_words, [])
+        expected = [len(partitions(guess="trace", words=self.words))]
+        self.assertEqual(_partition_counts(["trace"], self.words), expected)
+        _load_words(self.words)
+        self.assertEqual(_partition_counts(["trace"]), expected)
@@ -0,0 +1,81 @@
+"""Test lingo/pattern.py"""
+from itertools import product
+import unittest
+
+from playful.lingo import (
+    PatternMatrix,
+    best_splitting_word,
+    correct_letters,
+    excluded_letters,
+    feedback_pattern,
+    misplaced_letters,
+    partitions,
+    pattern_digits,
+    pattern_feedback,
+)
+
+from tests.lingo import WORDS
+
+
+class TestPattern(unittest.TestCase):
+    """Test feedback patterns and the PatternMatrix"""
+
+    words = WORDS
+
+    def test_pattern_digits(self):
+        """Test decoding a pattern into correct, misplaced and absent digits"""
+        cases = [
+            ("match", "match", (2, 2, 2, 2, 2)),
+            ("tacos", "teach", (2, 0, 1, 1, 0)),
+            ("misos", "mosso", (2, 1, 2, 1, 0)),
+            ("misos", "sassy", (1, 0, 2, 0, 0)),
+            ("crazy", "jazzy", (0, 1, 0, 2, 2)),
+        ]
+        for secret, guess, output in cases:
+            with self.subTest(f"testing secret='{secret}' with guess='{guess}'"):
+                pattern = feedback_pattern(secret=secret, guess=guess)
+                self.assertEqual(pattern_digits(pattern, len(guess)), output)
+
+    def test_pattern_feedback(self):
+        """Test that patterns decode to the same letters as the lingo functions"""
+        alphabet = "abc"
+        for secret_letters, guess_letters in product(
+            product(alphabet, repeat=4), repeat=2
+        ):
+            secret, guess = "".join(secret_letters), "".join(guess_letters)
+            expected = (
+                correct_letters(secret=secret, guess=guess),
+                misplaced_letters(secret=secret, guess=guess),
+                excluded_letters(secret=secret, guess=guess),
+            )
+            pattern = feedback_pattern(secret=secret, guess=guess)
+            self.assertEqual(pattern_feedback(guess, pattern), expected)
+
+    def test_partitions(self):
+        """Test that the matrix partitions words the same way as `partitions`"""
+        matrix = PatternMatrix(guesses=self.words, secrets=self.words)
+        for guess in ["trace", "chart", "teach", "stack"]:
+            with self.subTest(f"testing guess='{guess}'"):
+                expected = partitions(guess=guess, words=self.words)
+                self.assertListEqual(matrix.partitions(guess), expected)
+                self.assertEqual(matrix.partition_count(guess), len(expected))
+
+    def test_partitions_repeated_letters(self):
+        """Test that guesses with repeated letters are partitioned by exact feedback"""
+        matrix = PatternMatrix(guesses=["mecca"], secrets=["court", "torch"])
+        self.assertListEqual(matrix.partitions("mecca"), [["court"], ["torch"]])
+        self.assertEqual(matrix.partition_count("mecca"), 2)
+        expected = partitions(guess="mecca", words=["court", "torch"])
+        self.assertListEqual(expected, [["court", "torch"]])
+
+    def test_best_splitting_word(self):
+        """Test that the matrix chooses the same splitting word as the lingo function"""
+        matrix = PatternMatrix(guesses=self.words, secrets=self.words)
+        expected = best_splitting_word(candidates=self.words, words=self.words)
+        self.assertEqual(matrix.best_splitting_word(), expected)
+        self.assertEqual(matrix.best_splitting_word(["croak", "stack"]), "croak")
+
+    def test_unknown_guess(self):
+        """Test raising an error when asking for a row that wasn't precomputed"""
+        matrix = PatternMatrix(guesses=["trace"], secrets=self.words)
+        self.assertRaises(KeyError, matrix.row, "crate")
@@ -0,0 +1,51 @@
+"""Test lingo/session.py"""
+import unittest
+
+from playful.lingo import LingoSession, PatternMatrix, feedback_pattern
+
+from tests.lingo import WORDS
+
+
+class TestLingoSession(unittest.TestCase):
+    """Test LingoSession class"""
+
+    words = WORDS
+
+    def test_guess(self):
+        """Test narrowing down candidates with the feedback from several guesses"""
+        session, expected = LingoSession(self.words), sorted(self.words)
+        for guess in ["mecca", "stack", "great"]:
+            pattern = feedback_pattern(secret="heart", guess=guess)
+            expected = [w for w in expected if feedback_pattern(w, guess) == pattern]
+            self.assertEqual(session.guess(guess, pattern), len(expected))
+            self.assertEqual(session.candidates(), expected)
+        self.assertEqual(session.candidates(), ["heart"])
+        self.assertEqual(len(session.history), 3)
+
+    def test_contains(self):
+        """Test checking whether a word is still a candidate"""
+        session = LingoSession(self.words)
+        session.guess("mecca", feedback_pattern(secret="heart", guess="mecca"))
+        self.assertIn("heart", session)
+        self.assertNotIn("mecca", session)
+        self.assertNotIn("zzzzz", session)
+        self.assertNotIn(5, session)
+
+    def test_reset(self):
+        """Test starting a new game from the full dictionary"""
+        session = LingoSession(self.words)
+        session.guess("trace", feedback_pattern(secret="heart", guess="trace"))
+        session.reset()
+        self.assertEqual(session.candidates(), sorted(self.words))
+        self.assertEqual(session.history, [])
+
+    def test_best_splitting_word(self):
+        """Test choosing the best splitting word among the remaining candidates"""
+        session = LingoSession(self.words)
+        self.assertEqual(session.best_splitting_word(), "trace")
+        session.guess("mecca", feedback_pattern(secret="heart", guess="mecca"))
+        matrix = PatternMatrix(guesses=self.words, secrets=session.candidates())
+        self.assertEqual(
+            session.best_splitting_word(self.words), matrix.best_splitting_word()
+        )
+        self.assertEqual(session.partitions("trace"), matrix.partitions("trace"))
@@ -0,0 +1,75 @@
+"""Test lingo/tree.py"""
+import os
+import tempfile
+from typing import List
+import unittest
+
+from playful.lingo import DecisionTree, best_splitting_word, feedback_pattern
+
+from tests.lingo import WORDS
+
+
+def play(tree: DecisionTree, secret: str) -> List[str]:
+    """Return the guesses a tree makes to find a secret word"""
+    patterns: List[int] = []
+    guesses: List[str] = []
+    while True:
+        guess = tree.guess(patterns)
+        guesses.append(guess)
+        if guess == secret:
+            return guesses
+        patterns.append(feedback_pattern(secret=secret, guess=guess))
+
+
+class TestDecisionTree(unittest.TestCase):
+    """Test DecisionTree class"""
+
+    words = WORDS
+
+    def test_solves_every_word(self):
+        """Test finding every secret word, with every score"""
+        for score in ("partitions", "expected", "minimax"):
+            with self.subTest(f"testing score={score}"):
+                tree = DecisionTree.build(self.words, score=score)
+                self.assertEqual(tree.secrets(), len(self.words))
+                depths = [len(play(tree, secret)) for secret in self.words]
+                self.assertEqual(max(depths), tree.max_guesses())
+                self.assertAlmostEqual(
+                    sum(depths) / len(depths), tree.average_guesses()
+                )
+
+    def test_first_guess(self):
+        """Test choosing the same first guess as the greedy search"""
+        tree = DecisionTree.build(self.words, score="partitions")
+        expected = best_splitting_word(candidates=self.words, words=self.words)
+        self.assertEqual(tree.guess(), expected)
+
+    def test_guesses(self):
+        """Test guessing from a separate list of allowed words"""
+        guesses = ["reach", "stack", "court", "wimpy"]
+        tree = DecisionTree.build(self.words, guesses=guesses, score="expected")
+        self.assertIn(tree.guess(), guesses)
+        for secret in self.words:
+            self.assertEqual(play(tree, secret)[-1], secret)
+        self.assertRaises(ValueError, DecisionTree.build, self.words, score="best")
+
+    def test_unknown_feedback(self):
+        """Test raising an error for feedback that no word can produce"""
+        tree = DecisionTree.build(self.words)
+        self.assertRaises(KeyError, tree.guess, [0, 0, 0, 0])
+
+    def test_save_load(self):
+        """Test round-tripping a tree through a file"""
+        tree = DecisionTree.build(self.words, score="minimax")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "words.pltr")
+            tree.save(path)
+            loaded = DecisionTree.load(path)
+        self.assertEqual(loaded, tree)
+        for secret in self.words:
+            self.assertEqual(play(loaded, secret), play(tree, secret))
+        self.assertRaises(ValueError, DecisionTree.loads, b"not a tree")
+
+
+if __name__ == "__main__":
+    unittest.main()
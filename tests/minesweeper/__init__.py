@@ -0,0 +1,11 @@
+"""Test the playful.minesweeper package"""
+from playful.core import Point
+from playful.minesweeper.cell import Cell
+
+# a 2x2 Board with a Cell in every state
+CELLS = {
+    Cell(Point(0, 0), value=-1, state="hidden"),
+    Cell(Point(1, 0), value=2, state="revealed"),
+    Cell(Point(0, 1), value=-1, state="flagged"),
+    Cell(Point(1, 1), value=2, state="revealed"),
+}
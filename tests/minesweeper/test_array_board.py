@@ -0,0 +1,127 @@
+"""Test minesweeper/array_board.py"""
+import unittest
+
+from playful.core import Point
+from playful.minesweeper.array_board import (
+    STATES,
+    ArrayBoard,
+    PackedBoard,
+    encode_cell,
+)
+from playful.minesweeper.board import Board
+from playful.minesweeper.cell import Cell
+
+
+class TestArrayBoard(unittest.TestCase):
+    """Test ArrayBoard class"""
+
+    cells = {
+        Cell(Point(0, 0), value=-1, state="hidden"),
+        Cell(Point(1, 0), value=2, state="revealed"),
+        Cell(Point(2, 0), value=1, state="hidden"),
+        Cell(Point(0, 1), value=-1, state="flagged"),
+        Cell(Point(1, 1), value=2, state="revealed"),
+        Cell(Point(2, 1), value=1, state="hidden"),
+    }
+
+    def test_round_trip(self):
+        """Test converting to and from a Board"""
+        board = ArrayBoard.from_board(Board(self.cells))
+        self.assertEqual(board.to_cells(), self.cells)
+        self.assertEqual(board.to_board(), Board(self.cells))
+
+    def test_repr(self):
+        """Test matching the string representation of the Board"""
+        board = ArrayBoard.from_cells(self.cells)
+        expected = repr(Board(self.cells)).replace("Board", "ArrayBoard")
+        self.assertEqual(repr(board), expected)
+
+    def test_queries(self):
+        """Test matching the dimensions, bombs and Cell queries of the Board"""
+        board, expected = ArrayBoard.from_cells(self.cells), Board(self.cells)
+        self.assertEqual(board.width, expected.width)
+        self.assertEqual(board.height, expected.height)
+        self.assertEqual(board.bombs, expected.bombs)
+        self.assertEqual(board.states(), expected.states())
+        self.assertEqual(board.bomb_cells(), expected.bomb_cells())
+        self.assertEqual(board.safe_cells(), expected.safe_cells())
+        self.assertEqual(board.flagged_cells(), expected.flagged_cells())
+        self.assertEqual(board.hidden_cells(), expected.hidden_cells())
+        self.assertEqual(board.revealed_cells(), expected.revealed_cells())
+
+    def test_cell(self):
+        """Test looking up Cells, values and states by Point"""
+        board = ArrayBoard.from_cells(self.cells)
+        self.assertEqual(board[Point(1, 0)], Cell(Point(1, 0), 2, "revealed"))
+        self.assertEqual(board.value(Point(0, 1)), -1)
+        self.assertEqual(board.state(Point(0, 1)), "flagged")
+        self.assertIn(Point(2, 1), board)
+        self.assertNotIn(Point(3, 1), board)
+        self.assertRaises(IndexError, board.cell, Point(-1, 0))
+
+    def test_neighbors(self):
+        """Test matching the neighbors found by Cell.neighbors"""
+        board = ArrayBoard.from_cells(self.cells)
+        for cell in self.cells:
+            with self.subTest(f"testing cell={cell}"):
+                self.assertEqual(
+                    board.neighbors(cell.location), cell.neighbors(self.cells)
+                )
+                self.assertEqual(
+                    board.neighbor_states(cell.location),
+                    cell.neighbor_states(self.cells),
+                )
+
+    def test_set_state(self):
+        """Test changing Cell states and keeping state counts up to date"""
+        board = ArrayBoard.from_cells(self.cells)
+        cell = board.set_state(Point(2, 0), "flagged")
+        self.assertEqual(cell, Cell(Point(2, 0), 1, "flagged"))
+        self.assertEqual(board.states(), dict(flagged=2, hidden=2, revealed=2))
+        board.set_state(Point(0, 0), "revealed")
+        board.set_state(Point(2, 1), "revealed")
+        self.assertEqual(board.states(), dict(flagged=2, revealed=4))
+        self.assertEqual(board.hidden_cells(), set())
+
+    def test_reveal(self):
+        """Test revealing Cells in place, matching Board.reveal"""
+        expected = Board.create(width=20, height=20, n_bombs=30, random_state=5)
+        board = ArrayBoard.from_board(expected)
+        for point in [Point(0, 0), Point(19, 19), Point(8, 3), Point(8, 3)]:
+            with self.subTest(f"testing point={point}"):
+                expected, changed = expected.reveal(point)
+                self.assertCountEqual(board.reveal(point), changed)
+                self.assertEqual(board.to_board(), expected)
+
+    def test_won_and_lost(self):
+        """Test matching whether the Board is won or lost as Cells are revealed"""
+        expected = Board.create(width=6, height=5, n_bombs=4, random_state=2)
+        board = ArrayBoard.from_board(expected)
+        for cell in sorted(expected.safe_cells()) + sorted(expected.bomb_cells()):
+            with self.subTest(f"testing cell={cell}"):
+                board.set_state(cell.location, "revealed")
+                expected = expected.update([cell.reveal()])
+                self.assertEqual(board.is_won(), expected.is_won())
+                self.assertEqual(board.is_lost(), expected.is_lost())
+                counts = [board.states()[state] for state in STATES]
+                loaded = ArrayBoard.from_buffer(
+                    board.width, board.height, board.cells, counts, board.bombs
+                )
+                self.assertEqual(loaded.is_lost(), expected.is_lost())
+        self.assertTrue(board.is_lost())
+
+    def test_flag(self):
+        """Test flagging and unflagging Cells in place"""
+        board = ArrayBoard.from_cells(self.cells)
+        self.assertEqual(board.flag(Point(2, 0)), [Cell(Point(2, 0), 1, "flagged")])
+        self.assertEqual(board.flag(Point(2, 0)), [Cell(Point(2, 0), 1, "hidden")])
+        self.assertEqual(board.flag(Point(1, 0)), [])
+        self.assertEqual(board.to_cells(), self.cells)
+
+    def test_invalid(self):
+        """Test raising errors for cells that don't cover a rectangle"""
+        self.assertRaises(ValueError, ArrayBoard, 2, 2, bytearray(3))
+        cells = set(self.cells) - {Cell(Point(1, 1), value=2, state="revealed")}
+        self.assertRaises(ValueError, ArrayBoard.from_cells, cells)
+        self.assertEqual(encode_cell(-1, "hidden"), 0)
+        self.assertRaises(TypeError, PackedBoard)
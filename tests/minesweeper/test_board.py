@@ -4,17 +4,13 @@ import unittest
 from playful.core import Point
 from playful.minesweeper.board import Board
 from playful.minesweeper.cell import Cell
+from tests.minesweeper import CELLS
 
 
 class TestPoint(unittest.TestCase):
     """Test Board class"""
 
-    cells = {
-        Cell(Point(0, 0), value=-1, state="hidden"),
-        Cell(Point(1, 0), value=2, state="revealed"),
-        Cell(Point(0, 1), value=-1, state="flagged"),
-        Cell(Point(1, 1), value=2, state="revealed"),
-    }
+    cells = CELLS
 
     def test_bomb_repr(self):
         """Test the string representation of the Board"""
@@ -75,3 +71,56 @@ class TestPoint(unittest.TestCase):
             Cell(Point(1, 1), value=2, state="revealed"),
         }
         self.assertEqual(Board(self.cells).revealed_cells(), expected)
+
+    def test_reveal(self):
+        """Test revealing a Cell and cascading through Cells with no bombs nearby"""
+        board = Board.create(width=3, height=3, n_bombs=0, random_state=0)
+        board, _ = board.flag(Point(1, 1))
+        board, changed = board.reveal(Point(0, 0))
+        self.assertEqual(changed[0], Cell(Point(0, 0), value=0, state="revealed"))
+        self.assertEqual(len(changed), 8)
+        self.assertEqual(board.states(), dict(flagged=1, revealed=8))
+        self.assertEqual(board.reveal(Point(2, 2)), (board, []))
+        self.assertRaises(KeyError, board.reveal, Point(3, 3))
+
+    def test_reveal_numbers(self):
+        """Test revealing Cells that border bombs without cascading"""
+        board, changed = Board(self.cells).reveal(Point(0, 0))
+        self.assertEqual(changed, [Cell(Point(0, 0), value=-1, state="revealed")])
+        self.assertEqual(board.states(), dict(flagged=1, revealed=3))
+
+    def test_flag(self):
+        """Test flagging and unflagging Cells"""
+        board, changed = Board(self.cells).flag(Point(0, 0))
+        self.assertEqual(changed, [Cell(Point(0, 0), value=-1, state="flagged")])
+        board, changed = board.flag(Point(0, 0))
+        self.assertEqual(changed, [Cell(Point(0, 0), value=-1, state="hidden")])
+        self.assertEqual(board, Board(self.cells))
+        self.assertEqual(board.flag(Point(1, 0)), (board, []))
+
+    def test_is_won_and_is_lost(self):
+        """Test checking whether a game has been won or lost"""
+        board = Board(self.cells)
+        self.assertEqual((board.is_won(), board.is_lost()), (True, False))
+        lost, _ = board.reveal(Point(0, 0))
+        self.assertEqual((lost.is_won(), lost.is_lost()), (False, True))
+        board = Board.create(width=3, height=3, n_bombs=1, random_state=0)
+        self.assertEqual((board.is_won(), board.is_lost()), (False, False))
+        for cell in board.safe_cells():
+            board, _ = board.reveal(cell.location)
+        self.assertEqual((board.is_won(), board.is_lost()), (True, False))
+
+    def test_index_after_moves(self):
+        """Test that Boards answer the same way before and after playing from them"""
+        before = Board.create(width=4, height=4, n_bombs=3, random_state=1)
+        point = next(iter(before.safe_cells())).location
+        after, _ = before.reveal(point)
+        after, _ = after.flag(next(iter(after.bomb_cells())).location)
+        for board in (before, after):
+            rebuilt = Board(set(board.cells))
+            self.assertEqual(board.states(), rebuilt.states())
+            self.assertEqual(board.hidden_cells(), rebuilt.hidden_cells())
+            self.assertEqual(board.flagged_cells(), rebuilt.flagged_cells())
+            self.assertEqual(board.bomb_cells(), rebuilt.bomb_cells())
+            self.assertEqual(board.locations(), rebuilt.locations())
+        self.assertEqual(before.states(), {"hidden": 16})
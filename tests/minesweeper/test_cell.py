@@ -44,3 +44,12 @@ class TestPoint(unittest.TestCase):
         }
         neighbor_states = {"hidden": 1, "revealed": 2, "flagged": 1}
         self.assertEqual(home.neighbor_states(cells), neighbor_states)
+
+    def test_toggle_flag(self):
+        """Test adding and removing flags, but never on revealed Cells"""
+        hidden = Cell(Point(1, 2), 3, "hidden")
+        flagged = hidden.toggle_flag()
+        self.assertEqual(flagged, Cell(Point(1, 2), 3, "flagged"))
+        assert flagged is not None
+        self.assertEqual(flagged.toggle_flag(), hidden)
+        self.assertIsNone(hidden.reveal().toggle_flag())
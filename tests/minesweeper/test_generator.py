@@ -0,0 +1,92 @@
+"""Test minesweeper/generator.py"""
+import random
+import unittest
+
+from playful.core import Point
+from playful.minesweeper.array_board import ArrayBoard
+from playful.minesweeper.generator import (
+    BoardPool,
+    board_seeds,
+    deduce,
+    generate,
+    move_bomb,
+    random_board,
+    relocate,
+)
+from playful.minesweeper.layout import hidden_layout
+
+
+def is_solved(board: ArrayBoard) -> bool:
+    """Return a boolean indicating if every safe Cell has been revealed"""
+    return board.states()["revealed"] == len(board) - board.bombs
+
+
+class TestGenerator(unittest.TestCase):
+    """Test generator functions"""
+
+    def test_generate(self):
+        """Test that generated Boards are solvable from the first click"""
+        for width, height, n_bombs in ((9, 9, 10), (16, 16, 40), (30, 16, 99)):
+            start = Point(width // 2, height // 2)
+            with self.subTest(width=width, height=height, n_bombs=n_bombs):
+                board = generate(width, height, n_bombs, start, seed=0)
+                self.assertEqual(board.bombs, n_bombs)
+                self.assertEqual(board.states(), {"hidden": width * height})
+                self.assertEqual(board.value(start), 0)
+                played = board.copy()
+                deduce(played, start)
+                self.assertTrue(is_solved(played))
+                mask = bytearray(not code for code in board.cells)
+                self.assertEqual(board.cells, hidden_layout(mask, width, height))
+
+    def test_deterministic(self):
+        """Test that the same seed generates the same Board"""
+        first = generate(16, 16, 40, Point(0, 0), seed=5)
+        self.assertEqual(first.cells, generate(16, 16, 40, Point(0, 0), seed=5).cells)
+        self.assertNotEqual(
+            first.cells, generate(16, 16, 40, Point(0, 0), seed=6).cells
+        )
+
+    def test_move_bomb(self):
+        """Test moving bombs next to and far from each other"""
+        rng = random.Random(0)
+        board = random_board(8, 8, 12, Point(0, 0), rng)
+        for _ in range(50):
+            bombs = [i for i, code in enumerate(board.cells) if not code]
+            safe = [i for i, code in enumerate(board.cells) if code]
+            move_bomb(board, rng.choice(bombs), rng.choice(safe))
+            mask = bytearray(not code for code in board.cells)
+            self.assertEqual(board.cells, hidden_layout(mask, 8, 8))
+        self.assertEqual(board.bombs, 12)
+        self.assertRaises(ValueError, move_bomb, board, safe[0], safe[1])
+
+    def test_relocate(self):
+        """Test moving bombs away from where play got stuck"""
+        rng, start = random.Random(1), Point(15, 8)
+        while True:
+            board = random_board(30, 16, 99, start, rng)
+            played = board.copy()
+            deduce(played, start)
+            if not is_solved(played):
+                break
+        before = bytes(board.cells)
+        self.assertTrue(relocate(board, played, rng))
+        self.assertNotEqual(bytes(board.cells), before)
+        self.assertEqual(bytes(board.cells).count(0), 99)
+        self.assertFalse(relocate(ArrayBoard(3, 3), ArrayBoard(3, 3), rng))
+
+    def test_too_many_bombs(self):
+        """Test that the first click and its neighbors must be able to stay clear"""
+        self.assertRaises(ValueError, generate, 3, 3, 1, Point(1, 1))
+
+    def test_board_pool(self):
+        """Test handing out Boards, with and without worker processes"""
+        seeds = board_seeds(3, seed=2)
+        expected = [generate(9, 9, 10, Point(4, 4), seed=s).cells for s in seeds]
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                with BoardPool(
+                    9, 9, 10, Point(4, 4), size=2, seed=2, workers=workers
+                ) as pool:
+                    boards = [pool.get().cells for _ in range(3)]
+                self.assertEqual(boards, expected)
@@ -0,0 +1,46 @@
+"""Test minesweeper/index.py"""
+import unittest
+
+from playful.core import Point
+from playful.minesweeper.cell import Cell
+from playful.minesweeper.index import BoardIndex
+
+
+class TestBoardIndex(unittest.TestCase):
+    """Test BoardIndex class"""
+
+    cells = {
+        Cell(Point(0, 0), value=-1, state="hidden"),
+        Cell(Point(1, 0), value=2, state="revealed"),
+        Cell(Point(0, 1), value=-1, state="flagged"),
+        Cell(Point(1, 1), value=2, state="hidden"),
+    }
+
+    def test_groups(self):
+        """Test grouping Cells by state and bomb"""
+        index = BoardIndex(self.cells)
+        self.assertEqual(len(index), 4)
+        self.assertEqual((index.width, index.height), (2, 2))
+        self.assertEqual(index.cells(), self.cells)
+        self.assertEqual(index.states(), dict(flagged=1, hidden=2, revealed=1))
+        self.assertEqual(
+            {cell.location for cell in index.bombs}, {Point(0, 0), Point(0, 1)}
+        )
+        self.assertEqual(
+            index.cells("hidden"), {c for c in self.cells if c.state == "hidden"}
+        )
+        self.assertEqual(index.cells("unknown"), set())
+
+    def test_apply(self):
+        """Test replacing Cells, and checking whether the game is won or lost"""
+        index = BoardIndex(self.cells)
+        self.assertEqual((index.is_won(), index.is_lost()), (False, False))
+        index.apply([Cell(Point(1, 1), value=2, state="revealed")])
+        self.assertEqual(index.states(), dict(flagged=1, hidden=1, revealed=2))
+        self.assertEqual((index.is_won(), index.is_lost()), (True, False))
+        index.apply([Cell(Point(0, 0), value=-1, state="revealed")])
+        self.assertEqual((index.is_won(), index.is_lost()), (False, True))
+        index.apply([Cell(Point(0, 0), value=-1, state="flagged")])
+        self.assertEqual(index.exploded, 0)
+        self.assertEqual(len(index.bombs), 2)
+        self.assertEqual(index.states(), dict(flagged=2, revealed=2))
@@ -0,0 +1,88 @@
+"""Test minesweeper/infinite.py"""
+import unittest
+
+from playful.core import Point
+from playful.minesweeper.infinite import InfiniteBoard
+from playful.minesweeper.render import Viewport
+
+
+class TestInfiniteBoard(unittest.TestCase):
+    """Test InfiniteBoard class"""
+
+    region = [Point(x, y) for x in range(-10, 10) for y in range(-10, 10)]
+
+    def test_values(self):
+        """Test that values count the bombs around each Cell, across chunk borders"""
+        board = InfiniteBoard(seed=1, density=0.25, chunk_size=4)
+        for point in self.region:
+            cell = board[point]
+            if not cell.is_bomb():
+                bombs = sum(board.value(p) == -1 for p in point.borders())
+                self.assertEqual(cell.value, bombs)
+        self.assertEqual(board.chunks(), 36)
+        self.assertEqual(len(board.neighbors(Point(0, 0))), 8)
+
+    def test_deterministic(self):
+        """Test that chunks are the same for any chunk cache size"""
+        large = InfiniteBoard(seed=7, chunk_size=4)
+        small = InfiniteBoard(seed=7, chunk_size=4, max_chunks=1)
+        other = InfiniteBoard(seed=8, chunk_size=4)
+        self.assertEqual(
+            [large.value(p) for p in self.region], [small.value(p) for p in self.region]
+        )
+        self.assertNotEqual(
+            [large.value(p) for p in self.region], [other.value(p) for p in self.region]
+        )
+        self.assertEqual(small.chunks(), 1)
+        bombs = sum(large.value(Point(x, y)) == -1 for x in range(4) for y in range(4))
+        self.assertEqual(bombs, round(0.2 * 16))
+
+    def test_moves_survive_eviction(self):
+        """Test that reveals and flags are kept when chunks are discarded"""
+        board = InfiniteBoard(seed=3, chunk_size=4, max_chunks=2)
+        safe = next(p for p in self.region if board.value(p) > 0)
+        bomb = next(p for p in self.region if board.value(p) == -1)
+        self.assertEqual(board.reveal(safe), [board.cell(safe)])
+        self.assertEqual(board.flag(bomb)[0].state, "flagged")
+        board.visualize(Viewport(100, 100, 20, 20))
+        self.assertEqual(board.state(safe), "revealed")
+        self.assertEqual(board.state(bomb), "flagged")
+        self.assertEqual(board.states(), dict(flagged=1, revealed=1))
+        self.assertEqual(board.flag(safe), [])
+        board.flag(bomb)
+        self.assertEqual(board.reveal(bomb)[0].value, -1)
+        self.assertTrue(board.is_lost())
+
+    def test_reveal_cascade(self):
+        """Test that reveals cascade through zeros and stop at numbered Cells"""
+        board = InfiniteBoard(seed=0, density=0.15, chunk_size=8)
+        zero = next(p for p in self.region if board.value(p) == 0)
+        changed = board.reveal(zero)
+        self.assertGreater(len(changed), 1)
+        for cell in changed:
+            self.assertNotEqual(cell.value, -1)
+            if cell.value == 0:
+                for neighbor in board.neighbors(cell.location):
+                    self.assertEqual(neighbor.state, "revealed")
+        self.assertFalse(board.is_lost())
+
+    def test_visualize(self):
+        """Test rendering Viewports that cross chunks"""
+        board = InfiniteBoard(seed=5, chunk_size=3)
+        for point in self.region[::7]:
+            if board.value(point) == -1:
+                board.flag(point)
+            else:
+                board.reveal(point)
+        viewport = Viewport(-7, -5, 13, 9)
+        expected = [
+            "".join(board[Point(x, y)].visualize() for x in range(-7, 6))
+            for y in range(-5, 4)
+        ]
+        self.assertEqual(list(board.symbol_rows(viewport)), expected)
+        self.assertEqual(len(board.visualize(viewport).splitlines()), 11)
+
+    def test_invalid(self):
+        """Test invalid arguments"""
+        self.assertRaises(ValueError, InfiniteBoard, seed=0, density=0.01)
+        self.assertRaises(ValueError, InfiniteBoard, seed=0, chunk_size=0)
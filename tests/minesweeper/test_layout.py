@@ -0,0 +1,64 @@
+"""Test minesweeper/layout.py"""
+from itertools import product
+import random
+from typing import Optional, Set
+import unittest
+
+from playful.core import Point
+from playful.minesweeper.array_board import ArrayBoard
+from playful.minesweeper.board import Board
+from playful.minesweeper.cell import Cell
+from playful.minesweeper.layout import bomb_mask, hidden_layout
+
+
+def create_cells(
+    width: int, height: int, n_bombs: int, random_state: Optional[int]
+) -> Set[Cell]:
+    """Create Cells with the original, Point-by-Point implementation"""
+    random.seed(random_state)
+    points = [Point(x, y) for x, y in product(range(width), range(height))]
+    bombs = set(random.sample(points, n_bombs))
+    return {
+        Cell(
+            p,
+            value=-1 if p in bombs else len(p.borders().intersection(bombs)),
+            state="hidden",
+        )
+        for p in points
+    }
+
+
+class TestLayout(unittest.TestCase):
+    """Test bomb layouts"""
+
+    sizes = [(1, 1, 0), (1, 1, 1), (3, 1, 1), (1, 4, 2), (9, 9, 10), (16, 30, 99)]
+
+    def test_bomb_mask(self):
+        """Test placing bombs in row-major order"""
+        mask = bomb_mask(3, 2, 6, random_state=0)
+        self.assertEqual(mask, bytearray([1] * 6))
+        self.assertEqual(sum(bomb_mask(10, 10, 17, random_state=3)), 17)
+
+    def test_bomb_mask_rng(self):
+        """Test placing bombs with a generator, leaving the global generator alone"""
+        random.seed(1)
+        state = random.getstate()
+        mask = bomb_mask(16, 30, 99, rng=random.Random(5))
+        self.assertEqual(random.getstate(), state)
+        self.assertEqual(mask, bomb_mask(16, 30, 99, random_state=5))
+
+    def test_hidden_layout(self):
+        """Test counting the bombs that border each Cell"""
+        # bombs at (0, 0) and (2, 1) on a 3x2 board
+        mask = bytearray([1, 0, 0, 0, 0, 1])
+        self.assertEqual(list(hidden_layout(mask, 3, 2)), [0, 3, 2, 2, 3, 0])
+
+    def test_board_create(self):
+        """Test creating the same Board as the original implementation"""
+        for (width, height, n_bombs), seed in product(self.sizes, [0, 1, 42]):
+            with self.subTest(f"testing size={width}x{height}, seed={seed}"):
+                expected = create_cells(width, height, n_bombs, seed)
+                board = Board.create(width, height, n_bombs, random_state=seed)
+                self.assertEqual(board.cells, expected)
+                fast = ArrayBoard.create(width, height, n_bombs, random_state=seed)
+                self.assertEqual(fast.to_cells(), expected)
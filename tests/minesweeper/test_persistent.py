@@ -0,0 +1,81 @@
+"""Test minesweeper/persistent.py"""
+import random
+import unittest
+
+from playful.core import Point
+from playful.minesweeper import ArrayBoard, Board, Cell
+from playful.minesweeper.persistent import CHUNK, PersistentBoard, build_trie
+from playful.minesweeper.render import Viewport
+from tests.minesweeper import CELLS
+
+
+class TestPersistentBoard(unittest.TestCase):
+    """Test PersistentBoard class"""
+
+    cells = CELLS
+
+    def test_conversions(self):
+        """Test converting to and from other Boards"""
+        board = PersistentBoard.from_cells(self.cells)
+        self.assertEqual(board.to_cells(), self.cells)
+        self.assertEqual(board.to_board(), Board(self.cells))
+        self.assertEqual(board.to_array_board().to_cells(), self.cells)
+        self.assertEqual(PersistentBoard.from_board(Board(self.cells)), board)
+        expected = repr(Board(self.cells)).replace("Board", "PersistentBoard")
+        self.assertEqual(repr(board), expected)
+        self.assertEqual(board[Point(1, 0)], Cell(Point(1, 0), 2, "revealed"))
+        self.assertRaises(IndexError, board.cell, Point(2, 0))
+
+    def test_create(self):
+        """Test that bombs are placed where Board.create places them"""
+        board = PersistentBoard.create(40, 30, 100, random_state=3)
+        expected = Board.create(40, 30, 100, random_state=3)
+        self.assertEqual(board.to_cells(), expected.cells)
+        self.assertEqual(board.visualize(), expected.visualize())
+        self.assertEqual(board.depth, 1)
+        self.assertEqual(PersistentBoard.create(100, 100, 1, 0).depth, 2)
+
+    def test_play_matches_board(self):
+        """Test that random games play the same way as on a Board"""
+        rng = random.Random(0)
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                board = Board.create(30, 50, 150, random_state=seed)
+                persistent = PersistentBoard.from_board(board)
+                for _ in range(40):
+                    point = Point(rng.randrange(30), rng.randrange(50))
+                    move = rng.choice(["reveal", "flag"])
+                    board, expected = getattr(board, move)(point)
+                    persistent, changed = getattr(persistent, move)(point)
+                    self.assertEqual(sorted(changed), sorted(expected))
+                    self.assertEqual(persistent.states(), board.states())
+                    self.assertEqual(persistent.is_lost(), board.is_lost())
+                    self.assertEqual(persistent.is_won(), board.is_won())
+                self.assertEqual(persistent.to_cells(), board.cells)
+
+    def test_branches_share_chunks(self):
+        """Test that moves leave earlier Boards unchanged and share unchanged chunks"""
+        board = PersistentBoard.create(100, 100, 0, random_state=0)
+        flagged, _ = board.flag(Point(99, 99))
+        self.assertEqual(board.state(Point(99, 99)), "hidden")
+        self.assertEqual(flagged.state(Point(99, 99)), "flagged")
+        self.assertEqual(flagged.states(), dict(flagged=1, hidden=9999))
+        shared = sum(a is b for a, b in zip(board.chunks(), flagged.chunks()))
+        self.assertEqual(shared, -(-10000 // CHUNK) - 1)
+        self.assertIs(flagged.root[0], board.root[0])
+        self.assertEqual(flagged.flag(Point(99, 99))[0], board)
+        self.assertIs(flagged.update([]), flagged)
+
+    def test_visualize_viewport(self):
+        """Test visualizing part of a PersistentBoard"""
+        array = ArrayBoard.create(70, 20, 50, random_state=1)
+        array.reveal(Point(10, 10))
+        board = PersistentBoard.from_array_board(array)
+        for viewport in (None, Viewport(60, 5, 20, 10), Viewport(3, 3, 0, 4)):
+            self.assertEqual(board.visualize(viewport), array.visualize(viewport))
+
+    def test_build_trie(self):
+        """Test building tries of different sizes"""
+        self.assertEqual(build_trie([]), ((), 1))
+        root, depth = build_trie([b"a"] * 33)
+        self.assertEqual((len(root), depth), (2, 2))
@@ -0,0 +1,84 @@
+"""Test minesweeper/probability.py"""
+from itertools import combinations
+from typing import Dict, Iterator, Tuple
+import unittest
+
+from playful.core import Point
+from playful.minesweeper.board import Board
+from playful.minesweeper.cell import Cell
+from playful.minesweeper.probability import ProbabilityEngine, frontier_components
+
+
+def brute_force(board: Board) -> Dict[Point, float]:
+    """Return bomb probabilities by checking every placement of the bombs"""
+    cells = board.locations()
+    unknown = sorted(p for p, cell in cells.items() if cell.state != "revealed")
+    numbers = [c for c in board.revealed_cells() if not c.is_bomb()]
+    counts, total = {p: 0 for p in unknown}, 0
+    for placement in combinations(unknown, board.bombs):
+        bombs = set(placement)
+        if all(len(c.location.borders() & bombs) == c.value for c in numbers):
+            total += 1
+            for point in bombs:
+                counts[point] += 1
+    return {p: count / total for p, count in counts.items()}
+
+
+def sample_boards() -> Iterator[Tuple[int, Board]]:
+    """Return small Boards with a few Cells revealed"""
+    for seed in range(6):
+        board = Board.create(width=5, height=4, n_bombs=4, random_state=seed)
+        for cell in sorted(board.safe_cells())[:: 3 + seed % 2]:
+            board = board.update([cell.reveal()])
+        yield seed, board
+
+
+class TestProbabilityEngine(unittest.TestCase):
+    """Test ProbabilityEngine class"""
+
+    def test_frontier_components(self):
+        """Test splitting the frontier into independent components"""
+        cells = {
+            Cell(Point(0, 0), value=-1, state="hidden"),
+            Cell(Point(1, 0), value=1, state="revealed"),
+            Cell(Point(2, 0), value=0, state="revealed"),
+            Cell(Point(3, 0), value=1, state="revealed"),
+            Cell(Point(4, 0), value=-1, state="hidden"),
+            Cell(Point(0, 1), value=1, state="hidden"),
+            Cell(Point(1, 1), value=1, state="revealed"),
+            Cell(Point(2, 1), value=0, state="revealed"),
+            Cell(Point(3, 1), value=1, state="revealed"),
+            Cell(Point(4, 1), value=1, state="hidden"),
+        }
+        components, interior = frontier_components(Board(cells))
+        self.assertEqual(
+            sorted(c.cells for c in components),
+            [(Point(0, 0), Point(0, 1)), (Point(4, 0), Point(4, 1))],
+        )
+        self.assertEqual(interior, set())
+
+    def test_exact(self):
+        """Test matching brute-force enumeration of every bomb placement"""
+        engine = ProbabilityEngine()
+        for seed, board in sample_boards():
+            with self.subTest(f"testing random_state={seed}"):
+                expected = brute_force(board)
+                result = engine.probabilities(board)
+                self.assertEqual(result.keys(), expected.keys())
+                for point, probability in expected.items():
+                    self.assertAlmostEqual(result[point], probability)
+                self.assertTrue(all(r.method == "exact" for r in engine.results))
+                self.assertTrue(all(r.seconds >= 0 for r in engine.results))
+
+    def test_monte_carlo(self):
+        """Test approximating probabilities by sampling, reproducibly"""
+        for seed, board in sample_boards():
+            with self.subTest(f"testing random_state={seed}"):
+                expected = brute_force(board)
+                engine = ProbabilityEngine(0, samples=4000, random_state=seed)
+                result = engine.probabilities(board)
+                for point, probability in expected.items():
+                    self.assertAlmostEqual(result[point], probability, delta=0.05)
+                self.assertTrue(all(r.method != "exact" for r in engine.results))
+                again = ProbabilityEngine(0, samples=4000, random_state=seed)
+                self.assertEqual(again.probabilities(board), result)
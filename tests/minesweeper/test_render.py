@@ -0,0 +1,76 @@
+"""Test minesweeper/render.py"""
+import io
+from typing import List, Union
+import unittest
+
+from playful.core import Point
+from playful.minesweeper import ArrayBoard, Board, Cell
+from playful.minesweeper.render import IncrementalRenderer, Viewport
+
+
+class TestRender(unittest.TestCase):
+    """Test rendering Boards"""
+
+    cells = {
+        Cell(Point(0, 0), value=-1, state="hidden"),
+        Cell(Point(1, 0), value=2, state="revealed"),
+        Cell(Point(2, 0), value=1, state="flagged"),
+        Cell(Point(0, 1), value=-1, state="revealed"),
+        Cell(Point(1, 1), value=2, state="revealed"),
+        Cell(Point(2, 1), value=0, state="revealed"),
+    }
+    expected = "#-----#\n|?|2|!|\n|B|2| |\n#-----#"
+
+    def test_visualize(self):
+        """Test visualizing Cells in x order within each row"""
+        self.assertEqual(Board(self.cells).visualize(), self.expected)
+        self.assertEqual(ArrayBoard.from_cells(self.cells).visualize(), self.expected)
+
+    def test_write(self):
+        """Test writing a visualization to a text stream"""
+        boards: List[Union[Board, ArrayBoard]] = [
+            Board(self.cells),
+            ArrayBoard.from_cells(self.cells),
+        ]
+        for board in boards:
+            stream = io.StringIO()
+            board.write(stream)
+            self.assertEqual(stream.getvalue(), self.expected + "\n")
+
+    def test_viewport(self):
+        """Test visualizing a window of the Board, clipped to its edges"""
+        expected = "#---#\n|2|!|\n|2| |\n#---#"
+        viewport = Viewport(x=1, y=0, width=5, height=5)
+        self.assertEqual(Board(self.cells).visualize(viewport), expected)
+        board = ArrayBoard.from_cells(self.cells)
+        self.assertEqual(board.visualize(viewport), expected)
+        self.assertEqual(Viewport(5, 5, 2, 2).clip(3, 2), Viewport(3, 2, 0, 0))
+
+    def test_large(self):
+        """Test matching the Board and ArrayBoard visualizations of a large Board"""
+        board = Board.create(width=30, height=20, n_bombs=80, random_state=4)
+        board, _ = board.reveal(next(iter(board.safe_cells())).location)
+        self.assertEqual(board.visualize(), ArrayBoard.from_board(board).visualize())
+
+    def test_incremental(self):
+        """Test re-rendering only the rows that contain changed Cells"""
+        board = Board.create(width=8, height=6, n_bombs=6, random_state=2)
+        viewport = Viewport(0, 2, 8, 3)
+        renderer = IncrementalRenderer(board.symbol_rows(viewport), viewport)
+        for point in (Point(7, 5), Point(0, 3), Point(4, 0)):
+            if board.locations()[point].is_bomb():
+                board, changed = board.flag(point)
+            else:
+                board, changed = board.reveal(point)
+            rows = renderer.update(changed)
+            expected = board.visualize(viewport)
+            self.assertEqual(str(renderer), expected)
+            in_view = {c.location.y for c in changed if 2 <= c.location.y < 5}
+            self.assertEqual(set(rows), in_view)
+            lines = expected.split("\n")
+            for y, line in rows.items():
+                self.assertEqual(line, lines[y - 2 + 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+"""Test minesweeper/reveal.py"""
+from typing import List
+import unittest
+
+from playful.minesweeper.reveal import flood_fill
+
+
+class TestFloodFill(unittest.TestCase):
+    """Test flood_fill function"""
+
+    # a row of Cells, identified by index: the zeros cascade until they reach a number
+    values = [1, 0, 0, 0, 2, 0, 0]
+
+    def fill(self, start: int, states: List[str]) -> List[int]:
+        """Flood fill the row of Cells from a starting index"""
+        return flood_fill(
+            start,
+            value=lambda i: self.values[i],
+            state=lambda i: states[i],
+            neighbors=lambda i: [j for j in (i - 1, i + 1) if 0 <= j < 7],
+        )
+
+    def test_cascade(self):
+        """Test cascading through zeros in breadth-first order"""
+        states = ["hidden"] * 7
+        self.assertEqual(self.fill(2, states), [2, 1, 3, 0, 4])
+        self.assertEqual(self.fill(4, states), [4])
+
+    def test_flags(self):
+        """Test stopping the cascade at flagged and revealed Cells"""
+        states = ["hidden", "hidden", "hidden", "flagged", "hidden", "hidden", "hidden"]
+        self.assertEqual(self.fill(2, states), [2, 1, 0])
+        self.assertEqual(self.fill(3, states), [])
+        states[6] = "revealed"
+        self.assertEqual(self.fill(5, states), [5, 4])
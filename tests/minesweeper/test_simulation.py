@@ -0,0 +1,60 @@
+"""Test minesweeper/simulation.py"""
+from typing import List
+import unittest
+
+from playful.minesweeper.probability import ProbabilityEngine
+from playful.minesweeper.simulation import (
+    GameResult,
+    Policy,
+    SolverPolicy,
+    game_seeds,
+    play,
+    simulate,
+    summarize,
+)
+
+
+def outcomes(results: List[GameResult]) -> List[GameResult]:
+    """Return the results without their timings, which vary between runs"""
+    return [result._replace(seconds=0.0) for result in results]
+
+
+class TestSimulation(unittest.TestCase):
+    """Test simulation functions"""
+
+    def test_play(self):
+        """Test playing a game until it's won or lost"""
+        for policy in (Policy(), SolverPolicy(), SolverPolicy(ProbabilityEngine())):
+            with self.subTest(f"testing policy={policy}"):
+                for seed in range(5):
+                    result = play(8, 8, 10, seed, policy)
+                    self.assertEqual(result.seed, seed)
+                    self.assertGreaterEqual(result.moves, 1)
+                    if result.won:
+                        self.assertEqual(result.revealed, 8 * 8 - 10)
+                    else:
+                        self.assertLess(result.revealed, 8 * 8 - 10)
+
+    def test_solver_policy(self):
+        """Test that proving Cells are safe wins more often than guessing"""
+        random_play = summarize(simulate(40, 8, 8, 8, Policy(), seed=1))
+        solver_play = summarize(simulate(40, 8, 8, 8, SolverPolicy(), seed=1))
+        self.assertEqual(solver_play.games, 40)
+        self.assertGreater(solver_play.win_rate, random_play.win_rate)
+        self.assertGreater(solver_play.mean_revealed, random_play.mean_revealed)
+
+    def test_reproducible(self):
+        """Test producing the same results with any number of processes"""
+        self.assertEqual(game_seeds(5, seed=3), game_seeds(5, seed=3))
+        self.assertNotEqual(game_seeds(5, seed=3), game_seeds(5, seed=4))
+        serial = simulate(12, 6, 6, 5, SolverPolicy(), seed=2)
+        parallel = simulate(12, 6, 6, 5, SolverPolicy(), seed=2, workers=2)
+        self.assertEqual(outcomes(serial), outcomes(parallel))
+
+    def test_summarize(self):
+        """Test summarizing an empty batch of games"""
+        self.assertEqual(summarize([]).win_rate, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
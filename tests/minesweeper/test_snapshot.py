@@ -0,0 +1,75 @@
+"""Test minesweeper/snapshot.py"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from playful.core import Point
+from playful.minesweeper.array_board import ArrayBoard
+from playful.minesweeper.board import Board
+from playful.minesweeper.snapshot import (
+    HEADER,
+    Move,
+    append_moves,
+    dumps,
+    load,
+    loads,
+    replay,
+    save,
+)
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test snapshot functions"""
+
+    def setUp(self):
+        self.board = Board.create(width=12, height=9, n_bombs=15, random_state=6)
+        safe = min(cell.location for cell in self.board.safe_cells())
+        self.moves = [Move(safe, "reveal"), Move(Point(11, 8), "flag")]
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "board.plmb")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        """Test round-tripping a Board through bytes"""
+        data = dumps(self.board)
+        self.assertEqual(len(data), HEADER.size + 12 * 9)
+        board, moves = loads(data)
+        self.assertEqual(board.to_board(), self.board)
+        self.assertEqual(repr(board), repr(ArrayBoard.from_board(self.board)))
+        self.assertEqual(moves, [])
+
+    def test_zero_copy(self):
+        """Test sharing the buffer between the snapshot and the loaded ArrayBoard"""
+        data = bytearray(dumps(self.board))
+        board, _ = loads(data)
+        board.flag(Point(0, 0))
+        self.assertEqual(loads(data).board.state(Point(0, 0)), "flagged")
+        self.assertRaises(TypeError, loads(bytes(data)).board.flag, Point(1, 0))
+
+    def test_replay(self):
+        """Test recording Moves in a file and replaying them"""
+        save(self.board, self.path, self.moves[:1])
+        append_moves(self.path, self.moves[1:])
+        with open(self.path, "ab") as file:
+            file.write(b"\x01\x02")  # a partly-written record is ignored
+
+        board, moves = load(self.path)
+        self.assertEqual(moves, self.moves)
+        changed = replay(board, moves)
+
+        expected = self.board
+        for point, action in self.moves:
+            expected, _ = getattr(expected, action)(point)
+        self.assertEqual(board.to_board(), expected)
+        self.assertEqual(board.states(), expected.states())
+        self.assertEqual(changed[-1].location, Point(11, 8))
+
+        # the file is mapped copy-on-write, so it still holds the starting Board
+        self.assertEqual(load(self.path).board.to_board(), self.board)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Test minesweeper/solver.py"""
+import unittest
+
+from playful.core import Point
+from playful.minesweeper.board import Board
+from playful.minesweeper.cell import Cell
+from playful.minesweeper.solver import Constraint, Solver
+
+
+class TestSolver(unittest.TestCase):
+    """Test Solver class"""
+
+    # a 1-2-1 pattern: the middle Cell of the top row is safe, its sides are bombs.
+    cells = {
+        Cell(Point(0, 0), value=-1, state="hidden"),
+        Cell(Point(1, 0), value=2, state="hidden"),
+        Cell(Point(2, 0), value=-1, state="flagged"),
+        Cell(Point(0, 1), value=1, state="revealed"),
+        Cell(Point(1, 1), value=2, state="revealed"),
+        Cell(Point(2, 1), value=1, state="revealed"),
+    }
+
+    def test_constraint(self):
+        """Test building the Constraint of a revealed number"""
+        solver = Solver(Board(self.cells))
+        expected = Constraint(frozenset({Point(0, 0), Point(1, 0)}), bombs=1)
+        self.assertEqual(solver.constraint(Point(0, 1)), expected)
+        self.assertIsNone(solver.constraint(Point(0, 0)))
+
+    def test_subset_rule(self):
+        """Test deducing the 1-2-1 pattern with set-difference rules"""
+        safe, bombs = Solver(Board(self.cells)).solve()
+        self.assertEqual(safe, {Point(1, 0)})
+        self.assertEqual(bombs, {Point(0, 0), Point(2, 0)})
+
+    def test_single_cell_rule(self):
+        """Test deducing Cells from numbers with no bombs, or only bombs, left"""
+        cells = {
+            Cell(Point(0, 0), value=1, state="revealed"),
+            Cell(Point(1, 0), value=-1, state="hidden"),
+            Cell(Point(2, 0), value=1, state="hidden"),
+            Cell(Point(0, 1), value=1, state="revealed"),
+            Cell(Point(1, 1), value=1, state="revealed"),
+            Cell(Point(2, 1), value=1, state="revealed"),
+        }
+        safe, bombs = Solver(Board(cells)).solve()
+        self.assertEqual((safe, bombs), ({Point(2, 0)}, {Point(1, 0)}))
+
+    def test_update(self):
+        """Test forgetting safe Cells once they have been revealed"""
+        board = Board(self.cells)
+        solver = Solver(board)
+        safe, _ = solver.solve()
+        board, changed = board.reveal(safe.pop())
+        solver.update(changed)
+        self.assertEqual(solver.solve(), (set(), {Point(0, 0), Point(2, 0)}))
+
+    def test_play(self):
+        """Test that incremental solving is sound and matches solving from scratch"""
+        for seed in range(5):
+            with self.subTest(f"testing random_state={seed}"):
+                board = Board.create(16, 16, n_bombs=30, random_state=seed)
+                start = min(c.location for c in board.cells if c.value == 0)
+                board, changed = board.reveal(start)
+                solver = Solver(board)
+                safe, bombs = solver.solve()
+                while safe:
+                    for point in safe:
+                        board, changed = board.reveal(point)
+                        solver.update(changed)
+                    safe, bombs = solver.solve()
+                cells = board.locations()
+                self.assertFalse(any(c.is_bomb() for c in board.revealed_cells()))
+                self.assertTrue(all(cells[p].is_bomb() for p in bombs))
+                self.assertEqual(Solver(board).solve(), (safe, bombs))
@@ -0,0 +1,245 @@
+"""Test server.py"""
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+import json
+import threading
+from typing import Any, Dict, List
+import unittest
+from unittest import mock
+
+from playful.lingo import feedback_pattern
+from playful.minesweeper import ArrayBoard
+from playful.server import (
+    GameServer,
+    LatencyStats,
+    LingoGame,
+    MinesweeperGame,
+    percentile,
+)
+
+
+class TestGameServer(unittest.TestCase):
+    """Test GameServer class"""
+
+    words = ["crate", "react", "trace", "teach", "beach", "leach"]
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = GameServer()
+
+    def tearDown(self):
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def request(self, **request: Any) -> Dict[str, Any]:
+        """Send one request to the server and return its response."""
+        return self.loop.run_until_complete(self.server.handle(request))
+
+    def test_minesweeper(self):
+        """Test playing a minesweeper game until it's won"""
+        new = self.request(
+            id=7, op="minesweeper.new", width=5, height=4, bombs=3, seed=42
+        )
+        self.assertEqual(new, {"id": 7, "session": "1", "ok": True})
+        board = ArrayBoard.create(5, 4, 3, 42)
+        safe = sorted(cell.location for cell in board.safe_cells())
+        response = {}
+        for point in safe:
+            if board.state(point) == "hidden":
+                board.reveal(point)
+                response = self.request(
+                    op="minesweeper.reveal", session="1", x=point.x, y=point.y
+                )
+                self.assertTrue(response["ok"])
+                self.assertFalse(response["lost"])
+        self.assertTrue(response["won"])
+        shown = self.request(op="minesweeper.show", session="1")
+        self.assertEqual(shown["board"], board.visualize())
+        over = self.request(op="minesweeper.reveal", session="1", x=0, y=0)
+        self.assertEqual(over, {"ok": False, "error": "this game is over"})
+
+    def test_minesweeper_flag_and_lose(self):
+        """Test that flags don't show values, and revealing a bomb loses the game"""
+        self.request(op="minesweeper.new", width=5, height=4, bombs=3, seed=42)
+        bomb = next(iter(ArrayBoard.create(5, 4, 3, 42).bomb_cells())).location
+        flagged = self.request(op="minesweeper.flag", session="1", x=bomb.x, y=bomb.y)
+        self.assertEqual(flagged["changed"], [[bomb.x, bomb.y, None, "flagged"]])
+        self.request(op="minesweeper.flag", session="1", x=bomb.x, y=bomb.y)
+        lost = self.request(op="minesweeper.reveal", session="1", x=bomb.x, y=bomb.y)
+        self.assertEqual(lost["changed"], [[bomb.x, bomb.y, -1, "revealed"]])
+        self.assertTrue(lost["lost"])
+        self.assertFalse(lost["won"])
+
+    def test_lingo(self):
+        """Test playing a Lingo game with a server-side secret"""
+        new = self.request(op="lingo.new", words=self.words, secret="leach")
+        session = new["session"]
+        suggested = self.request(op="lingo.suggest", session=session)["guess"]
+        self.assertIn(suggested, self.words)
+        guess = self.request(op="lingo.guess", session=session, guess="beach")
+        self.assertEqual(guess["pattern"], feedback_pattern("leach", "beach"))
+        self.assertFalse(guess["solved"])
+        candidates = self.request(op="lingo.candidates", session=session)
+        self.assertEqual(len(candidates["candidates"]), guess["candidates"])
+        solved = self.request(op="lingo.guess", session=session, guess="leach")
+        self.assertTrue(solved["solved"])
+
+    def test_lingo_pattern(self):
+        """Test playing a Lingo game with feedback from the client"""
+        session = self.request(op="lingo.new", words=self.words)["session"]
+        missing = self.request(op="lingo.guess", session=session, guess="crate")
+        self.assertFalse(missing["ok"])
+        pattern = feedback_pattern("react", "crate")
+        guess = self.request(
+            op="lingo.guess", session=session, guess="crate", pattern=pattern
+        )
+        self.assertEqual(guess["candidates"], 1)
+
+    def test_process_pool(self):
+        """Test that moves and guesses change the games when slow work runs elsewhere"""
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            self.server = GameServer(executor)
+            self.request(op="minesweeper.new", width=5, height=4, bombs=3, seed=42)
+            board = ArrayBoard.create(5, 4, 3, 42)
+            point = min(cell.location for cell in board.safe_cells())
+            board.reveal(point)
+            self.request(op="minesweeper.reveal", session="1", x=point.x, y=point.y)
+            shown = self.request(op="minesweeper.show", session="1")
+            self.assertEqual(shown["board"], board.visualize())
+            session = self.request(op="lingo.new", words=self.words)["session"]
+            pattern = feedback_pattern("react", "crate")
+            self.request(
+                op="lingo.guess", session=session, guess="crate", pattern=pattern
+            )
+            suggested = self.request(op="lingo.suggest", session=session)
+            self.assertEqual(suggested["guess"], "react")
+
+    def test_errors(self):
+        """Test that bad requests are answered with an error"""
+        self.assertFalse(self.request(op="nope")["ok"])
+        self.assertFalse(self.request(op="minesweeper.show", session="9")["ok"])
+        self.assertFalse(self.request(op="minesweeper.new", width=2)["ok"])
+        session = self.request(op="lingo.new", words=self.words)["session"]
+        self.assertFalse(self.request(op="minesweeper.show", session=session)["ok"])
+        self.assertTrue(self.request(op="close", session=session)["ok"])
+        self.assertFalse(self.request(op="close", session=session)["ok"])
+        line = self.loop.run_until_complete(self.server.handle_line(b"[1, 2]\n"))
+        self.assertFalse(json.loads(line.decode("utf-8"))["ok"])
+
+    def test_limits(self):
+        """Test refusing games that are too large, and surviving unexpected errors"""
+        self.server = GameServer(max_cells=100, max_words=5)
+        big = self.request(op="minesweeper.new", width=20, height=10, bombs=1)
+        self.assertEqual(
+            big, {"ok": False, "error": "a board can have at most 100 cells"}
+        )
+        empty = self.request(op="minesweeper.new", width=0, height=10, bombs=0)
+        self.assertFalse(empty["ok"])
+        self.assertFalse(self.request(op="lingo.new", words=self.words)["ok"])
+        self.assertTrue(self.request(op="lingo.new", words=self.words[:5])["ok"])
+        # an executor that runs out of memory whenever it's given any work
+        broken = mock.Mock(spec=Executor)
+        broken.submit.side_effect = MemoryError
+        self.server = GameServer(broken)
+        failed = self.request(op="minesweeper.new", width=5, height=4, bombs=3)
+        self.assertEqual(failed, {"ok": False, "error": "internal error: MemoryError"})
+
+    def test_stats(self):
+        """Test that latencies are recorded for each operation"""
+        for _ in range(3):
+            self.request(op="lingo.new", words=self.words)
+        stats = self.request(op="stats")
+        self.assertEqual(stats["games"], 3)
+        self.assertEqual(stats["latency"]["lingo.new"]["count"], 3)
+        self.assertEqual(
+            set(stats["latency"]["lingo.new"]), {"count", "p50", "p90", "p99", "p100"}
+        )
+
+    def converse(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send requests over a TCP connection and return their responses."""
+
+        async def client(port: int) -> List[Dict[str, Any]]:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            for request in requests:
+                writer.write(json.dumps(request).encode("utf-8") + b"\n")
+            responses = [json.loads(await reader.readline()) for _ in requests]
+            writer.close()
+            return responses
+
+        listener = self.loop.run_until_complete(self.server.listen("127.0.0.1", 0))
+        assert listener.sockets is not None
+        port = listener.sockets[0].getsockname()[1]
+        responses = self.loop.run_until_complete(client(port))
+        listener.close()
+        self.loop.run_until_complete(listener.wait_closed())
+        return responses
+
+    def test_tcp(self):
+        """Test a round trip over a TCP connection"""
+        responses = self.converse(
+            [
+                {"id": 1, "op": "lingo.new", "words": self.words},
+                {"id": 2, "op": "lingo.candidates", "session": "1"},
+            ]
+        )
+        self.assertEqual([r["id"] for r in responses], [1, 2])
+        self.assertEqual(responses[1]["candidates"], sorted(self.words))
+
+    def test_long_lines(self):
+        """Test answering a line that's too long with an error, then carrying on"""
+        self.server = GameServer(max_line=100)
+        responses = self.converse(
+            [
+                {"id": 1, "op": "lingo.new", "words": self.words * 10},
+                {"id": 2, "op": "lingo.new", "words": self.words},
+            ]
+        )
+        error = "invalid request: a line can be at most 100 bytes"
+        self.assertEqual(responses[0], {"ok": False, "error": error})
+        self.assertEqual(responses[1], {"id": 2, "ok": True, "session": "1"})
+
+    def test_truncated(self):
+        """Test reporting at most max_changes Cells from a cascading reveal"""
+        self.server = GameServer(max_changes=5)
+        self.request(op="minesweeper.new", width=10, height=10, bombs=0)
+        revealed = self.request(op="minesweeper.reveal", session="1", x=0, y=0)
+        self.assertEqual(len(revealed["changed"]), 5)
+        self.assertTrue(revealed["truncated"])
+        self.assertTrue(revealed["won"])
+        flagged = self.request(op="minesweeper.new", width=2, height=1, bombs=1)
+        session = flagged["session"]
+        flagged = self.request(op="minesweeper.flag", session=session, x=0, y=0)
+        self.assertFalse(flagged["truncated"])
+
+    def test_moves_in_thread(self):
+        """Test that moves and guesses run off the event loop's thread"""
+        self.request(op="minesweeper.new", width=5, height=4, bombs=3, seed=42)
+        session = self.request(op="lingo.new", words=self.words)["session"]
+        where = mock.Mock(side_effect=lambda *_: {"thread": threading.get_ident()})
+        with mock.patch.object(MinesweeperGame, "move", where):
+            moved = self.request(op="minesweeper.reveal", session="1", x=0, y=0)
+        with mock.patch.object(LingoGame, "guess", where):
+            guessed = self.request(op="lingo.guess", session=session, guess="crate")
+        self.assertNotEqual(moved["thread"], threading.get_ident())
+        self.assertNotEqual(guessed["thread"], threading.get_ident())
+
+
+class TestLatencyStats(unittest.TestCase):
+    """Test LatencyStats class"""
+
+    def test_summary(self):
+        """Test nearest-rank percentiles, in milliseconds"""
+        stats = LatencyStats(samples=100)
+        for millis in range(1, 201):
+            stats.record("op", millis / 1000.0)
+        summary = stats.summary()["op"]
+        self.assertEqual(summary["count"], 200)
+        self.assertAlmostEqual(summary["p50"], 150.0)
+        self.assertAlmostEqual(summary["p100"], 200.0)
+
+    def test_percentile(self):
+        """Test the percentile function"""
+        self.assertEqual(percentile([], 50), 0.0)
+        self.assertEqual(percentile([1.0, 2.0, 3.0, 4.0], 50), 2.0)
+        self.assertEqual(percentile([1.0, 2.0, 3.0, 4.0], 99), 4.0)